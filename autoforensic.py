@@ -19,6 +19,7 @@ import hashlib
 import shutil
 import uuid
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import des modules de collecte
 from modules.common.system import get_system_info, check_privileges
@@ -29,23 +30,28 @@ from utils.reporting import ReportGenerator
 
 __version__ = "0.1.0"
 
-
-def banner():
-    """
-Affiche la bannière du programme
-    """
-    print("""
+BANNER = """
     ╔══════════════════════════════════════════╗
     ║               AUTOFORENSIC                    ║
     ║        Collecteur de Preuves Forensiques      ║
     ║                  v{}                        ║
     ╚══════════════════════════════════════════╝
-    """.format(__version__))
+    """.format(__version__)
+
+
+def banner():
+    """
+Affiche la bannière du programme
+    """
+    print(BANNER)
 
 
-def parse_arguments():
+def parse_arguments(run_timestamp):
     """
     Parse les arguments de ligne de commande
+    
+    Args:
+        run_timestamp (str): Horodatage de l'exécution, utilisé pour le dossier de sortie par défaut
     """
     parser = argparse.ArgumentParser(description="Outil automatisé de collecte de preuves forensiques")
     
@@ -61,7 +67,7 @@ def parse_arguments():
     collection_group.add_argument('--browser', action='store_true', help='Collecter les artefacts des navigateurs web')
     
     # Options générales
-    parser.add_argument('--output', type=str, default='evidence_' + datetime.datetime.now().strftime('%Y%m%d_%H%M%S'),
+    parser.add_argument('--output', type=str, default='evidence_' + run_timestamp,
                        help='Dossier de sortie pour les preuves collectées')
     parser.add_argument('--compress', action='store_true', help='Compresser les résultats avec chiffrement')
     parser.add_argument('--verify', action='store_true', help='Vérifier l\'intégrité des preuves collectées')
@@ -73,9 +79,13 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def setup_environment(args):
+def setup_environment(args, run_timestamp):
     """
     Configure l'environnement d'exécution
+    
+    Args:
+        args (Namespace): Arguments de ligne de commande
+        run_timestamp (str): Horodatage de l'exécution, utilisé pour le nom du fichier de log
     """
     # Configurer la journalisation
     log_levels = [logging.WARNING, logging.INFO, logging.DEBUG]
@@ -83,15 +93,21 @@ def setup_environment(args):
     
     log_dir = os.path.join(args.output, 'logs')
     os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f'autoforensic_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+    log_file = os.path.join(log_dir, f'autoforensic_{run_timestamp}.log')
     
     setup_logging(log_level, log_file)
     logging.info(f"AutoForensic Collector v{__version__} démarré")
     
     # Créer la structure de dossiers pour les preuves
+    # (un seul parcours du dossier de sortie, déjà créé avec le dossier de logs)
     evidence_dirs = ['memory', 'disk', 'processes', 'network', 'logs', 'artifacts', 'browser', 'reports']
+    output_root = Path(args.output)
+    with os.scandir(output_root) as entries:
+        existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+    
     for dir_name in evidence_dirs:
-        os.makedirs(os.path.join(args.output, dir_name), exist_ok=True)
+        if dir_name not in existing_dirs:
+            (output_root / dir_name).mkdir(exist_ok=True)
     
     # Initialißer la chaîne de preuve
     case_id = str(uuid.uuid4())
@@ -142,6 +158,9 @@ def main():
     """
     Fonction principale du programme
     """
+    # Horodatage unique de l'exécution (dossier de sortie et fichier de log)
+    run_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     # Afficher la bannière
     banner()
     
@@ -152,7 +171,7 @@ def main():
         sys.exit(1)
     
     # Parser les arguments
-    args = parse_arguments()
+    args = parse_arguments(run_timestamp)
     
     # Si aucune option de collecte n'est spécifiée, afficher l'aide
     if not any([args.all, args.memory, args.disk, args.processes, args.network, 
@@ -163,7 +182,7 @@ def main():
     
     try:
         # Configurer l'environnement
-        chain_of_custody = setup_environment(args)
+        chain_of_custody = setup_environment(args, run_timestamp)
         logging.info(f"Environnement configuré. ID du cas : {chain_of_custody.case_id}")
         
         # Obtenir les informations système
@@ -177,15 +196,21 @@ def main():
         # Gestionnaire de preuves
         evidence_manager = EvidenceManager(args.output, chain_of_custody)
         
-        # Exécuter chaque module de collecte
-        for module in modules:
-            print(f"[*] Exécution du module : {module.name}")
-            try:
-                module.collect(evidence_manager)
-                print(f"[+] Module {module.name} exécuté avec succès")
-            except Exception as e:
-                logging.error(f"Erreur lors de l'exécution du module {module.name}: {str(e)}")
-                print(f"[!] Erreur dans le module {module.name}: {str(e)}")
+        # Exécuter les modules de collecte en parallèle (collectes essentiellement I/O)
+        with ThreadPoolExecutor(max_workers=max(1, len(modules))) as executor:
+            futures = {}
+            for module in modules:
+                print(f"[*] Exécution du module : {module.name}")
+                futures[executor.submit(module.collect, evidence_manager)] = module
+            
+            for future in as_completed(futures):
+                module = futures[future]
+                try:
+                    future.result()
+                    print(f"[+] Module {module.name} exécuté avec succès")
+                except Exception as e:
+                    logging.error(f"Erreur lors de l'exécution du module {module.name}: {str(e)}")
+                    print(f"[!] Erreur dans le module {module.name}: {str(e)}")
         
         # Vérifier l'intégrité si demandé
         if args.verify:
@@ -199,6 +224,9 @@ def main():
                     if not is_valid:
                         print(f"    - Preuve {evidence_id} : ÉCHEC DE VÉRIFICATION")
         
+        # Appliquer les événements de chaîne de preuve en attente et synchroniser l'index
+        evidence_manager.flush()
+        
         # Compresser les résultats si demandé
         if args.compress:
             print("[*] Compression des preuves collectées...")
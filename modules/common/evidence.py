@@ -10,13 +10,48 @@ lors d'une investigation forensique.
 
 import os
 import json
+import atexit
 import logging
 import uuid
 import datetime
 import shutil
+import threading
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-from utils.hashing import calculate_file_hash, verify_file_hash
+from utils.hashing import (
+    DEFAULT_INTEGRITY_ALGORITHM, calculate_file_hash, copy_file_with_hash, get_process_pool_context,
+    verify_file_hash
+)
+from utils import serialization
+from utils.chain_of_custody import CUSTODY_HASH_ALGORITHMS
+
+
+# Intervalle (en secondes) entre deux écritures groupées de la chaîne de preuve
+CUSTODY_FLUSH_INTERVAL = 0.5
+
+# Champs sérialisés d'une preuve, dans l'ordre de l'index des preuves
+_EVIDENCE_FIELDS = (
+    "evidence_id", "type", "source", "description",
+    "file_path", "hash", "timestamp", "metadata"
+)
+
+
+def _hash_one(file_path, algorithm):
+    """
+    Calcule le hash d'un fichier de preuve (exécuté dans un processus de travail)
+    
+    La comparaison et sa journalisation ont lieu dans le processus principal :
+    les processus de travail n'héritent pas de la configuration de journalisation.
+    
+    Args:
+        file_path (str): Chemin vers le fichier de preuve
+        algorithm (str): Algorithme de hachage à utiliser
+        
+    Returns:
+        str: Hash calculé, ou None en cas d'erreur
+    """
+    return calculate_file_hash(file_path, [algorithm]).get(algorithm)
 
 
 class Evidence:
@@ -24,6 +59,9 @@ class Evidence:
     Classe représentant une preuve forensique
     """
     
+    # Pas de __dict__ par instance : une collecte peut produire des milliers de preuves
+    __slots__ = _EVIDENCE_FIELDS + ("_dict_cache",)
+    
     def __init__(self, evidence_id=None, evidence_type=None, source=None, description=None):
         """
         Initialise un objet preuve
@@ -43,6 +81,18 @@ class Evidence:
         self.timestamp = datetime.datetime.now().isoformat()
         self.metadata = {}
     
+    def __setattr__(self, name, value):
+        """
+        Affecte un attribut et invalide le dictionnaire mis en cache par to_dict
+        
+        Args:
+            name (str): Nom de l'attribut
+            value: Nouvelle valeur
+        """
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+    
     def set_file_path(self, file_path):
         """
         Définit le chemin du fichier de preuve
@@ -73,12 +123,31 @@ class Evidence:
             logging.error(f"Erreur lors du calcul du hash pour {self.file_path}: {str(e)}")
             return {}
     
-    def verify_integrity(self, algorithm='sha256'):
+    def integrity_algorithm(self, algorithm=None):
+        """
+        Détermine l'algorithme à utiliser pour vérifier l'intégrité de la preuve
+        
+        Args:
+            algorithm (str, optional): Algorithme demandé. Si None, BLAKE3 lorsqu'il est
+                                       disponible, avec repli sur SHA-256 pour les preuves
+                                       hachées sans BLAKE3
+            
+        Returns:
+            str: Nom de l'algorithme
+        """
+        if algorithm is not None:
+            return algorithm
+        
+        if DEFAULT_INTEGRITY_ALGORITHM in self.hash:
+            return DEFAULT_INTEGRITY_ALGORITHM
+        return 'sha256'
+    
+    def verify_integrity(self, algorithm=None):
         """
         Vérifie l'intégrité de la preuve en comparant le hash actuel avec le hash stocké
         
         Args:
-            algorithm (str, optional): Algorithme de hachage à utiliser
+            algorithm (str, optional): Algorithme de hachage à utiliser (voir integrity_algorithm)
             
         Returns:
             bool: True si la preuve est intègre, False sinon
@@ -87,6 +156,7 @@ class Evidence:
             logging.error(f"Impossible de vérifier l'intégrité: fichier de preuve non défini ou inexistant")
             return False
         
+        algorithm = self.integrity_algorithm(algorithm)
         if algorithm not in self.hash:
             logging.error(f"Algorithme {algorithm} non disponible dans les hashes stockés")
             return False
@@ -98,19 +168,17 @@ class Evidence:
         """
         Convertit l'objet preuve en dictionnaire
         
+        Le dictionnaire est mis en cache jusqu'à la prochaine affectation d'un champ ;
+        chaque appel en renvoie une copie (les dictionnaires hash et metadata restent
+        ceux de la preuve, de sorte que leurs modifications sont toujours reflétées).
+        
         Returns:
             dict: Représentation en dictionnaire de l'objet preuve
         """
-        return {
-            "evidence_id": self.evidence_id,
-            "type": self.type,
-            "source": self.source,
-            "description": self.description,
-            "file_path": self.file_path,
-            "hash": self.hash,
-            "timestamp": self.timestamp,
-            "metadata": self.metadata
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {field: getattr(self, field) for field in _EVIDENCE_FIELDS}
+        
+        return dict(self._dict_cache)
     
     @classmethod
     def from_dict(cls, data):
@@ -153,8 +221,26 @@ class EvidenceManager:
         """
         self.evidence_dir = Path(evidence_dir)
         self.chain_of_custody = chain_of_custody
-        self.evidence_index_file = self.evidence_dir / "evidence_index.json"
+        self.evidence_index_file = self.evidence_dir / "evidence_index.jsonl"
         self.evidence_items = {}
+        self._evidence_by_type = {}
+        self._index_line_count = 0
+        
+        # Les modules de collecte peuvent ajouter des preuves depuis plusieurs threads
+        self._lock = threading.Lock()
+        
+        # Événements de chaîne de preuve en attente, appliqués par lots
+        self._coc_queue = []
+        self._coc_queue_lock = threading.Lock()
+        self._coc_flush_lock = threading.Lock()
+        self._coc_stop = threading.Event()
+        
+        if self.chain_of_custody:
+            self._coc_thread = threading.Thread(
+                target=self._custody_flush_loop, name="custody-flush", daemon=True
+            )
+            self._coc_thread.start()
+            atexit.register(self.close)
         
         # Créer le répertoire de preuves s'il n'existe pas
         self.evidence_dir.mkdir(parents=True, exist_ok=True)
@@ -199,42 +285,58 @@ class EvidenceManager:
                 dest_file = type_dir / f"{evidence.evidence_id}{file_path.suffix}"
                 
                 try:
-                    # Copier le fichier
-                    shutil.copy2(file_path, dest_file)
+                    # Copier le fichier et calculer son hash en une seule lecture
+                    evidence.hash = copy_file_with_hash(file_path, dest_file)
+                    shutil.copystat(file_path, dest_file)
                     evidence.set_file_path(str(dest_file))
                     
-                    # Calculer le hash
-                    evidence.calculate_hash()
-                    
                     logging.info(f"Fichier de preuve copié: {file_path} -> {dest_file}")
+                    
+                    # Empreinte relevée par le collecteur à la source : la copie doit lui correspondre
+                    source_hash = evidence.metadata.get("sha256")
+                    if source_hash and "sha256" in evidence.hash:
+                        evidence.metadata["sha256_verified"] = source_hash == evidence.hash["sha256"]
+                        if not evidence.metadata["sha256_verified"]:
+                            logging.error(
+                                f"Le hash SHA-256 de la copie {dest_file} ne correspond pas à celui de la source. "
+                                f"Attendu: {source_hash}, Calculé: {evidence.hash['sha256']}"
+                            )
                 except Exception as e:
                     logging.error(f"Erreur lors de la copie du fichier de preuve: {str(e)}")
             else:
                 logging.warning(f"Fichier de preuve non trouvé: {file_path}")
         
-        # Ajouter à la chaîne de preuve si disponible
-        if self.chain_of_custody:
-            self.chain_of_custody.add_evidence(
-                evidence.evidence_id,
-                evidence_type,
-                source,
-                description,
-                evidence.metadata
-            )
-            
-            if evidence.file_path and evidence.hash:
-                # Mettre à jour la chaîne de preuve avec le hash
-                self.chain_of_custody.update_evidence(
+        with self._lock:
+            # Ajouter à la chaîne de preuve si disponible
+            if self.chain_of_custody:
+                self._queue_custody_event(
+                    "add",
                     evidence.evidence_id,
-                    "stored",
-                    evidence.hash.get("sha256"),
-                    evidence.file_path,
-                    {"hash_algorithms": list(evidence.hash.keys())}
+                    evidence_type,
+                    source,
+                    description,
+                    evidence.metadata
                 )
-        
-        # Ajouter à notre index local
-        self.evidence_items[evidence.evidence_id] = evidence
-        self._save_evidence_index()
+                
+                if evidence.file_path and evidence.hash:
+                    # Mettre à jour la chaîne de preuve avec le hash
+                    self._queue_custody_event(
+                        "update",
+                        evidence.evidence_id,
+                        "hash_mismatch" if evidence.metadata.get("sha256_verified") is False else "stored",
+                        {
+                            algorithm: evidence.hash[algorithm]
+                            for algorithm in CUSTODY_HASH_ALGORITHMS
+                            if algorithm in evidence.hash
+                        },
+                        evidence.file_path,
+                        {"hash_algorithms": list(evidence.hash.keys())}
+                    )
+            
+            # Ajouter à notre index local
+            self.evidence_items[evidence.evidence_id] = evidence
+            self._evidence_by_type.setdefault(evidence_type, []).append(evidence)
+            self._append_to_evidence_index(evidence)
         
         logging.info(f"Preuve ajoutée: {evidence.evidence_id} ({evidence_type})")
         return evidence.evidence_id
@@ -342,18 +444,25 @@ class EvidenceManager:
         Returns:
             list: Liste de dictionnaires représentant les preuves du type spécifié
         """
-        return [
-            evidence.to_dict() for evidence in self.evidence_items.values()
-            if evidence.type == evidence_type
-        ]
+        return [evidence.to_dict() for evidence in self._evidence_by_type.get(evidence_type, [])]
     
-    def verify_evidence(self, evidence_id, algorithm='sha256'):
+    def get_module_counts(self):
+        """
+        Compte les preuves par type, à partir de l'index maintenu à l'insertion
+        
+        Returns:
+            dict: Nombre de preuves par type, dans l'ordre d'apparition des types
+        """
+        with self._lock:
+            return {evidence_type: len(items) for evidence_type, items in self._evidence_by_type.items()}
+    
+    def verify_evidence(self, evidence_id, algorithm=None):
         """
         Vérifie l'intégrité d'une preuve
         
         Args:
             evidence_id (str): Identifiant de la preuve
-            algorithm (str, optional): Algorithme de hachage à utiliser
+            algorithm (str, optional): Algorithme de hachage à utiliser (BLAKE3 si disponible, sinon SHA-256)
             
         Returns:
             bool: True si la preuve est intègre, False sinon
@@ -368,7 +477,8 @@ class EvidenceManager:
         # Mettre à jour la chaîne de preuve si disponible
         if self.chain_of_custody:
             status = "verified_success" if result else "verified_failure"
-            self.chain_of_custody.update_evidence(
+            self._queue_custody_event(
+                "update",
                 evidence_id,
                 status,
                 metadata={"verification_time": datetime.datetime.now().isoformat()}
@@ -376,57 +486,261 @@ class EvidenceManager:
         
         return result
     
-    def verify_all(self, algorithm='sha256'):
+    def verify_all(self, algorithm=None):
         """
         Vérifie l'intégrité de toutes les preuves
         
         Args:
-            algorithm (str, optional): Algorithme de hachage à utiliser
+            algorithm (str, optional): Algorithme de hachage à utiliser (BLAKE3 si disponible, sinon SHA-256)
             
         Returns:
             dict: Dictionnaire avec les identifiants de preuve comme clés et les résultats de vérification comme valeurs
         """
-        results = {}
-        for evidence_id in self.evidence_items:
-            results[evidence_id] = self.verify_evidence(evidence_id, algorithm)
+        # S'assurer que la chaîne de preuve connaît toutes les preuves
+        self._flush_custody_queue()
+        
+        results = dict.fromkeys(self.evidence_items, False)
+        tasks = []
+        
+        for evidence_id, evidence in self.evidence_items.items():
+            evidence_algorithm = evidence.integrity_algorithm(algorithm)
+            
+            try:
+                # Le numéro d'inode sert au tri ; un fichier absent ou supprimé entre-temps échoue ici
+                inode = os.stat(evidence.file_path).st_ino if evidence.file_path else None
+            except OSError:
+                inode = None
+            
+            if inode is None:
+                logging.error(f"Impossible de vérifier l'intégrité: fichier de preuve non défini ou inexistant")
+                results[evidence_id] = False
+            elif evidence_algorithm not in evidence.hash:
+                logging.error(f"Algorithme {evidence_algorithm} non disponible dans les hashes stockés")
+                results[evidence_id] = False
+            else:
+                tasks.append((
+                    inode, evidence_id, evidence.file_path, evidence.hash[evidence_algorithm], evidence_algorithm
+                ))
+        
+        if tasks:
+            # Trier par numéro d'inode pour approcher l'ordre physique sur disque
+            tasks.sort(key=lambda task: task[0])
+            _, evidence_ids, paths, expected_hashes, algorithms = zip(*tasks)
+            
+            # Répartir le hachage des fichiers sur tous les cœurs disponibles
+            with ProcessPoolExecutor(
+                max_workers=min(len(tasks), os.cpu_count() or 1), mp_context=get_process_pool_context()
+            ) as executor:
+                digests = executor.map(_hash_one, paths, algorithms, chunksize=4)
+                for evidence_id, path, expected_hash, evidence_algorithm, digest in zip(
+                    evidence_ids, paths, expected_hashes, algorithms, digests
+                ):
+                    if digest is None:
+                        logging.error(f"Erreur lors du calcul du hash pour {path}")
+                        results[evidence_id] = False
+                    else:
+                        results[evidence_id] = verify_file_hash(
+                            path, expected_hash, evidence_algorithm, calculated_hash=digest
+                        )
+        
+        # Mettre à jour la chaîne de preuve une fois tous les résultats obtenus
+        if self.chain_of_custody:
+            verification_time = datetime.datetime.now().isoformat()
+            for evidence_id, is_valid in results.items():
+                status = "verified_success" if is_valid else "verified_failure"
+                self._queue_custody_event(
+                    "update",
+                    evidence_id,
+                    status,
+                    metadata={"verification_time": verification_time}
+                )
         
         return results
     
+    def flush(self):
+        """
+        Applique les événements de chaîne de preuve en attente et rend l'index durable
+        
+        L'index des preuves n'est synchronisé sur disque (fsync) qu'ici,
+        une fois par collecte, et non à chaque ajout de preuve.
+        """
+        self._flush_custody_queue()
+        
+        try:
+            if self.evidence_index_file.exists():
+                with open(self.evidence_index_file, 'ab') as f:
+                    os.fsync(f.fileno())
+        except OSError as e:
+            logging.error(f"Erreur lors de la synchronisation de l'index des preuves: {str(e)}")
+    
+    def close(self):
+        """
+        Arrête l'écriture périodique de la chaîne de preuve et applique les événements restants
+        """
+        self._coc_stop.set()
+        self.flush()
+    
+    def compact(self):
+        """
+        Réécrit l'index des preuves en ne conservant que la dernière entrée de chaque preuve
+        
+        Le compactage n'a lieu que si le journal contient plus de deux fois
+        plus de lignes que de preuves.
+        
+        Returns:
+            bool: True si l'index a été réécrit, False sinon
+        """
+        if self._index_line_count <= 2 * len(self.evidence_items):
+            return False
+        
+        return self._save_evidence_index()
+    
+    def _queue_custody_event(self, action, *args, **kwargs):
+        """
+        Met en attente un événement destiné à la chaîne de preuve
+        
+        Args:
+            action (str): "add" ou "update" (voir ChainOfCustody.add_events_batch)
+            *args: Arguments positionnels de l'événement
+            **kwargs: Arguments nommés de l'événement
+        """
+        with self._coc_queue_lock:
+            self._coc_queue.append((action, args, kwargs))
+    
+    def _flush_custody_queue(self):
+        """
+        Applique sur la chaîne de preuve les événements en attente
+        """
+        if not self.chain_of_custody:
+            return
+        
+        # Un seul lot appliqué à la fois pour conserver l'ordre des événements
+        with self._coc_flush_lock:
+            with self._coc_queue_lock:
+                events, self._coc_queue = self._coc_queue, []
+            
+            if not events:
+                return
+            
+            try:
+                self.chain_of_custody.add_events_batch(events)
+            except Exception as e:
+                logging.error(f"Erreur lors de la mise à jour de la chaîne de preuve: {str(e)}")
+    
+    def _custody_flush_loop(self):
+        """
+        Boucle du thread d'arrière-plan appliquant périodiquement les événements en attente
+        """
+        while not self._coc_stop.wait(CUSTODY_FLUSH_INTERVAL):
+            self._flush_custody_queue()
+    
     def _load_evidence_index(self):
         """
-        Charge l'index des preuves depuis le fichier JSON
+        Charge l'index des preuves depuis le journal JSON Lines
+        
+        Les entrées sont rejouées dans l'ordre : une entrée plus récente
+        remplace une entrée antérieure portant le même identifiant.
         """
+        legacy_index_file = self.evidence_dir / "evidence_index.json"
+        
         if not self.evidence_index_file.exists():
+            if legacy_index_file.exists():
+                self._load_legacy_evidence_index(legacy_index_file)
             return
         
         try:
-            with open(self.evidence_index_file, 'r') as f:
+            with open(self.evidence_index_file, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    
+                    self._index_line_count += 1
+                    try:
+                        evidence = Evidence.from_dict(serialization.loads(line))
+                    except ValueError:
+                        # Ligne tronquée (interruption pendant une écriture par exemple)
+                        logging.warning(f"Entrée invalide ignorée dans l'index des preuves (ligne {line_number})")
+                        continue
+                    
+                    self.evidence_items[evidence.evidence_id] = evidence
+            
+            logging.info(f"Index des preuves chargé: {len(self.evidence_items)} preuves trouvées")
+        
+        except Exception as e:
+            logging.error(f"Erreur lors du chargement de l'index des preuves: {str(e)}")
+        
+        self._rebuild_type_index()
+    
+    def _load_legacy_evidence_index(self, legacy_index_file):
+        """
+        Charge un index des preuves au format JSON des versions précédentes
+        
+        Args:
+            legacy_index_file (Path): Chemin vers l'ancien fichier d'index
+        """
+        try:
+            with open(legacy_index_file, 'r') as f:
                 data = json.load(f)
-                
-                if "evidence_items" in data:
-                    for item_data in data["evidence_items"]:
-                        evidence = Evidence.from_dict(item_data)
-                        self.evidence_items[evidence.evidence_id] = evidence
             
+            for item_data in data.get("evidence_items", []):
+                evidence = Evidence.from_dict(item_data)
+                self.evidence_items[evidence.evidence_id] = evidence
+            
+            # Migrer vers le format JSON Lines
+            self._rebuild_type_index()
+            self._save_evidence_index()
             logging.info(f"Index des preuves chargé: {len(self.evidence_items)} preuves trouvées")
         
         except Exception as e:
             logging.error(f"Erreur lors du chargement de l'index des preuves: {str(e)}")
     
+    def _rebuild_type_index(self):
+        """
+        Reconstruit l'index secondaire des preuves par type
+        """
+        self._evidence_by_type = {}
+        for evidence in self.evidence_items.values():
+            self._evidence_by_type.setdefault(evidence.type, []).append(evidence)
+    
+    def _append_to_evidence_index(self, evidence):
+        """
+        Ajoute une preuve à la fin du journal de l'index des preuves
+        
+        Args:
+            evidence (Evidence): Preuve à enregistrer
+        """
+        try:
+            with open(self.evidence_index_file, 'ab') as f:
+                f.write(serialization.dumps(evidence.to_dict()) + b'\n')
+            
+            self._index_line_count += 1
+            logging.debug(f"Preuve {evidence.evidence_id} ajoutée à l'index des preuves")
+        
+        except Exception as e:
+            logging.error(f"Erreur lors de la sauvegarde de l'index des preuves: {str(e)}")
+        
+        self.compact()
+    
     def _save_evidence_index(self):
         """
-        Sauvegarde l'index des preuves dans un fichier JSON
+        Réécrit intégralement l'index des preuves de manière atomique
+        
+        Returns:
+            bool: True si l'index a été sauvegardé, False sinon
         """
+        temp_file = self.evidence_index_file.with_name(self.evidence_index_file.name + ".tmp")
+        
         try:
-            data = {
-                "evidence_items": [evidence.to_dict() for evidence in self.evidence_items.values()],
-                "generated_at": datetime.datetime.now().isoformat()
-            }
+            with open(temp_file, 'wb') as f:
+                for evidence in self.evidence_items.values():
+                    f.write(serialization.dumps(evidence.to_dict()) + b'\n')
             
-            with open(self.evidence_index_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            os.replace(temp_file, self.evidence_index_file)
+            self._index_line_count = len(self.evidence_items)
             
             logging.info(f"Index des preuves sauvegardé: {len(self.evidence_items)} preuves")
+            return True
         
         except Exception as e:
             logging.error(f"Erreur lors de la sauvegarde de l'index des preuves: {str(e)}")
+            return False
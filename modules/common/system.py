@@ -9,73 +9,215 @@ sur le système sur lequel s'exécute l'outil.
 """
 
 import os
+import re
 import sys
 import platform
 import logging
 import datetime
 import socket
 import uuid
+import copy
+import struct
+import ipaddress
 import json
+import time
+import queue
+import threading
 import tempfile
+import plistlib
+import functools
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    logging.warning("Le module psutil n'est pas disponible. Certaines informations système ne seront pas collectées.")
+# Plateforme courante, déterminée une seule fois au chargement du module
+_SYSTEM = platform.system()
 
-try:
-    import cpuinfo
-    CPUINFO_AVAILABLE = True
-except ImportError:
-    CPUINFO_AVAILABLE = False
-    logging.warning("Le module py-cpuinfo n'est pas disponible. Les informations détaillées du CPU ne seront pas collectées.")
+# Frameworks et propriétés IOKit utilisés pour les informations matérielles macOS
+_IOKIT_PATH = '/System/Library/Frameworks/IOKit.framework/IOKit'
+_COREFOUNDATION_PATH = '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation'
+_MACOS_SYSTEM_VERSION_PLIST = '/System/Library/CoreServices/SystemVersion.plist'
+_KIO_MASTER_PORT_DEFAULT = 0
+_CF_STRING_ENCODING_UTF8 = 0x08000100
+# Mêmes clés que celles produites par system_profiler SPHardwareDataType
+_IOKIT_HARDWARE_PROPERTIES = (
+    ("hw_model_identifier", b"model"),
+    ("hw_serial_number_(system)", b"IOPlatformSerialNumber"),
+    ("hw_hardware_uuid", b"IOPlatformUUID"),
+)
 
+# Nom complet de la distribution dans /etc/os-release
+_OS_RELEASE_PRETTY_NAME = re.compile(r'^PRETTY_NAME=(.+)$', re.M)
 
-def get_system_info():
+# Lignes « clé: valeur » des sorties lsb_release et system_profiler
+_KEY_VALUE_LINE_RE = re.compile(r'^([^:\n]*):(.*)$', re.M)
+
+# Horodatage de démarrage dans les sorties de sysctl (macOS) et net stats srv (Windows)
+_SYSCTL_BOOT_RE = re.compile(r'sec = (\d+)')
+_NET_STATS_SINCE_RE = re.compile(r'Statistics since(.*)$', re.M)
+
+# Couples (interface, adresse MAC) dans la sortie de ifconfig (macOS) :
+# seules les lignes indentées du bloc de l'interface sont parcourues
+_IFCONFIG_ETHER_RE = re.compile(r'^([^\s:]+):[^\n]*\n(?:\t[^\n]*\n)*?\tether\s+([0-9a-f:]+)', re.M)
+
+# Couples (connexion, adresse physique) dans la sortie CSV de getmac (Windows)
+_GETMAC_RE = re.compile(r'^"([^"]+)","[^"]*","([^"]+)"', re.M)
+
+# Requêtes ioctl Linux pour les adresses IPv4 d'une interface (linux/sockios.h)
+_SIOCGIFADDR = 0x8915
+_SIOCGIFBRDADDR = 0x8919
+_SIOCGIFNETMASK = 0x891b
+
+# Durée de validité (en secondes) du cache des interfaces réseau
+NET_IF_CACHE_TTL = 5.0
+_net_if_cache = {"timestamp": 0.0, "interfaces": None}
+
+# Temps de démarrage au format ISO 8601, constant pendant la durée du processus
+_boot_time_iso = None
+
+# Nombre de partitions interrogées simultanément et délai maximal (en secondes)
+DISK_USAGE_MAX_WORKERS = 8
+DISK_USAGE_TIMEOUT = 2.0
+
+# Informations système invariantes, collectées au premier appel de get_system_info
+_system_info_cache = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_psutil():
+    """
+    Importe psutil à la première utilisation plutôt qu'au chargement du module
+
+    Returns:
+        module: Module psutil, ou None s'il n'est pas disponible
+    """
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        logging.warning("Le module psutil n'est pas disponible. Certaines informations système ne seront pas collectées.")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cpuinfo_module():
+    """
+    Importe py-cpuinfo à la première utilisation plutôt qu'au chargement du module
+
+    Returns:
+        module: Module cpuinfo, ou None s'il n'est pas disponible
+    """
+    try:
+        import cpuinfo
+        return cpuinfo
+    except ImportError:
+        logging.warning("Le module py-cpuinfo n'est pas disponible. Les informations détaillées du CPU ne seront pas collectées.")
+        return None
+
+
+def get_system_info(force_refresh=False):
     """
     Obtient des informations détaillées sur le système
 
+    Les informations invariantes pendant la durée du processus (identité de
+    l'hôte, système, CPU) sont collectées une seule fois puis réutilisées ;
+    les informations dynamiques (dont les adresses réseau) sont recalculées.
+
+    Args:
+        force_refresh (bool): Recollecter aussi les informations invariantes
+
     Returns:
         dict: Informations sur le système
     """
+    global _system_info_cache
+    
+    if _system_info_cache is not None and not force_refresh:
+        # Copie profonde : l'appelant ne doit pas pouvoir altérer le cache
+        info = copy.deepcopy(_system_info_cache)
+        info.update(_get_dynamic_system_info())
+        return info
+    
+    # Les collectes indépendantes (sous-processus, /proc, registre) s'exécutent en parallèle
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 4)) as executor:
+        dynamic_future = executor.submit(_get_dynamic_system_info)
+        _system_info_cache = _get_static_system_info(executor)
+        info = copy.deepcopy(_system_info_cache)
+        info.update(dynamic_future.result())
+    
+    return info
+
+
+def _get_static_system_info(executor):
+    """
+    Obtient les informations système invariantes pendant la durée du processus
+
+    Args:
+        executor (ThreadPoolExecutor): Exécuteur utilisé pour les collectes parallèles
+
+    Returns:
+        dict: Informations système invariantes
+    """
+    boot_future = executor.submit(_get_boot_time)
+    
+    extra_futures = []
+    
+    # Informations spécifiques à la plateforme
+    if _OS_INFO_FN is not None:
+        extra_futures.append(executor.submit(_OS_INFO_FN))
+    
+    # Informations CPU détaillées si py-cpuinfo est disponible
+    if _get_cpuinfo_module() is not None:
+        extra_futures.append(executor.submit(_get_cpuinfo))
+    
+    # Les résolutions de noms restent sur le thread appelant, pendant les collectes
+    hostname = socket.gethostname()
+    fqdn = socket.getfqdn()
+    
     info = {
-        "hostname": socket.gethostname(),
-        "fqdn": socket.getfqdn(),
-        "ip_addresses": _get_ip_addresses(),
-        "os_name": platform.system(),
+        "hostname": hostname,
+        "fqdn": fqdn,
+        "os_name": _SYSTEM,
         "os_version": platform.version(),
         "os_release": platform.release(),
         "architecture": platform.machine(),
         "python_version": platform.python_version(),
         "user": os.getlogin() if hasattr(os, 'getlogin') else os.getenv('USER') or os.getenv('USERNAME'),
-        "timestamp": datetime.datetime.now().isoformat(),
-        "mac_addresses": _get_mac_addresses(),
-        "boot_time": _get_boot_time()
+        "boot_time": boot_future.result()
     }
     
-    # Ajouter des informations spécifiques à la plateforme
-    if platform.system() == 'Windows':
-        info.update(_get_windows_info())
-    elif platform.system() == 'Linux':
-        info.update(_get_linux_info())
-    elif platform.system() == 'Darwin':
-        info.update(_get_macos_info())
+    # Fusion dans l'ordre de soumission pour un résultat déterministe
+    for future in extra_futures:
+        info.update(future.result())
     
-    # Ajouter des informations détaillées si psutil est disponible
-    if PSUTIL_AVAILABLE:
-        info.update(_get_psutil_info())
+    return info
+
+
+def _get_dynamic_system_info():
+    """
+    Obtient les informations système qui évoluent au cours de l'exécution
+    (horodatage, adresses réseau, mémoire, disques, charge, statistiques réseau)
+
+    Returns:
+        dict: Informations système dynamiques
+    """
+    # Une seule énumération des interfaces pour les adresses IP et MAC, réutilisée
+    # pendant NET_IF_CACHE_TTL secondes (renouvellements DHCP, interfaces activées ou non)
+    ip_addresses, mac_addresses = _get_interface_addresses()
+    
+    info = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "ip_addresses": ip_addresses,
+        "mac_addresses": mac_addresses
+    }
     
-    # Ajouter des informations CPU détaillées si py-cpuinfo est disponible
-    if CPUINFO_AVAILABLE:
-        info.update(_get_cpuinfo())
+    # Informations détaillées si psutil est disponible
+    if _get_psutil() is not None:
+        info.update(_get_psutil_info())
     
     return info
 
 
+@functools.lru_cache(maxsize=1)
 def check_privileges():
     """
     Vérifie si le programme a les privilèges administrateur/root
@@ -84,62 +226,115 @@ def check_privileges():
         bool: True si le programme a les privilèges administrateur/root, False sinon
     """
     try:
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         else:
             return os.geteuid() == 0
-    except:
+    except (AttributeError, OSError):
         return False
 
 
-def _get_ip_addresses():
+def _get_net_if_addrs():
+    """
+    Obtient les adresses des interfaces réseau via psutil, avec un cache de courte durée
+
+    L'énumération des interfaces est coûteuse (GetAdaptersAddresses sous Windows,
+    parcours netlink sous Linux) ; son résultat est réutilisé pendant NET_IF_CACHE_TTL secondes.
+
+    Returns:
+        dict: Adresses par interface, au format de psutil.net_if_addrs()
+    """
+    now = time.monotonic()
+    if _net_if_cache["interfaces"] is None or now - _net_if_cache["timestamp"] > NET_IF_CACHE_TTL:
+        _net_if_cache["interfaces"] = _get_psutil().net_if_addrs()
+        _net_if_cache["timestamp"] = now
+    
+    return _net_if_cache["interfaces"]
+
+
+def _get_interface_addresses():
+    """
+    Obtient les adresses IP et MAC du système en une seule énumération des interfaces
+
+    Returns:
+        tuple: (adresses IP par interface, adresses MAC par interface)
+    """
+    if _get_psutil() is None:
+        return _get_ip_addresses(), _get_mac_addresses()
+    
+    try:
+        return _demux_ifaces(_get_net_if_addrs())
+    except Exception as e:
+        logging.warning(f"Erreur lors de la récupération des adresses réseau: {str(e)}")
+        return {}, {}
+
+
+def _demux_ifaces(interfaces):
+    """
+    Répartit les adresses des interfaces par famille en une seule passe
+
+    Args:
+        interfaces (dict): Résultat de psutil.net_if_addrs()
+
+    Returns:
+        tuple: (adresses IP par interface, adresses MAC par interface)
+    """
+    ip_addresses = {}
+    mac_addresses = {}
+    link_family = _get_psutil().AF_LINK
+    
+    for interface_name, interface_addresses in interfaces.items():
+        interface_ips = ip_addresses[interface_name] = []
+        for addr in interface_addresses:
+            family = addr.family
+            if family == socket.AF_INET:  # IPv4
+                interface_ips.append({
+                    'ip': addr.address,
+                    'netmask': addr.netmask,
+                    'broadcast': addr.broadcast,
+                    'version': 'IPv4'
+                })
+            elif family == socket.AF_INET6:  # IPv6
+                interface_ips.append({
+                    'ip': addr.address,
+                    'netmask': addr.netmask,
+                    'broadcast': addr.broadcast,
+                    'version': 'IPv6'
+                })
+            elif family == link_family:  # Adresse MAC
+                mac_addresses[interface_name] = addr.address
+    
+    return ip_addresses, mac_addresses
+
+
+def _get_ip_addresses(interfaces=None):
     """
     Obtient les adresses IP du système
 
+    Args:
+        interfaces (dict, optional): Résultat de psutil.net_if_addrs() déjà obtenu
+
     Returns:
         dict: Adresses IP par interface
     """
     ip_addresses = {}
     
     try:
-        if PSUTIL_AVAILABLE:
+        if _get_psutil() is not None:
             # Méthode avec psutil (plus complète)
-            interfaces = psutil.net_if_addrs()
-            for interface_name, interface_addresses in interfaces.items():
-                ip_addresses[interface_name] = []
-                for addr in interface_addresses:
-                    if addr.family == socket.AF_INET:  # IPv4
-                        ip_addresses[interface_name].append({
-                            'ip': addr.address,
-                            'netmask': addr.netmask,
-                            'broadcast': addr.broadcast,
-                            'version': 'IPv4'
-                        })
-                    elif addr.family == socket.AF_INET6:  # IPv6
-                        ip_addresses[interface_name].append({
-                            'ip': addr.address,
-                            'netmask': addr.netmask,
-                            'broadcast': addr.broadcast,
-                            'version': 'IPv6'
-                        })
+            if interfaces is None:
+                interfaces = _get_net_if_addrs()
+            ip_addresses = _demux_ifaces(interfaces)[0]
         else:
-            # Méthode de secours (moins complète)
-            hostname = socket.gethostname()
-            ip_addresses['primary'] = [{'ip': socket.gethostbyname(hostname), 'version': 'IPv4'}]
+            # Méthodes de secours sans résolution DNS : netifaces, puis interrogation du noyau
+            ip_addresses = _get_ip_addresses_netifaces()
+            if not ip_addresses and _IP_FALLBACK_FN is not None:
+                ip_addresses = _IP_FALLBACK_FN()
             
-            # Essayer d'obtenir toutes les adresses IP associées à l'hôte
-            try:
-                addresses = socket.getaddrinfo(hostname, None)
-                for addr in addresses:
-                    if addr[0] == socket.AF_INET:  # IPv4
-                        ip_addresses['all_ipv4'] = ip_addresses.get('all_ipv4', [])
-                        ip_addresses['all_ipv4'].append({'ip': addr[4][0], 'version': 'IPv4'})
-                    elif addr[0] == socket.AF_INET6:  # IPv6
-                        ip_addresses['all_ipv6'] = ip_addresses.get('all_ipv6', [])
-                        ip_addresses['all_ipv6'].append({'ip': addr[4][0], 'version': 'IPv6'})
-            except:
-                pass
+            # En dernier recours, résolution du nom d'hôte (moins complète)
+            if not ip_addresses:
+                ip_addresses = _get_ip_addresses_from_hostname()
     
     except Exception as e:
         logging.warning(f"Erreur lors de la récupération des adresses IP: {str(e)}")
@@ -147,31 +342,140 @@ def _get_ip_addresses():
     return ip_addresses
 
 
-def _get_mac_addresses():
+def _get_ip_addresses_netifaces():
+    """
+    Obtient les adresses IP par interface avec le module netifaces, s'il est installé
+
+    Returns:
+        dict: Adresses IP par interface (vide si netifaces n'est pas disponible)
+    """
+    try:
+        import netifaces
+    except ImportError:
+        return {}
+    
+    ip_addresses = {}
+    
+    for interface_name in netifaces.interfaces():
+        interface_addresses = netifaces.ifaddresses(interface_name)
+        interface_ips = ip_addresses[interface_name] = []
+        for family, version in ((netifaces.AF_INET, 'IPv4'), (netifaces.AF_INET6, 'IPv6')):
+            for addr in interface_addresses.get(family, []):
+                interface_ips.append({
+                    'ip': addr.get('addr'),
+                    'netmask': addr.get('netmask'),
+                    'broadcast': addr.get('broadcast'),
+                    'version': version
+                })
+    
+    return ip_addresses
+
+
+def _get_ip_addresses_linux():
+    """
+    Obtient les adresses IP par interface sur Linux, sans résolution DNS :
+    ioctl SIOCGIF* pour IPv4 et /proc/net/if_inet6 pour IPv6
+
+    Returns:
+        dict: Adresses IP par interface
+    """
+    import fcntl
+    
+    ip_addresses = {}
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, interface_name in socket.if_nameindex():
+            request = struct.pack('256s', interface_name[:15].encode())
+            try:
+                address = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, request)
+            except OSError:
+                # Pas d'adresse IPv4 sur cette interface
+                continue
+            
+            entry = {
+                'ip': socket.inet_ntoa(address[20:24]),
+                'netmask': None,
+                'broadcast': None,
+                'version': 'IPv4'
+            }
+            for key, ioctl_request in (('netmask', _SIOCGIFNETMASK), ('broadcast', _SIOCGIFBRDADDR)):
+                try:
+                    value = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), ioctl_request, request)[20:24])
+                except OSError:
+                    continue
+                # 0.0.0.0 : pas de diffusion (boucle locale, point à point)
+                if value != '0.0.0.0':
+                    entry[key] = value
+            ip_addresses.setdefault(interface_name, []).append(entry)
+    
+    try:
+        with open('/proc/net/if_inet6', 'r') as f:
+            for line in f:
+                # adresse, index, longueur de préfixe, portée, drapeaux, interface
+                fields = line.split()
+                if len(fields) < 6:
+                    continue
+                ip_addresses.setdefault(fields[5], []).append({
+                    'ip': str(ipaddress.IPv6Address(bytes.fromhex(fields[0]))),
+                    'netmask': str(ipaddress.IPv6Network(f'::/{int(fields[2], 16)}').netmask),
+                    'broadcast': None,
+                    'version': 'IPv6'
+                })
+    except OSError:
+        pass
+    
+    return ip_addresses
+
+
+def _get_ip_addresses_from_hostname():
+    """
+    Obtient les adresses IP associées au nom d'hôte (peut déclencher une résolution DNS)
+
+    Returns:
+        dict: Adresses IP principale et associées à l'hôte
+    """
+    ip_addresses = {}
+    
+    hostname = socket.gethostname()
+    ip_addresses['primary'] = [{'ip': socket.gethostbyname(hostname), 'version': 'IPv4'}]
+    
+    # Essayer d'obtenir toutes les adresses IP associées à l'hôte
+    try:
+        addresses = socket.getaddrinfo(hostname, None)
+        for addr in addresses:
+            if addr[0] == socket.AF_INET:  # IPv4
+                ip_addresses['all_ipv4'] = ip_addresses.get('all_ipv4', [])
+                ip_addresses['all_ipv4'].append({'ip': addr[4][0], 'version': 'IPv4'})
+            elif addr[0] == socket.AF_INET6:  # IPv6
+                ip_addresses['all_ipv6'] = ip_addresses.get('all_ipv6', [])
+                ip_addresses['all_ipv6'].append({'ip': addr[4][0], 'version': 'IPv6'})
+    except OSError:
+        pass
+    
+    return ip_addresses
+
+
+def _get_mac_addresses(interfaces=None):
     """
     Obtient les adresses MAC du système
 
+    Args:
+        interfaces (dict, optional): Résultat de psutil.net_if_addrs() déjà obtenu
+
     Returns:
         dict: Adresses MAC par interface
     """
     mac_addresses = {}
     
     try:
-        if PSUTIL_AVAILABLE:
+        if _get_psutil() is not None:
             # Méthode avec psutil
-            interfaces = psutil.net_if_addrs()
-            for interface_name, interface_addresses in interfaces.items():
-                for addr in interface_addresses:
-                    if addr.family == psutil.AF_LINK:  # Adresse MAC
-                        mac_addresses[interface_name] = addr.address
-        else:
+            if interfaces is None:
+                interfaces = _get_net_if_addrs()
+            mac_addresses = _demux_ifaces(interfaces)[1]
+        elif _MAC_FALLBACK_FN is not None:
             # Méthode de secours pour obtenir l'adresse MAC (moins complète)
-            if platform.system() == 'Windows':
-                mac_addresses = _get_mac_addresses_windows()
-            elif platform.system() == 'Linux':
-                mac_addresses = _get_mac_addresses_linux()
-            elif platform.system() == 'Darwin':
-                mac_addresses = _get_mac_addresses_macos()
+            mac_addresses = _MAC_FALLBACK_FN()
     
     except Exception as e:
         logging.warning(f"Erreur lors de la récupération des adresses MAC: {str(e)}")
@@ -190,24 +494,34 @@ def _get_mac_addresses_windows():
     
     try:
         # Exécuter la commande getmac
-        output = subprocess.check_output("getmac /v /fo csv", shell=True).decode('utf-8')
+        output = subprocess.check_output(["getmac", "/v", "/fo", "csv"], stderr=subprocess.DEVNULL, text=True)
         
-        # Analyser la sortie
-        for line in output.splitlines()[1:]:  # Ignorer l'en-tête
-            if not line:
-                continue
-            
-            parts = line.split('","')
-            if len(parts) >= 3:
-                interface = parts[0].strip('"')
-                mac = parts[2].strip('"')
-                mac_addresses[interface] = mac
-    except:
+        # Analyser la sortie, en ignorant l'en-tête
+        mac_addresses = dict(_GETMAC_RE.findall(output.partition('\n')[2]))
+    except (OSError, subprocess.SubprocessError):
         pass
     
     return mac_addresses
 
 
+def _read_small_file(path, size):
+    """
+    Lit un petit fichier virtuel (/proc, /sys) en un seul appel système
+
+    Args:
+        path (str): Chemin du fichier
+        size (int): Nombre maximal d'octets à lire
+
+    Returns:
+        bytes: Contenu brut du fichier
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 def _get_mac_addresses_linux():
     """
     Obtient les adresses MAC sur Linux en lisant /sys/class/net/*/address
@@ -217,16 +531,24 @@ def _get_mac_addresses_linux():
     """
     mac_addresses = {}
     
+    # Tampon réutilisé pour toutes les interfaces (InfiniBand : 59 caractères)
+    buffer = bytearray(64)
+    
     try:
-        for interface in os.listdir('/sys/class/net'):
-            try:
-                with open(f'/sys/class/net/{interface}/address', 'r') as f:
-                    mac = f.read().strip()
+        with os.scandir('/sys/class/net') as entries:
+            for entry in entries:
+                try:
+                    fd = os.open(os.path.join(entry.path, 'address'), os.O_RDONLY)
+                    try:
+                        size = os.readv(fd, [buffer])
+                    finally:
+                        os.close(fd)
+                    mac = buffer[:size].strip().decode('ascii')
                     if mac:
-                        mac_addresses[interface] = mac
-            except:
-                pass
-    except:
+                        mac_addresses[entry.name] = mac
+                except (OSError, ValueError):
+                    pass
+    except OSError:
         pass
     
     return mac_addresses
@@ -243,17 +565,11 @@ def _get_mac_addresses_macos():
     
     try:
         # Exécuter la commande ifconfig
-        output = subprocess.check_output("ifconfig", shell=True).decode('utf-8')
+        output = subprocess.check_output(["ifconfig"], stderr=subprocess.DEVNULL, text=True)
         
         # Analyser la sortie
-        current_interface = None
-        for line in output.splitlines():
-            if not line.startswith('\t'):
-                current_interface = line.split(':')[0]
-            elif 'ether' in line and current_interface:
-                mac = line.split('ether')[1].strip().split(' ')[0]
-                mac_addresses[current_interface] = mac
-    except:
+        mac_addresses = dict(_IFCONFIG_ETHER_RE.findall(output))
+    except (OSError, subprocess.SubprocessError):
         pass
     
     return mac_addresses
@@ -261,42 +577,35 @@ def _get_mac_addresses_macos():
 
 def _get_boot_time():
     """
-    Obtient le temps de démarrage du système
+    Obtient le temps de démarrage du système, lu une seule fois par processus
+
+    Returns:
+        str: Temps de démarrage au format ISO 8601 ou None si non disponible
+    """
+    global _boot_time_iso
+    
+    if _boot_time_iso is None:
+        _boot_time_iso = _read_boot_time()
+    
+    return _boot_time_iso
+
+
+def _read_boot_time():
+    """
+    Lit le temps de démarrage du système
 
     Returns:
         str: Temps de démarrage au format ISO 8601 ou None si non disponible
     """
+    psutil = _get_psutil()
+    
     try:
-        if PSUTIL_AVAILABLE:
+        if psutil is not None:
             # Utiliser psutil pour obtenir le temps de démarrage
-            boot_time = datetime.datetime.fromtimestamp(psutil.boot_time()).isoformat()
-            return boot_time
-        else:
+            return datetime.datetime.fromtimestamp(psutil.boot_time()).isoformat()
+        elif _BOOT_FALLBACK_FN is not None:
             # Essayer d'obtenir le temps de démarrage selon la plateforme
-            if platform.system() == 'Windows':
-                # Utiliser le temps d'activité pour calculer le temps de démarrage
-                output = subprocess.check_output('net stats srv', shell=True).decode('utf-8')
-                for line in output.splitlines():
-                    if 'Statistics since' in line:
-                        # Extraire la date et l'heure, format peut varier selon la locale
-                        dt_str = line.split('Statistics since')[1].strip()
-                        boot_time = datetime.datetime.strptime(dt_str, '%d/%m/%Y %H:%M:%S')
-                        return boot_time.isoformat()
-            
-            elif platform.system() == 'Linux':
-                # Lire /proc/uptime
-                with open('/proc/uptime', 'r') as f:
-                    uptime_seconds = float(f.readline().split()[0])
-                    boot_time = datetime.datetime.now() - datetime.timedelta(seconds=uptime_seconds)
-                    return boot_time.isoformat()
-            
-            elif platform.system() == 'Darwin':
-                # Utiliser la commande sysctl
-                output = subprocess.check_output('sysctl kern.boottime', shell=True).decode('utf-8')
-                if 'sec = ' in output:
-                    boot_timestamp = int(output.split('sec = ')[1].split(',')[0])
-                    boot_time = datetime.datetime.fromtimestamp(boot_timestamp)
-                    return boot_time.isoformat()
+            return _BOOT_FALLBACK_FN()
     
     except Exception as e:
         logging.warning(f"Erreur lors de la récupération du temps de démarrage: {str(e)}")
@@ -304,6 +613,55 @@ def _get_boot_time():
     return None
 
 
+def _get_boot_time_windows():
+    """
+    Obtient le temps de démarrage sur Windows à partir de net stats srv
+
+    Returns:
+        str: Temps de démarrage au format ISO 8601 ou None si non disponible
+    """
+    # Utiliser le temps d'activité pour calculer le temps de démarrage
+    output = subprocess.check_output(['net', 'stats', 'srv'], stderr=subprocess.DEVNULL, text=True)
+    match = _NET_STATS_SINCE_RE.search(output)
+    if match:
+        # Extraire la date et l'heure, format peut varier selon la locale
+        boot_time = datetime.datetime.strptime(match.group(1).strip(), '%d/%m/%Y %H:%M:%S')
+        return boot_time.isoformat()
+    
+    return None
+
+
+def _get_boot_time_linux():
+    """
+    Obtient le temps de démarrage sur Linux à partir de /proc/uptime
+
+    Returns:
+        str: Temps de démarrage au format ISO 8601
+    """
+    # Lire /proc/uptime en un seul appel read()
+    data = _read_small_file('/proc/uptime', 128)
+    uptime_seconds = float(data.split(b' ', 1)[0])
+    boot_time = datetime.datetime.now() - datetime.timedelta(seconds=uptime_seconds)
+    return boot_time.isoformat()
+
+
+def _get_boot_time_macos():
+    """
+    Obtient le temps de démarrage sur macOS à partir de sysctl
+
+    Returns:
+        str: Temps de démarrage au format ISO 8601 ou None si non disponible
+    """
+    # Utiliser la commande sysctl
+    output = subprocess.check_output(['sysctl', 'kern.boottime'], stderr=subprocess.DEVNULL, text=True)
+    match = _SYSCTL_BOOT_RE.search(output)
+    if match:
+        boot_time = datetime.datetime.fromtimestamp(int(match.group(1)))
+        return boot_time.isoformat()
+    
+    return None
+
+
 def _get_windows_info():
     """
     Obtient des informations spécifiques à Windows
@@ -311,11 +669,14 @@ def _get_windows_info():
     Returns:
         dict: Informations spécifiques à Windows
     """
+    # Une seule énumération de la clé pour toutes les valeurs utiles
+    values = _read_all_registry_values(r'SOFTWARE\Microsoft\Windows NT\CurrentVersion')
+    
     info = {
         "windows_edition": platform.win32_edition() if hasattr(platform, 'win32_edition') else None,
-        "windows_current_version": _get_windows_registry_value(r'SOFTWARE\Microsoft\Windows NT\CurrentVersion', 'CurrentVersion'),
-        "product_name": _get_windows_registry_value(r'SOFTWARE\Microsoft\Windows NT\CurrentVersion', 'ProductName'),
-        "install_date": _get_windows_registry_value_as_datetime(r'SOFTWARE\Microsoft\Windows NT\CurrentVersion', 'InstallDate')
+        "windows_current_version": values.get('CurrentVersion'),
+        "product_name": values.get('ProductName'),
+        "install_date": _registry_timestamp_to_iso(values.get('InstallDate'))
     }
     
     # Ajouter des informations de service pack si disponibles
@@ -326,50 +687,47 @@ def _get_windows_info():
     return info
 
 
-def _get_windows_registry_value(key_path, value_name):
+def _read_all_registry_values(key_path):
     """
-    Obtient une valeur de registre Windows
+    Lit toutes les valeurs d'une clé de registre Windows en une seule énumération
 
     Args:
         key_path (str): Chemin de la clé de registre
-        value_name (str): Nom de la valeur
 
     Returns:
-        str or None: Valeur du registre ou None si non disponible
+        dict: Valeur par nom (vide si la clé n'est pas disponible)
     """
+    values = {}
+    
     try:
         import winreg
-        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
-        value, _ = winreg.QueryValueEx(key, value_name)
-        winreg.CloseKey(key)
-        return value
-    except:
-        return None
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            _, value_count, _ = winreg.QueryInfoKey(key)
+            for index in range(value_count):
+                name, value, _ = winreg.EnumValue(key, index)
+                values[name] = value
+    except (ImportError, OSError):
+        pass
+    
+    return values
 
 
-def _get_windows_registry_value_as_datetime(key_path, value_name):
+def _registry_timestamp_to_iso(timestamp):
     """
-    Obtient une valeur de registre Windows et la convertit en datetime
+    Convertit un horodatage Unix lu dans le registre au format ISO 8601
 
     Args:
-        key_path (str): Chemin de la clé de registre
-        value_name (str): Nom de la valeur
+        timestamp: Valeur lue dans le registre
 
     Returns:
-        str or None: Valeur du registre au format ISO 8601 ou None si non disponible
+        str or None: Date au format ISO 8601, ou la valeur telle quelle si ce n'est pas un entier
     """
-    try:
-        import winreg
-        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
-        timestamp, _ = winreg.QueryValueEx(key, value_name)
-        winreg.CloseKey(key)
-        
-        if isinstance(timestamp, int):
-            dt = datetime.datetime.fromtimestamp(timestamp)
-            return dt.isoformat()
-        return timestamp
-    except:
-        return None
+    if isinstance(timestamp, int):
+        try:
+            return datetime.datetime.fromtimestamp(timestamp).isoformat()
+        except (OverflowError, OSError, ValueError):
+            return None
+    return timestamp
 
 
 def _get_linux_info():
@@ -386,12 +744,10 @@ def _get_linux_info():
     
     # Ajouter des informations LSB si disponibles
     try:
-        output = subprocess.check_output('lsb_release -a', shell=True).decode('utf-8')
-        for line in output.splitlines():
-            if ':' in line:
-                key, value = line.split(':', 1)
-                info[f"lsb_{key.strip().lower()}"] = value.strip()
-    except:
+        output = subprocess.check_output(['lsb_release', '-a'], stderr=subprocess.DEVNULL, text=True)
+        for key, value in _KEY_VALUE_LINE_RE.findall(output):
+            info[f"lsb_{key.strip().lower()}"] = value.strip()
+    except (OSError, subprocess.SubprocessError):
         pass
     
     return info
@@ -411,23 +767,109 @@ def _get_linux_distribution():
         else:
             # Pour Python >= 3.8, méthode alternative
             if os.path.exists('/etc/os-release'):
-                with open('/etc/os-release', 'r') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        if line.startswith('PRETTY_NAME='):
-                            return line.split('=')[1].strip().strip('"')
+                match = _OS_RELEASE_PRETTY_NAME.search(Path('/etc/os-release').read_text())
+                if match:
+                    return match.group(1).strip().strip('"')
             
             # Méthodes alternatives
             for file_path in ['/etc/lsb-release', '/etc/debian_version', '/etc/redhat-release', '/etc/SuSE-release']:
                 if os.path.exists(file_path):
                     with open(file_path, 'r') as f:
                         return f.readline().strip()
-    except:
+    except (OSError, ValueError):
         pass
     
     return None
 
 
+def _get_macos_hardware_info():
+    """
+    Lit le modèle, le numéro de série et l'UUID matériel directement dans
+    le registre IOKit (nœud IOPlatformExpertDevice) via ctypes
+
+    Returns:
+        dict: Informations matérielles, ou None si IOKit n'est pas accessible
+    """
+    try:
+        import ctypes
+        iokit = ctypes.CDLL(_IOKIT_PATH)
+        cf = ctypes.CDLL(_COREFOUNDATION_PATH)
+    except (ImportError, OSError):
+        return None
+    
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+    cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    cf.CFGetTypeID.restype = ctypes.c_ulong
+    cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+    cf.CFStringGetTypeID.restype = ctypes.c_ulong
+    cf.CFDataGetTypeID.restype = ctypes.c_ulong
+    cf.CFStringGetCString.restype = ctypes.c_bool
+    cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+    cf.CFDataGetLength.restype = ctypes.c_long
+    cf.CFDataGetLength.argtypes = [ctypes.c_void_p]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    iokit.IOServiceMatching.restype = ctypes.c_void_p
+    iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+    iokit.IOServiceGetMatchingService.restype = ctypes.c_uint32
+    iokit.IOServiceGetMatchingService.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+    iokit.IORegistryEntryCreateCFProperties.restype = ctypes.c_int
+    iokit.IORegistryEntryCreateCFProperties.argtypes = [
+        ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_uint32
+    ]
+    iokit.IOObjectRelease.argtypes = [ctypes.c_uint32]
+    
+    # IOServiceGetMatchingService consomme la référence du dictionnaire de correspondance
+    service = iokit.IOServiceGetMatchingService(
+        _KIO_MASTER_PORT_DEFAULT, iokit.IOServiceMatching(b"IOPlatformExpertDevice")
+    )
+    if not service:
+        return None
+    
+    properties = ctypes.c_void_p()
+    try:
+        if iokit.IORegistryEntryCreateCFProperties(service, ctypes.byref(properties), None, 0) != 0:
+            return None
+    finally:
+        iokit.IOObjectRelease(service)
+    
+    if not properties.value:
+        return None
+    
+    info = {}
+    try:
+        string_type = cf.CFStringGetTypeID()
+        data_type = cf.CFDataGetTypeID()
+        buffer = ctypes.create_string_buffer(256)
+        
+        for info_key, property_name in _IOKIT_HARDWARE_PROPERTIES:
+            cf_key = cf.CFStringCreateWithCString(None, property_name, _CF_STRING_ENCODING_UTF8)
+            if not cf_key:
+                continue
+            try:
+                # Référence empruntée au dictionnaire : pas de CFRelease
+                value = cf.CFDictionaryGetValue(properties, cf_key)
+            finally:
+                cf.CFRelease(cf_key)
+            if not value:
+                continue
+            
+            type_id = cf.CFGetTypeID(value)
+            if type_id == string_type:
+                if cf.CFStringGetCString(value, buffer, len(buffer), _CF_STRING_ENCODING_UTF8):
+                    info[info_key] = buffer.value.decode('utf-8', 'replace')
+            elif type_id == data_type:
+                raw = ctypes.string_at(cf.CFDataGetBytePtr(value), cf.CFDataGetLength(value))
+                info[info_key] = raw.rstrip(b'\0').decode('utf-8', 'replace')
+    finally:
+        cf.CFRelease(properties)
+    
+    return info or None
+
+
 def _get_macos_info():
     """
     Obtient des informations spécifiques à macOS
@@ -440,24 +882,31 @@ def _get_macos_info():
         "macos_version_tuple": platform.mac_ver()
     }
     
-    # Obtenir des informations système supplémentaires
+    # Version du système : lue dans le plist consulté par sw_vers
     try:
-        # Version du système
-        output = subprocess.check_output('sw_vers', shell=True).decode('utf-8')
-        for line in output.splitlines():
-            if ':' in line:
-                key, value = line.split(':', 1)
-                info[f"sw_{key.strip().lower()}"] = value.strip()
-        
-        # Informations matérielles
-        output = subprocess.check_output('system_profiler SPHardwareDataType', shell=True).decode('utf-8')
-        for line in output.splitlines():
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().lower().replace(' ', '_')
-                if key and value.strip():
-                    info[f"hw_{key}"] = value.strip()
-    except:
+        with open(_MACOS_SYSTEM_VERSION_PLIST, 'rb') as f:
+            version = plistlib.load(f)
+        for key, plist_key in (("sw_productname", "ProductName"),
+                               ("sw_productversion", "ProductVersion"),
+                               ("sw_buildversion", "ProductBuildVersion")):
+            if version.get(plist_key):
+                info[key] = version[plist_key]
+    except (OSError, ValueError, plistlib.InvalidFileException):
+        pass
+    
+    # Informations matérielles via IOKit, system_profiler en dernier recours
+    hardware_info = _get_macos_hardware_info()
+    if hardware_info:
+        info.update(hardware_info)
+        return info
+    
+    try:
+        output = subprocess.check_output(['system_profiler', 'SPHardwareDataType'], stderr=subprocess.DEVNULL, text=True)
+        for key, value in _KEY_VALUE_LINE_RE.findall(output):
+            key = key.strip().lower().replace(' ', '_')
+            if key and value.strip():
+                info[f"hw_{key}"] = value.strip()
+    except (OSError, subprocess.SubprocessError):
         pass
     
     return info
@@ -470,6 +919,7 @@ def _get_psutil_info():
     Returns:
         dict: Informations système obtenues avec psutil
     """
+    psutil = _get_psutil()
     info = {}
     
     try:
@@ -493,47 +943,27 @@ def _get_psutil_info():
         }
         
         # Informations sur les disques
-        info['disks'] = []
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                info['disks'].append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'opts': partition.opts,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent_used': usage.percent
-                })
-            except:
-                # Certains points de montage peuvent ne pas être accessibles
-                info['disks'].append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'opts': partition.opts,
-                    'error': 'Could not get usage information'
-                })
+        info['disks'] = _get_disk_usages()
         
-        # Informations sur le CPU
+        # Informations sur le CPU (un seul appel à cpu_freq et cpu_stats)
+        cpu_freq = psutil.cpu_freq()
+        cpu_stats = psutil.cpu_stats()
         info['cpu'] = {
             'physical_cores': psutil.cpu_count(logical=False),
             'logical_cores': psutil.cpu_count(logical=True),
-            'frequency': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
+            'frequency': cpu_freq._asdict() if cpu_freq else None,
             'stats': {
-                'ctx_switches': psutil.cpu_stats().ctx_switches,
-                'interrupts': psutil.cpu_stats().interrupts,
-                'soft_interrupts': psutil.cpu_stats().soft_interrupts,
-                'syscalls': psutil.cpu_stats().syscalls if hasattr(psutil.cpu_stats(), 'syscalls') else None
+                'ctx_switches': cpu_stats.ctx_switches,
+                'interrupts': cpu_stats.interrupts,
+                'soft_interrupts': cpu_stats.soft_interrupts,
+                'syscalls': getattr(cpu_stats, 'syscalls', None)
             }
         }
         
         # Charge moyenne du CPU
         try:
             info['cpu']['load_avg'] = psutil.getloadavg()
-        except:
+        except (AttributeError, OSError):
             pass
         
         # Informations sur les utilisateurs connectés
@@ -548,6 +978,86 @@ def _get_psutil_info():
     return info
 
 
+def _get_disk_usages():
+    """
+    Obtient l'occupation des partitions, avec un délai maximal global pour ne pas
+    rester bloqué sur un montage réseau ou un lecteur optique qui ne répond pas
+
+    Returns:
+        list: Informations par partition
+    """
+    psutil = _get_psutil()
+    partitions = psutil.disk_partitions(all=False)
+    disks = [{
+        'device': partition.device,
+        'mountpoint': partition.mountpoint,
+        'fstype': partition.fstype,
+        'opts': partition.opts
+    } for partition in partitions]
+    
+    pending = queue.SimpleQueue()
+    queried = []
+    for index, partition in enumerate(partitions):
+        if 'cdrom' in partition.opts:
+            disks[index]['error'] = 'Skipped optical drive'
+        else:
+            pending.put((index, partition.mountpoint))
+            queried.append(index)
+    
+    # Threads démons : un statvfs bloqué (montage NFS) ne retient ni l'appelant
+    # ni la fin du processus, contrairement aux threads d'un ThreadPoolExecutor
+    usages = {}
+    threads = [
+        threading.Thread(target=_disk_usage_worker, args=(psutil, pending, usages), daemon=True)
+        for _ in range(min(DISK_USAGE_MAX_WORKERS, len(queried)))
+    ]
+    for thread in threads:
+        thread.start()
+    
+    deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    
+    for index in queried:
+        usage = usages.get(index)
+        if usage is None:
+            disks[index]['error'] = 'timeout'
+        elif isinstance(usage, Exception):
+            # Certains points de montage peuvent ne pas être accessibles
+            disks[index]['error'] = 'Could not get usage information'
+        else:
+            disks[index].update({
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent_used': usage.percent
+            })
+    
+    return disks
+
+
+def _disk_usage_worker(psutil, pending, usages):
+    """
+    Interroge l'occupation des partitions en attente jusqu'à épuisement de la file
+
+    Args:
+        psutil (module): Module psutil
+        pending (queue.SimpleQueue): File de tuples (indice, point de montage)
+        usages (dict): Résultats par indice (occupation, ou exception levée)
+    """
+    while True:
+        try:
+            index, mountpoint = pending.get_nowait()
+        except queue.Empty:
+            return
+        
+        try:
+            usages[index] = psutil.disk_usage(mountpoint)
+        except Exception as e:
+            usages[index] = e
+
+
+@functools.lru_cache(maxsize=1)
 def _get_cpuinfo():
     """
     Obtient des informations détaillées sur le CPU
@@ -558,7 +1068,7 @@ def _get_cpuinfo():
     info = {}
     
     try:
-        cpu_info = cpuinfo.get_cpu_info()
+        cpu_info = _get_cpuinfo_module().get_cpu_info()
         
         # Sélectionner les informations pertinentes
         info['cpu_details'] = {
@@ -584,3 +1094,27 @@ def _get_cpuinfo():
         logging.warning(f"Erreur lors de la récupération des informations CPU détaillées: {str(e)}")
     
     return info
+
+
+# Fonctions spécifiques à la plateforme courante, résolues une seule fois au chargement
+_OS_INFO_FN = {
+    'Windows': _get_windows_info,
+    'Linux': _get_linux_info,
+    'Darwin': _get_macos_info
+}.get(_SYSTEM)
+
+_IP_FALLBACK_FN = {
+    'Linux': _get_ip_addresses_linux
+}.get(_SYSTEM)
+
+_MAC_FALLBACK_FN = {
+    'Windows': _get_mac_addresses_windows,
+    'Linux': _get_mac_addresses_linux,
+    'Darwin': _get_mac_addresses_macos
+}.get(_SYSTEM)
+
+_BOOT_FALLBACK_FN = {
+    'Windows': _get_boot_time_windows,
+    'Linux': _get_boot_time_linux,
+    'Darwin': _get_boot_time_macos
+}.get(_SYSTEM)
@@ -9,6 +9,8 @@ d'un système pour des analyses forensiques.
 """
 
 import os
+import re
+import errno
 import sys
 import platform
 import logging
@@ -16,29 +18,468 @@ import subprocess
 import datetime
 import tempfile
 import shutil
+import struct
+import functools
+import threading
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from modules.common.system import check_privileges
+from utils.hashing import calculate_file_hash
 from utils.logging import ForensicLogger
 
 
+# Plateforme courante, déterminée une seule fois au chargement du module
+_SYSTEM = platform.system()
+
+# Exécutables recherchés par plateforme, par ordre de préférence pour chaque outil
+_TOOL_EXECUTABLES = {
+    "Windows": {
+        "winpmem": ["winpmem.exe", "winpmem_x64.exe", "winpmem_x86.exe"],
+        "memdump": ["memdump"]
+    },
+    "Linux": {
+        "avml": ["avml"],
+        "dd": ["dd"],
+        "memdump": ["memdump"]
+    },
+    "Darwin": {
+        "osxpmem": ["osxpmem", "osxpmem.app/osxpmem"],
+        "memdump": ["memdump"]
+    }
+}
+
+# Noms de fichiers recherchés par plateforme : nom -> (outil, rang de préférence)
+_TOOL_NAMES = {
+    system: {
+        os.path.normcase(name): (tool, rank)
+        for tool, candidates in executables.items()
+        for rank, name in enumerate(candidates)
+        if "/" not in name
+    }
+    for system, executables in _TOOL_EXECUTABLES.items()
+}
+
+# Ordre de préférence des outils par plateforme
+_TOOL_PREFERENCES = {
+    "Windows": ["winpmem", "memdump"],
+    "Linux": ["lime", "avml", "dd", "memdump"],
+    "Darwin": ["osxpmem", "memdump"]
+}
+
+# Catégorie de chaque outil : les outils d'une même catégorie ne s'exécutent
+# jamais simultanément (chargement d'un pilote ou d'un module noyau)
+_TOOL_KINDS = {
+    "winpmem": "driver",
+    "lime": "driver",
+    "osxpmem": "driver",
+    "avml": "avml",
+    "memdump": "memdump",
+    "dd": "dd"
+}
+_CAPTURE_LOCKS = {kind: threading.Lock() for kind in set(_TOOL_KINDS.values())}
+
+# Outils acceptant l'option --version
+_VERSIONED_TOOLS = ("winpmem", "avml", "osxpmem", "memdump")
+
+# fallocate(2) : réserver l'espace sans modifier la taille apparente du fichier
+FALLOC_FL_KEEP_SIZE = 0x01
+
+# Type des segments de programme ELF décrivant le contenu de /proc/kcore
+ELF_PT_LOAD = 1
+
+# Taille de bloc utilisée pour les captures dd (bs=4M)
+DD_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Taille maximale (en octets) de la fin des journaux d'outil conservée dans les métadonnées
+TOOL_OUTPUT_TAIL_SIZE = 64 * 1024
+
+# Ouverture des journaux d'outil par le processus lancé
+LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Outils de capture détachés de la session (ou du groupe de processus) de la console :
+# un Ctrl-C de l'analyste n'interrompt pas une capture en cours
+_DETACHED_POPEN_KWARGS = (
+    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if _SYSTEM == "Windows"
+    else {"start_new_session": True}
+)
+
+# Options de compression zstd des captures (multi-thread, niveau 3, fenêtre longue)
+ZSTD_OPTIONS = ["-T0", "-3", "--long", "-q", "-f"]
+
+# Nombre d'octets copiés, dans le bilan affiché par dd sur sa sortie d'erreur
+_DD_BYTES_RE = re.compile(r'^(\d+) bytes', re.MULTILINE)
+
+
+def _read_log_tail(path, size=TOOL_OUTPUT_TAIL_SIZE):
+    """
+    Lit la fin d'un journal d'outil de capture
+    
+    Args:
+        path (Path): Chemin du journal
+        size (int): Nombre maximal d'octets lus depuis la fin du fichier
+        
+    Returns:
+        str: Fin du journal décodée en UTF-8
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode('utf-8', errors='replace')
+
+
+@functools.lru_cache(maxsize=None)
+def _query_tool_version(tool_path):
+    """
+    Interroge un outil de capture sur sa version (une seule fois par chemin)
+    
+    Args:
+        tool_path (str): Chemin de l'outil
+        
+    Returns:
+        str: Version de l'outil ou "Unknown" si impossible à déterminer
+    """
+    try:
+        output = subprocess.check_output([tool_path, "--version"], stderr=subprocess.STDOUT)
+        output = output.decode('utf-8', errors='replace')
+        
+        # Extraire la version de la sortie (dépend du format de sortie de chaque outil)
+        if "version" in output.lower():
+            for line in output.splitlines():
+                if "version" in line.lower():
+                    return line.strip()
+        
+        return output.strip()
+    
+    except Exception:
+        return "Unknown"
+
+
+def _spawn_detached(command, file_actions):
+    """
+    Lance un outil de capture avec posix_spawn dans une nouvelle session
+    
+    Args:
+        command (list): Commande à exécuter
+        file_actions (list): Redirections appliquées dans le processus lancé
+        
+    Returns:
+        int: PID du processus lancé
+    """
+    try:
+        return os.posix_spawnp(command[0], command, os.environ, file_actions=file_actions, setsid=True)
+    except NotImplementedError:
+        # POSIX_SPAWN_SETSID non pris en charge par la plateforme
+        return os.posix_spawnp(command[0], command, os.environ, file_actions=file_actions)
+
+
+def _get_mem_total():
+    """
+    Obtient la quantité totale de mémoire vive à partir de /proc/meminfo
+    
+    Returns:
+        int: Taille de la mémoire en octets, ou None si non disponible
+    """
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'MemTotal:'):
+                    # Valeur exprimée en kio
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    
+    return None
+
+
+def _get_kcore_extent(path="/proc/kcore"):
+    """
+    Obtient la taille utile de /proc/kcore à partir de ses en-têtes ELF
+    
+    /proc/kcore est un fichier core ELF dont la taille apparente ne reflète pas
+    le contenu : la fin du dernier segment PT_LOAD borne ce que dd lit jusqu'à la
+    fin du fichier (espace d'adressage complet, trous compris), bien au-delà de MemTotal.
+    
+    Args:
+        path (str): Chemin du fichier core
+        
+    Returns:
+        int: Position de la fin du dernier segment PT_LOAD, ou None si non déterminable
+    """
+    try:
+        with open(path, 'rb') as f:
+            ident = f.read(16)
+            if len(ident) < 16 or ident[:4] != b'\x7fELF' or ident[4] not in (1, 2):
+                return None
+            
+            is_64bit = ident[4] == 2
+            endian = '<' if ident[5] == 1 else '>'
+            header = f.read(48 if is_64bit else 36)
+            
+            if is_64bit:
+                phoff, = struct.unpack_from(f'{endian}Q', header, 16)
+                phentsize, phnum = struct.unpack_from(f'{endian}HH', header, 38)
+                phdr_format = f'{endian}II QQQQ'  # p_type, p_flags, p_offset, p_vaddr, p_paddr, p_filesz
+            else:
+                phoff, = struct.unpack_from(f'{endian}I', header, 12)
+                phentsize, phnum = struct.unpack_from(f'{endian}HH', header, 26)
+                phdr_format = f'{endian}IIIII'  # p_type, p_offset, p_vaddr, p_paddr, p_filesz
+            
+            # PN_XNUM : nombre de segments déporté dans la première section, non pris en charge
+            if not phnum or phnum == 0xffff or phentsize < struct.calcsize(phdr_format):
+                return None
+            
+            f.seek(phoff)
+            table = f.read(phentsize * phnum)
+    except (OSError, struct.error):
+        return None
+    
+    extent = None
+    for offset in range(0, len(table) - phentsize + 1, phentsize):
+        fields = struct.unpack_from(phdr_format, table, offset)
+        if fields[0] != ELF_PT_LOAD:
+            continue
+        p_offset, p_filesz = (fields[2], fields[5]) if is_64bit else (fields[1], fields[4])
+        extent = max(extent or 0, p_offset + p_filesz)
+    
+    return extent
+
+
+def _file_size(path):
+    """
+    Obtient la taille d'un fichier de capture en un seul appel à stat
+    
+    Args:
+        path (Path): Chemin du fichier
+        
+    Returns:
+        int: Taille du fichier en octets (0 si le fichier n'existe pas)
+    """
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _concatenate_files(parts, destination):
+    """
+    Concatène des fichiers dans un fichier de destination, en copiant les données
+    dans le noyau (copy_file_range) lorsque c'est possible
+    
+    Args:
+        parts (list): Fichiers à concaténer, dans l'ordre
+        destination (Path): Fichier de destination
+    """
+    with open(destination, 'wb') as dest:
+        # Taille finale connue : espace de l'image réservé en une seule fois
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(dest.fileno(), 0, sum(os.path.getsize(part) for part in parts))
+            except OSError:
+                pass
+        
+        for part in parts:
+            with open(part, 'rb') as src:
+                size = os.fstat(src.fileno()).st_size
+                copied = 0
+                
+                if hasattr(os, 'copy_file_range'):
+                    try:
+                        while copied < size:
+                            count = os.copy_file_range(src.fileno(), dest.fileno(), size - copied)
+                            if count == 0:
+                                break
+                            copied += count
+                    except OSError as e:
+                        # Non pris en charge (autre système de fichiers, noyau ancien) : copie classique
+                        if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                            raise
+                
+                # Reste éventuel copié depuis la position courante des deux descripteurs
+                if copied < size:
+                    shutil.copyfileobj(src, dest, DD_BLOCK_SIZE)
+                    dest.flush()
+
+
+def _preallocate(path, size):
+    """
+    Crée un fichier de capture en réservant son espace disque sans modifier sa
+    taille (fallocate avec FALLOC_FL_KEEP_SIZE), pour éviter l'allocation
+    d'extents pendant l'écriture de l'image (Linux uniquement)
+    
+    Args:
+        path (Path): Chemin du fichier de capture
+        size (int): Nombre d'octets à réserver
+        
+    Returns:
+        bool: True si l'espace a été réservé, False sinon (aucun fichier créé)
+    """
+    if _SYSTEM != "Linux" or not size:
+        return False
+    
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        fallocate = getattr(libc, 'fallocate64', None) or libc.fallocate
+        fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+        
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            reserved = fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, size) == 0
+        finally:
+            os.close(fd)
+        
+        if not reserved:
+            os.unlink(path)
+        return reserved
+    
+    except (ImportError, OSError, AttributeError):
+        return False
+
+
+def _release_preallocation(path):
+    """
+    Libère l'espace réservé au-delà de la fin d'un fichier de capture
+    
+    Args:
+        path (Path): Chemin du fichier de capture
+    """
+    try:
+        os.truncate(path, os.path.getsize(path))
+    except OSError:
+        pass
+
+
+def _discard_preallocation(path):
+    """
+    Libère l'espace réservé pour une capture échouée : le fichier est supprimé
+    s'il est resté vide, sinon ramené à sa taille réelle
+    
+    Args:
+        path (Path): Chemin du fichier de capture
+    """
+    try:
+        size = os.path.getsize(path)
+        if size == 0:
+            os.unlink(path)
+        else:
+            os.truncate(path, size)
+    except OSError:
+        pass
+
+
+def _drop_page_cache(path):
+    """
+    Demande au noyau de retirer un fichier du cache de pages, pour ne pas
+    évincer les pages du système analysé au profit de l'image capturée
+    
+    Args:
+        path (Path): Chemin du fichier
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def _detect_tools(system, search_paths):
+    """
+    Recherche les outils de capture mémoire dans les chemins donnés
+    
+    Chaque répertoire est lu une seule fois avec os.scandir ; seuls les fichiers
+    dont le nom correspond à un outil recherché sont ensuite vérifiés.
+    
+    Args:
+        system (str): Nom de la plateforme (platform.system())
+        search_paths (tuple): Répertoires de recherche, par ordre de priorité
+        
+    Returns:
+        dict: Dictionnaire des outils disponibles avec leur chemin
+    """
+    tools = {}
+    
+    # LiME est un module noyau, hors des chemins de recherche
+    if system == "Linux":
+        lime_mod = "/lib/modules/{}/misc/lime.ko".format(platform.release())
+        if os.path.isfile(lime_mod):
+            tools["lime"] = lime_mod
+    
+    executables = _TOOL_EXECUTABLES.get(system, {"memdump": ["memdump"]})
+    names = _TOOL_NAMES.get(system, {"memdump": ("memdump", 0)})
+    
+    for path in search_paths:
+        if all(tool in tools for tool in executables):
+            break
+        
+        # Meilleur candidat de chaque outil dans ce répertoire : (rang de préférence, chemin)
+        found = {}
+        try:
+            with os.scandir(path or ".") as entries:
+                for entry in entries:
+                    match = names.get(os.path.normcase(entry.name))
+                    if match is None or match[0] in tools:
+                        continue
+                    
+                    tool, rank = match
+                    if tool in found and found[tool][0] <= rank:
+                        continue
+                    
+                    # is_file() et stat() partagent les informations lues pour l'entrée
+                    try:
+                        if entry.is_file() and (system == "Windows" or entry.stat().st_mode & 0o111):
+                            found[tool] = (rank, entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        
+        # Exécutables dans un sous-répertoire (bundle .app)
+        for tool, candidates in executables.items():
+            if tool in tools or tool in found:
+                continue
+            for name in candidates:
+                full_path = os.path.join(path, name)
+                if "/" in name and os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+                    found[tool] = (0, full_path)
+                    break
+        
+        for tool, (_, full_path) in found.items():
+            tools[tool] = full_path
+    
+    return tools
+
+
 class MemoryCollector:
     """
     Classe pour la collecte de la mémoire RAM
     """
     
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, shards=1):
         """
         Initialise le collecteur de mémoire
         
         Args:
             output_dir (str): Répertoire de sortie pour les preuves collectées
+            shards (int): Nombre de segments capturés en parallèle avec dd (1 = capture unique)
         """
         self.name = "Memory Collector"
+        self.shards = max(1, shards)
         self.output_dir = Path(output_dir) / "memory"
         self.output_dir.mkdir(exist_ok=True)
         self.logger = ForensicLogger("memory_collector")
         
+        # Horodatage commun aux noms des captures de ce collecteur
+        self._timestamp_prefix = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         # Déterminer les outils disponibles
         self.available_tools = self._detect_memory_tools()
         
@@ -46,13 +487,46 @@ class MemoryCollector:
             self.logger.warning("Aucun outil de capture mémoire n'a été détecté sur le système")
         else:
             self.logger.info(f"Outils de capture mémoire détectés: {', '.join(self.available_tools.keys())}")
+        
+        # Méthode de capture spécialisée pour chaque outil détecté (chemin lié une fois pour toutes)
+        capture_methods = {
+            "winpmem": self._capture_with_winpmem,
+            "lime": self._capture_with_lime,
+            "osxpmem": self._capture_with_osxpmem,
+            "avml": self._capture_with_avml,
+            "memdump": self._capture_with_memdump,
+            "dd": (functools.partial(self._capture_with_dd_sharded, shards=self.shards)
+                   if self.shards > 1 else self._capture_with_dd)
+        }
+        self._capture_methods = {
+            tool: functools.partial(capture_methods[tool], tool_path=tool_path)
+            for tool, tool_path in self.available_tools.items()
+            if tool in capture_methods
+        }
+        
+        # Captures compressées à la volée : seul dd produit l'image sur sa sortie standard
+        zstd_path = shutil.which("zstd")
+        self._compressed_capture_methods = {}
+        if zstd_path and "dd" in self.available_tools:
+            self._compressed_capture_methods["dd"] = functools.partial(
+                self._capture_with_dd_compressed, tool_path=self.available_tools["dd"], zstd_path=zstd_path
+            )
+        
+        # Interroger la version de l'outil retenu en arrière-plan, pendant le reste de l'initialisation
+        self._version_futures = {}
+        best_tool = self._select_best_tool()
+        if best_tool in _VERSIONED_TOOLS:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._version_futures[best_tool] = executor.submit(_query_tool_version, self.available_tools[best_tool])
+            executor.shutdown(wait=False)
     
-    def collect(self, evidence_manager):
+    def collect(self, evidence_manager, compress=False):
         """
         Collecte une image de la mémoire RAM
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            compress (bool): Compresser l'image à la volée avec zstd lorsque l'outil le permet
             
         Returns:
             bool: True si la collecte a réussi, False sinon
@@ -71,22 +545,76 @@ class MemoryCollector:
         
         self.logger.info(f"Utilisation de l'outil {selected_tool} pour la capture mémoire")
         
-        # Exécuter la méthode de capture appropriée
-        if selected_tool == "winpmem":
-            return self._capture_with_winpmem(evidence_manager)
-        elif selected_tool == "lime":
-            return self._capture_with_lime(evidence_manager)
-        elif selected_tool == "osxpmem":
-            return self._capture_with_osxpmem(evidence_manager)
-        elif selected_tool == "avml":
-            return self._capture_with_avml(evidence_manager)
-        elif selected_tool == "memdump":
-            return self._capture_with_memdump(evidence_manager)
-        elif selected_tool == "dd":
-            return self._capture_with_dd(evidence_manager)
-        else:
+        return self._dispatch(selected_tool, evidence_manager, compress)
+    
+    def collect_all(self, evidence_manager, tool_names=None):
+        """
+        Collecte plusieurs images de la mémoire RAM en parallèle avec des outils
+        indépendants (capture redondante pour vérification croisée)
+        
+        Args:
+            evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_names (list, optional): Outils à utiliser (par défaut, tous les outils détectés)
+            
+        Returns:
+            dict: Résultat de la capture (bool) par outil
+        """
+        if tool_names is None:
+            tool_names = list(self.available_tools)
+        
+        # Vérifier les privilèges
+        if not check_privileges():
+            self.logger.error("Privilèges administrateur requis pour la capture de la mémoire")
+            return dict.fromkeys(tool_names, False)
+        
+        self.logger.info(f"Captures mémoire parallèles avec: {', '.join(tool_names)}")
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(tool_names))) as executor:
+            futures = {executor.submit(self._dispatch, tool, evidence_manager): tool for tool in tool_names}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def _capture_timestamp(self):
+        """
+        Génère un horodatage unique pour nommer une capture
+        
+        Returns:
+            str: Horodatage du collecteur suivi d'un compteur monotone en nanosecondes
+        """
+        return f"{self._timestamp_prefix}_{time.monotonic_ns()}"
+    
+    def _dispatch(self, selected_tool, evidence_manager, compress=False):
+        """
+        Exécute la méthode de capture correspondant à un outil
+        
+        Args:
+            selected_tool (str): Nom de l'outil
+            evidence_manager (EvidenceManager): Gestionnaire de preuves
+            compress (bool): Compresser l'image à la volée avec zstd lorsque l'outil le permet
+            
+        Returns:
+            bool: True si la capture a réussi, False sinon
+        """
+        if selected_tool not in self.available_tools:
+            self.logger.error(f"Outil de capture mémoire non disponible: {selected_tool}")
+            return False
+        
+        capture_method = self._capture_methods.get(selected_tool)
+        if compress:
+            if selected_tool in self._compressed_capture_methods:
+                capture_method = self._compressed_capture_methods[selected_tool]
+            else:
+                self.logger.warning(f"Compression à la volée non disponible pour {selected_tool}, capture non compressée")
+        if capture_method is None:
             self.logger.error(f"Outil de capture mémoire non supporté: {selected_tool}")
             return False
+        
+        # Les outils qui chargent un composant noyau ne s'exécutent jamais simultanément
+        with _CAPTURE_LOCKS[_TOOL_KINDS.get(selected_tool, selected_tool)]:
+            return capture_method(evidence_manager)
     
     def _detect_memory_tools(self):
         """
@@ -95,8 +623,6 @@ class MemoryCollector:
         Returns:
             dict: Dictionnaire des outils disponibles avec leur chemin
         """
-        tools = {}
-        
         # Chemins de recherche
         search_paths = os.environ.get("PATH", "").split(os.pathsep)
         extra_paths = [
@@ -106,70 +632,12 @@ class MemoryCollector:
             os.path.join(os.path.dirname(os.path.dirname(__file__)), "bin"),
             os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "bin")
         ]
-        search_paths.extend(extra_paths)
-        
-        # Windows
-        if platform.system() == "Windows":
-            winpmem_names = ["winpmem.exe", "winpmem_x64.exe", "winpmem_x86.exe"]
-            for path in search_paths:
-                for name in winpmem_names:
-                    full_path = os.path.join(path, name)
-                    if os.path.isfile(full_path):
-                        tools["winpmem"] = full_path
-                        break
-                if "winpmem" in tools:
-                    break
-        
-        # Linux
-        elif platform.system() == "Linux":
-            # LiME
-            lime_mod = "/lib/modules/{}/misc/lime.ko".format(platform.release())
-            if os.path.isfile(lime_mod):
-                tools["lime"] = lime_mod
-            
-            # AVML
-            avml_names = ["avml"]
-            for path in search_paths:
-                for name in avml_names:
-                    full_path = os.path.join(path, name)
-                    if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
-                        tools["avml"] = full_path
-                        break
-                if "avml" in tools:
-                    break
-            
-            # dd (fallback)
-            for path in search_paths:
-                dd_path = os.path.join(path, "dd")
-                if os.path.isfile(dd_path) and os.access(dd_path, os.X_OK):
-                    tools["dd"] = dd_path
-                    break
         
-        # macOS
-        elif platform.system() == "Darwin":
-            # OSXPmem
-            osxpmem_names = ["osxpmem", "osxpmem.app/osxpmem"]
-            for path in search_paths:
-                for name in osxpmem_names:
-                    full_path = os.path.join(path, name)
-                    if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
-                        tools["osxpmem"] = full_path
-                        break
-                if "osxpmem" in tools:
-                    break
+        # Répertoires résolus puis dédoublonnés (ordre conservé) : chacun n'est lu qu'une fois
+        search_paths = list(dict.fromkeys(os.path.realpath(path) for path in search_paths + extra_paths))
         
-        # Outils multi-plateformes
-        memdump_names = ["memdump"]
-        for path in search_paths:
-            for name in memdump_names:
-                full_path = os.path.join(path, name)
-                if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
-                    tools["memdump"] = full_path
-                    break
-            if "memdump" in tools:
-                break
-        
-        return tools
+        # Copie : le résultat mis en cache est partagé entre les instances
+        return dict(_detect_tools(_SYSTEM, tuple(search_paths)))
     
     def _select_best_tool(self):
         """
@@ -179,14 +647,7 @@ class MemoryCollector:
             str: Nom de l'outil sélectionné ou None si aucun n'est disponible
         """
         # Ordre de préférence par plateforme
-        if platform.system() == "Windows":
-            preferences = ["winpmem", "memdump"]
-        elif platform.system() == "Linux":
-            preferences = ["lime", "avml", "dd", "memdump"]
-        elif platform.system() == "Darwin":
-            preferences = ["osxpmem", "memdump"]
-        else:
-            preferences = ["memdump"]
+        preferences = _TOOL_PREFERENCES.get(_SYSTEM, ["memdump"])
         
         for tool in preferences:
             if tool in self.available_tools:
@@ -194,42 +655,125 @@ class MemoryCollector:
         
         return None
     
-    def _capture_with_winpmem(self, evidence_manager):
+    def _run_capture_tool(self, command, log_name):
+        """
+        Exécute un outil de capture sans faire transiter ses sorties par Python
+        
+        Les sorties standard et d'erreur sont écrites directement dans des journaux
+        du répertoire de sortie ; seule leur fin est relue pour les métadonnées.
+        
+        Args:
+            command (list): Commande à exécuter
+            log_name (str): Nom de base des fichiers journaux
+            
+        Returns:
+            tuple: (code de retour, fin de la sortie standard, fin de la sortie d'erreur)
+        """
+        stdout_path = self.output_dir / f"{log_name}.stdout.log"
+        stderr_path = self.output_dir / f"{log_name}.stderr.log"
+        
+        if hasattr(os, 'posix_spawnp'):
+            # posix_spawn (vfork + exec) : pas de duplication de l'espace mémoire du
+            # collecteur, ce qui évite un ENOMEM quand la machine est déjà sous pression
+            pid = _spawn_detached(command, [
+                (os.POSIX_SPAWN_OPEN, 1, str(stdout_path), LOG_OPEN_FLAGS, 0o600),
+                (os.POSIX_SPAWN_OPEN, 2, str(stderr_path), LOG_OPEN_FLAGS, 0o600)
+            ])
+            _, status = os.waitpid(pid, 0)
+            returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        else:
+            with open(stdout_path, 'wb') as stdout_file, open(stderr_path, 'wb') as stderr_file:
+                returncode = subprocess.run(command, stdout=stdout_file, stderr=stderr_file, close_fds=True,
+                                            check=False, **_DETACHED_POPEN_KWARGS).returncode
+        
+        return returncode, _read_log_tail(stdout_path), _read_log_tail(stderr_path)
+    
+    def _run_capture_pipeline(self, producer, consumer, log_name):
+        """
+        Exécute un outil de capture dont la sortie standard alimente directement
+        un second processus (compression), sans transiter par Python
+        
+        Args:
+            producer (list): Commande de capture, qui écrit l'image sur sa sortie standard
+            consumer (list): Commande qui lit l'image sur son entrée standard
+            log_name (str): Nom de base des fichiers journaux
+            
+        Returns:
+            tuple: (code de retour, fin de la sortie standard, fin de la sortie d'erreur)
+        """
+        stdout_path = self.output_dir / f"{log_name}.stdout.log"
+        stderr_path = self.output_dir / f"{log_name}.stderr.log"
+        consumer_stderr_path = self.output_dir / f"{log_name}.{Path(consumer[0]).name}.stderr.log"
+        
+        if hasattr(os, 'posix_spawnp'):
+            read_fd, write_fd = os.pipe()
+            try:
+                producer_pid = _spawn_detached(producer, [
+                    (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                    (os.POSIX_SPAWN_CLOSE, read_fd),
+                    (os.POSIX_SPAWN_OPEN, 2, str(stderr_path), LOG_OPEN_FLAGS, 0o600)
+                ])
+                consumer_pid = _spawn_detached(consumer, [
+                    (os.POSIX_SPAWN_DUP2, read_fd, 0),
+                    (os.POSIX_SPAWN_CLOSE, write_fd),
+                    (os.POSIX_SPAWN_OPEN, 1, str(stdout_path), LOG_OPEN_FLAGS, 0o600),
+                    (os.POSIX_SPAWN_OPEN, 2, str(consumer_stderr_path), LOG_OPEN_FLAGS, 0o600)
+                ])
+            finally:
+                # Le tube n'appartient plus qu'aux deux processus
+                os.close(read_fd)
+                os.close(write_fd)
+            
+            returncodes = []
+            for pid in (producer_pid, consumer_pid):
+                _, status = os.waitpid(pid, 0)
+                returncodes.append(os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status))
+        else:
+            with open(stdout_path, 'wb') as stdout_file, open(stderr_path, 'wb') as stderr_file, \
+                    open(consumer_stderr_path, 'wb') as consumer_stderr_file:
+                producer_process = subprocess.Popen(producer, stdout=subprocess.PIPE, stderr=stderr_file,
+                                                    close_fds=True, **_DETACHED_POPEN_KWARGS)
+                consumer_process = subprocess.Popen(consumer, stdin=producer_process.stdout,
+                                                    stdout=stdout_file, stderr=consumer_stderr_file,
+                                                    close_fds=True, **_DETACHED_POPEN_KWARGS)
+                producer_process.stdout.close()
+                returncodes = [producer_process.wait(), consumer_process.wait()]
+        
+        returncode = next((code for code in returncodes if code != 0), 0)
+        stderr = _read_log_tail(stderr_path) + _read_log_tail(consumer_stderr_path)
+        return returncode, _read_log_tail(stdout_path), stderr
+    
+    def _capture_with_winpmem(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec WinPmem
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.raw"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_winpmem_{timestamp}.raw"
             
             # Construire la commande
-            winpmem_path = self.available_tools["winpmem"]
+            winpmem_path = tool_path or self.available_tools["winpmem"]
             command = [winpmem_path, "-o", str(output_file), "--format", "raw"]
             
             self.logger.info(f"Démarrage de la capture mémoire avec WinPmem: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            stdout, stderr = process.communicate()
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"winpmem_{timestamp}")
             
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec WinPmem: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
@@ -243,11 +787,12 @@ class MemoryCollector:
                     "tool_version": self._get_tool_version("winpmem"),
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -256,47 +801,42 @@ class MemoryCollector:
             self.logger.error(f"Exception lors de la capture mémoire avec WinPmem: {str(e)}")
             return False
     
-    def _capture_with_lime(self, evidence_manager):
+    def _capture_with_lime(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec LiME (Linux Memory Extractor)
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.lime"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_lime_{timestamp}.lime"
             
             # Charger le module LiME
-            lime_path = self.available_tools["lime"]
+            lime_path = tool_path or self.available_tools["lime"]
             format_arg = "raw"  # ou "lime" pour le format LiME
             
             command = ["insmod", lime_path, f"path={output_file}", f"format={format_arg}"]
             
             self.logger.info(f"Démarrage de la capture mémoire avec LiME: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            stdout, stderr = process.communicate()
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"lime_{timestamp}")
             
             # Le module s'auto-décharge après la capture
             # Attendre qu'il termine
             
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec LiME: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
@@ -311,11 +851,12 @@ class MemoryCollector:
                     "format": format_arg,
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -324,42 +865,37 @@ class MemoryCollector:
             self.logger.error(f"Exception lors de la capture mémoire avec LiME: {str(e)}")
             return False
     
-    def _capture_with_osxpmem(self, evidence_manager):
+    def _capture_with_osxpmem(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec OSXPmem
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.raw"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_osxpmem_{timestamp}.raw"
             
             # Construire la commande
-            osxpmem_path = self.available_tools["osxpmem"]
+            osxpmem_path = tool_path or self.available_tools["osxpmem"]
             command = [osxpmem_path, str(output_file)]
             
             self.logger.info(f"Démarrage de la capture mémoire avec OSXPmem: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            stdout, stderr = process.communicate()
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"osxpmem_{timestamp}")
             
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec OSXPmem: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
@@ -373,11 +909,12 @@ class MemoryCollector:
                     "tool_version": self._get_tool_version("osxpmem"),
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -386,42 +923,37 @@ class MemoryCollector:
             self.logger.error(f"Exception lors de la capture mémoire avec OSXPmem: {str(e)}")
             return False
     
-    def _capture_with_avml(self, evidence_manager):
+    def _capture_with_avml(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec AVML (Azure VM Linux Memory)
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.lime"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_avml_{timestamp}.lime"
             
             # Construire la commande
-            avml_path = self.available_tools["avml"]
+            avml_path = tool_path or self.available_tools["avml"]
             command = [avml_path, str(output_file)]
             
             self.logger.info(f"Démarrage de la capture mémoire avec AVML: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"avml_{timestamp}")
             
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec AVML: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
@@ -435,11 +967,12 @@ class MemoryCollector:
                     "tool_version": self._get_tool_version("avml"),
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -448,48 +981,43 @@ class MemoryCollector:
             self.logger.error(f"Exception lors de la capture mémoire avec AVML: {str(e)}")
             return False
     
-    def _capture_with_memdump(self, evidence_manager):
+    def _capture_with_memdump(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec memdump
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.raw"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_memdump_{timestamp}.raw"
             
             # Construire la commande
-            memdump_path = self.available_tools["memdump"]
+            memdump_path = tool_path or self.available_tools["memdump"]
             command = [memdump_path, "-o", str(output_file)]
             
             self.logger.info(f"Démarrage de la capture mémoire avec memdump: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            stdout, stderr = process.communicate()
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"memdump_{timestamp}")
             
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec memdump: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
             # Ajouter la preuve au gestionnaire
             evidence_id = evidence_manager.add_memory_evidence(
-                platform.system(),
+                _SYSTEM,
                 f"Capture mémoire complète ({output_file.name})",
                 str(output_file),
                 {
@@ -497,11 +1025,12 @@ class MemoryCollector:
                     "tool_version": self._get_tool_version("memdump"),
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -510,19 +1039,22 @@ class MemoryCollector:
             self.logger.error(f"Exception lors de la capture mémoire avec memdump: {str(e)}")
             return False
     
-    def _capture_with_dd(self, evidence_manager):
+    def _capture_with_dd(self, evidence_manager, tool_path=None):
         """
         Capture la mémoire avec dd (Linux uniquement)
         
         Args:
             evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
             
         Returns:
             bool: True si la capture a réussi, False sinon
         """
+        # Espace réservé à libérer si la capture échoue
+        preallocated = None
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"memory_dump_{timestamp}.raw"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_dd_{timestamp}.raw"
             
             # Vérifier si /proc/kcore est disponible
             if not Path("/proc/kcore").exists():
@@ -530,30 +1062,33 @@ class MemoryCollector:
                 return False
             
             # Construire la commande
-            dd_path = self.available_tools["dd"]
-            command = [dd_path, "if=/proc/kcore", f"of={output_file}", "bs=4M"]
+            dd_path = tool_path or self.available_tools["dd"]
+            # Espace de l'image réservé à l'avance ; notrunc pour que dd conserve la réservation
+            if _preallocate(output_file, _get_mem_total()):
+                preallocated = output_file
+            conv = "conv=notrunc,fsync" if preallocated else "conv=fsync"
+            # nocache + fsync : l'image ne reste pas dans le cache de pages
+            command = [dd_path, "if=/proc/kcore", f"of={output_file}", "bs=4M", "oflag=nocache", conv]
             
             self.logger.info(f"Démarrage de la capture mémoire avec dd: {' '.join(command)}")
             
-            # Exécuter la commande
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            stdout, stderr = process.communicate()
+            # Exécuter la commande, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_tool(command, f"dd_{timestamp}")
             
-            if process.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"Erreur lors de la capture mémoire avec dd: {stderr}")
                 return False
             
             # Vérifier que le fichier a été créé et n'est pas vide
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            output_size = _file_size(output_file)
+            if output_size == 0:
                 self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
                 return False
             
+            _release_preallocation(output_file)
+            preallocated = None
+            _drop_page_cache(output_file)
+            
             # Ajouter la preuve au gestionnaire
             evidence_id = evidence_manager.add_memory_evidence(
                 f"Linux {platform.release()}",
@@ -564,11 +1099,12 @@ class MemoryCollector:
                     "source": "/proc/kcore",
                     "raw_stdout": stdout,
                     "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
                     "command": " ".join(command)
                 }
             )
             
-            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_file.stat().st_size} octets)")
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
             self.logger.info(f"ID de preuve: {evidence_id}")
             
             return True
@@ -576,43 +1112,222 @@ class MemoryCollector:
         except Exception as e:
             self.logger.error(f"Exception lors de la capture mémoire avec dd: {str(e)}")
             return False
+        
+        finally:
+            if preallocated is not None:
+                _discard_preallocation(preallocated)
     
-    def _get_tool_version(self, tool_name):
+    def _capture_with_dd_compressed(self, evidence_manager, tool_path=None, zstd_path="zstd"):
         """
-        Obtient la version d'un outil
+        Capture la mémoire avec dd en compressant l'image à la volée avec zstd
+        (Linux uniquement)
         
         Args:
-            tool_name (str): Nom de l'outil
+            evidence_manager (EvidenceManager): Gestionnaire de preuves
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
+            zstd_path (str): Chemin de l'exécutable zstd
             
         Returns:
-            str: Version de l'outil ou "Unknown" si impossible à déterminer
+            bool: True si la capture a réussi, False sinon
         """
-        if tool_name not in self.available_tools:
-            return "Unknown"
+        try:
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_dd_{timestamp}.raw.zst"
+            
+            # Vérifier si /proc/kcore est disponible
+            if not Path("/proc/kcore").exists():
+                self.logger.error("Impossible de capturer la mémoire avec dd: /proc/kcore n'est pas disponible")
+                return False
+            
+            # Construire les commandes : dd écrit sur sa sortie standard, lue par zstd
+            dd_path = tool_path or self.available_tools["dd"]
+            capture_command = [dd_path, "if=/proc/kcore", "bs=4M"]
+            compress_command = [zstd_path] + ZSTD_OPTIONS + ["-o", str(output_file)]
+            command = " ".join(capture_command) + " | " + " ".join(compress_command)
+            
+            self.logger.info(f"Démarrage de la capture mémoire compressée avec dd: {command}")
+            
+            # Exécuter la chaîne de commandes, sorties redirigées vers des journaux sur disque
+            returncode, stdout, stderr = self._run_capture_pipeline(capture_command, compress_command, f"dd_{timestamp}")
+            
+            if returncode != 0:
+                self.logger.error(f"Erreur lors de la capture mémoire avec dd: {stderr}")
+                return False
+            
+            # Vérifier que le fichier a été créé et n'est pas vide
+            output_size = _file_size(output_file)
+            if output_size == 0:
+                self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
+                return False
+            
+            _drop_page_cache(output_file)
+            
+            # Taille de l'image avant compression, d'après le bilan de dd
+            match = _DD_BYTES_RE.search(stderr)
+            
+            # Ajouter la preuve au gestionnaire
+            evidence_id = evidence_manager.add_memory_evidence(
+                f"Linux {platform.release()}",
+                f"Capture mémoire compressée via /proc/kcore ({output_file.name})",
+                str(output_file),
+                {
+                    "tool": "dd",
+                    "source": "/proc/kcore",
+                    "compression": "zstd",
+                    "decompressed_size": int(match.group(1)) if match else None,
+                    "compressed_size": output_size,
+                    "raw_stdout": stdout,
+                    "raw_stderr": stderr,
+                    "sha256": self._hash_dump(output_file),
+                    "command": command
+                }
+            )
+            
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
+            self.logger.info(f"ID de preuve: {evidence_id}")
+            
+            return True
         
-        tool_path = self.available_tools[tool_name]
+        except Exception as e:
+            self.logger.error(f"Exception lors de la capture mémoire avec dd: {str(e)}")
+            return False
+    
+    def _capture_with_dd_sharded(self, evidence_manager, shards=4, tool_path=None):
+        """
+        Capture la mémoire avec plusieurs dd lancés en parallèle sur des plages
+        disjointes de /proc/kcore, puis assemble les segments (Linux uniquement)
         
+        Args:
+            evidence_manager (EvidenceManager): Gestionnaire de preuves
+            shards (int): Nombre de segments capturés en parallèle
+            tool_path (str, optional): Chemin de l'outil (par défaut, celui détecté)
+            
+        Returns:
+            bool: True si la capture a réussi, False sinon
+        """
+        # Segments à supprimer si la capture échoue
+        shard_files = []
         try:
-            if tool_name == "winpmem":
-                command = [tool_path, "--version"]
-            elif tool_name == "avml":
-                command = [tool_path, "--version"]
-            elif tool_name == "osxpmem":
-                command = [tool_path, "--version"]
-            elif tool_name == "memdump":
-                command = [tool_path, "--version"]
-            else:
-                return "Unknown"
+            timestamp = self._capture_timestamp()
+            output_file = self.output_dir / f"memory_dump_dd_{timestamp}.raw"
             
-            output = subprocess.check_output(command, stderr=subprocess.STDOUT, universal_newlines=True)
+            # Vérifier si /proc/kcore est disponible
+            if not Path("/proc/kcore").exists():
+                self.logger.error("Impossible de capturer la mémoire avec dd: /proc/kcore n'est pas disponible")
+                return False
+            
+            # Découper l'étendue complète de /proc/kcore (et non MemTotal, qui ne couvre pas
+            # l'espace d'adressage physique et ses trous) en plages de blocs de 4 Mo, pour
+            # une image identique à celle de la capture en un seul flux
+            kcore_extent = _get_kcore_extent()
+            if not kcore_extent:
+                self.logger.warning("Étendue de /proc/kcore inconnue, capture dd en un seul flux")
+                return self._capture_with_dd(evidence_manager, tool_path)
+            
+            total_blocks = -(-kcore_extent // DD_BLOCK_SIZE)
+            blocks_per_shard = -(-total_blocks // shards)
+            
+            dd_path = tool_path or self.available_tools["dd"]
+            commands = []
+            for index, skip in enumerate(range(0, total_blocks, blocks_per_shard)):
+                shard_file = self.output_dir / f"memory_dump_dd_{timestamp}.shard{index}"
+                count = min(blocks_per_shard, total_blocks - skip)
+                shard_files.append(shard_file)
+                conv = "conv=notrunc,fsync" if _preallocate(shard_file, count * DD_BLOCK_SIZE) else "conv=fsync"
+                commands.append([dd_path, "if=/proc/kcore", f"of={shard_file}", "bs=4M",
+                                 f"skip={skip}", f"count={count}", "oflag=nocache", conv])
+            
+            self.logger.info(f"Démarrage de la capture mémoire avec dd en {len(commands)} segments parallèles")
+            
+            # Phase 1 : écriture parallèle des segments
+            with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+                results = list(executor.map(
+                    lambda item: self._run_capture_tool(item[1], f"dd_{timestamp}_shard{item[0]}"),
+                    enumerate(commands)
+                ))
+            
+            failed = [stderr for returncode, _, stderr in results if returncode != 0]
+            if failed:
+                self.logger.error(f"Erreur lors de la capture mémoire avec dd: {failed[0]}")
+                return False
             
-            # Extraire la version de la sortie (dépend du format de sortie de chaque outil)
-            if "version" in output.lower():
-                for line in output.splitlines():
-                    if "version" in line.lower():
-                        return line.strip()
+            # Phase 2 : assemblage des segments dans l'image finale
+            _concatenate_files(shard_files, output_file)
+            for shard_file in shard_files:
+                shard_file.unlink()
+            shard_files = []
             
-            return output.strip()
+            # Vérifier que le fichier a été créé et n'est pas vide
+            output_size = _file_size(output_file)
+            if output_size == 0:
+                self.logger.error(f"La capture mémoire n'a pas généré de fichier valide: {output_file}")
+                return False
+            
+            _drop_page_cache(output_file)
+            
+            # Ajouter la preuve au gestionnaire
+            evidence_id = evidence_manager.add_memory_evidence(
+                f"Linux {platform.release()}",
+                f"Capture mémoire via /proc/kcore ({output_file.name})",
+                str(output_file),
+                {
+                    "tool": "dd",
+                    "source": "/proc/kcore",
+                    "shards": len(commands),
+                    "kcore_extent": kcore_extent,
+                    "raw_stdout": "".join(stdout for _, stdout, _ in results),
+                    "raw_stderr": "".join(stderr for _, _, stderr in results),
+                    "sha256": self._hash_dump(output_file),
+                    "command": "; ".join(" ".join(command) for command in commands)
+                }
+            )
+            
+            self.logger.info(f"Capture mémoire réussie: {output_file} ({output_size} octets)")
+            self.logger.info(f"ID de preuve: {evidence_id}")
+            
+            return True
         
-        except Exception:
+        except Exception as e:
+            self.logger.error(f"Exception lors de la capture mémoire avec dd: {str(e)}")
+            return False
+        
+        finally:
+            # Segments d'une capture échouée (et leur espace réservé) supprimés
+            for shard_file in shard_files:
+                try:
+                    shard_file.unlink()
+                except OSError:
+                    pass
+    
+    def _hash_dump(self, path):
+        """
+        Calcule l'empreinte SHA-256 d'une image mémoire dès la fin de la capture
+        (projection en mémoire lue séquentiellement pour les images volumineuses)
+        
+        Args:
+            path (Path): Chemin de l'image mémoire
+            
+        Returns:
+            str: Empreinte SHA-256 ou None si le calcul a échoué
+        """
+        return calculate_file_hash(str(path), ['sha256']).get('sha256')
+    
+    def _get_tool_version(self, tool_name):
+        """
+        Obtient la version d'un outil
+        
+        Args:
+            tool_name (str): Nom de l'outil
+            
+        Returns:
+            str: Version de l'outil ou "Unknown" si impossible à déterminer
+        """
+        if tool_name not in self.available_tools or tool_name not in _VERSIONED_TOOLS:
             return "Unknown"
+        
+        # Interrogation lancée en avance à l'initialisation
+        future = self._version_futures.get(tool_name)
+        if future is not None:
+            return future.result()
+        
+        return _query_tool_version(self.available_tools[tool_name])
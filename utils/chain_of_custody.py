@@ -15,9 +15,29 @@ import hashlib
 import platform
 import logging
 import getpass
+import threading
 import uuid
 from pathlib import Path
 
+from utils import serialization
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Taille des blocs lus pour le hachage des fichiers de preuve (Python < 3.11)
+HASH_BLOCK_SIZE = 1024 * 1024  # 1 Mo
+
+# Algorithmes enregistrés dans la chaîne de preuve : SHA-256 (valeur légale) et
+# BLAKE3 (hachage en arbre multi-cœur, pour les contrôles d'intégrité rapides)
+CUSTODY_HASH_ALGORITHMS = ("sha256", "blake3")
+
+# Valeur de "prev_hash" de la première entrée du journal d'audit chaîné
+AUDIT_CHAIN_GENESIS = "0" * 64
+
 
 class ChainOfCustody:
     """
@@ -35,11 +55,38 @@ class ChainOfCustody:
         self.case_id = case_id
         self.output_dir = output_dir
         self.custody_file = os.path.join(output_dir, "chain_of_custody.json")
+        
+        # Journaux JSON Lines alimentés en continu ; le document complet n'est écrit
+        # qu'à l'initialisation et à la finalisation du cas
+        self.evidence_journal = os.path.join(output_dir, "chain_of_custody_evidence.jsonl")
+        self.audit_journal = os.path.join(output_dir, "chain_of_custody_audit.jsonl")
+        self._pending_evidence = {}
+        self._pending_audit = []
+        
+        # Protège l'état du cas, le chaînage de l'audit et l'écriture des journaux : les
+        # événements peuvent être appliqués par un thread d'arrière-plan (EvidenceManager)
+        # pendant que le thread principal vérifie ou finalise le cas
+        self._lock = threading.RLock()
+        
+        # Preuves du cas par identifiant (mêmes objets que case_data["evidence_items"])
+        self._evidence_index = {}
         self.evidence_log = []
         self.start_time = datetime.datetime.now()
         self.end_time = None
         self.operator = getpass.getuser()
         self.system_info = self._get_system_info()
+        
+        # Champs constants de toutes les entrées d'audit
+        self._audit_template = {
+            "user": self.operator,
+            "hostname": self.system_info["hostname"]
+        }
+        
+        # Chaînage du journal d'audit : chaque entrée scelle le hash de la précédente
+        self._last_audit_hash = AUDIT_CHAIN_GENESIS
+        
+        # Hashes déjà calculés, par (algorithme, chemin, inode, taille, mtime, ctime)
+        self._hash_cache = {}
     
     def _get_system_info(self):
         """
@@ -62,17 +109,30 @@ class ChainOfCustody:
         """
         Initialise un nouveau cas d'investigation
         """
-        self.case_data = {
-            "case_id": self.case_id,
-            "start_time": self.start_time.isoformat(),
-            "operator": self.operator,
-            "collection_system": self.system_info,
-            "evidence_items": [],
-            "audit_log": [self._create_audit_entry("Case initialized")]
-        }
-        
-        # Créer le fichier initial de chaîne de preuve
-        self._save_custody_file()
+        with self._lock:
+            self.case_data = {
+                "case_id": self.case_id,
+                "start_time": self.start_time.isoformat(),
+                "operator": self.operator,
+                "collection_system": self.system_info,
+                "evidence_items": [],
+                "audit_log": []
+            }
+            self._evidence_index = {}
+            self._pending_evidence = {}
+            self._pending_audit = []
+            self._last_audit_hash = AUDIT_CHAIN_GENESIS
+            
+            # Repartir de journaux vides pour ce cas
+            for journal in (self.evidence_journal, self.audit_journal):
+                if os.path.exists(journal):
+                    os.unlink(journal)
+            
+            self._append_audit_entry("Case initialized")
+            
+            # Créer le fichier initial de chaîne de preuve
+            self._flush_journals()
+            self._save_custody_file()
         logging.info(f"Chaîne de preuve initialisée pour le cas {self.case_id}")
     
     def add_evidence(self, evidence_id, evidence_type, source, description, metadata=None):
@@ -89,28 +149,9 @@ class ChainOfCustody:
         Returns:
             str: Identifiant de la preuve ajoutée
         """
-        if metadata is None:
-            metadata = {}
-        
-        timestamp = datetime.datetime.now()
-        
-        evidence_item = {
-            "evidence_id": evidence_id,
-            "type": evidence_type,
-            "source": source,
-            "description": description,
-            "metadata": metadata,
-            "timestamp": timestamp.isoformat(),
-            "added_by": self.operator,
-        }
-        
-        self.case_data["evidence_items"].append(evidence_item)
-        self.case_data["audit_log"].append(
-            self._create_audit_entry(f"Evidence added: {evidence_id} ({evidence_type})")
-        )
-        
-        self._save_custody_file()
-        logging.info(f"Preuve {evidence_id} ajoutée à la chaîne de preuve")
+        with self._lock:
+            self._record_evidence(evidence_id, evidence_type, source, description, metadata)
+            self._flush_journals()
         
         return evidence_id
     
@@ -121,84 +162,209 @@ class ChainOfCustody:
         Args:
             evidence_id (str): Identifiant de la preuve à mettre à jour
             status (str): Nouveau statut de la preuve
-            hash_value (str, optional): Valeur de hachage de la preuve
+            hash_value (str|dict, optional): Hash SHA-256 de la preuve, ou dictionnaire
+                                             {algorithme: hash} (voir CUSTODY_HASH_ALGORITHMS)
             location (str, optional): Emplacement de stockage de la preuve
             metadata (dict, optional): Métadonnées supplémentaires
+        
+        Returns:
+            bool: True si la preuve a été mise à jour, False si elle est inconnue
         """
-        for evidence in self.case_data["evidence_items"]:
-            if evidence["evidence_id"] == evidence_id:
-                evidence["status"] = status
-                
-                if hash_value:
-                    evidence["hash"] = hash_value
-                
-                if location:
-                    evidence["location"] = location
-                
-                if metadata:
-                    if "metadata" not in evidence:
-                        evidence["metadata"] = {}
-                    evidence["metadata"].update(metadata)
-                
-                evidence["last_updated"] = datetime.datetime.now().isoformat()
-                
-                self.case_data["audit_log"].append(
-                    self._create_audit_entry(f"Evidence updated: {evidence_id} ({status})")
-                )
-                
-                self._save_custody_file()
-                logging.info(f"Preuve {evidence_id} mise à jour dans la chaîne de preuve")
-                return True
+        with self._lock:
+            if not self._record_update(evidence_id, status, hash_value, location, metadata):
+                return False
+            
+            self._flush_journals()
+        return True
+    
+    def add_events_batch(self, events):
+        """
+        Applique un lot d'événements avec une seule écriture dans les journaux de chaîne de preuve
+        
+        Args:
+            events (list): Liste de tuples (action, args, kwargs), où action vaut
+                           "add" (voir add_evidence) ou "update" (voir update_evidence)
+        """
+        handlers = {
+            "add": self._record_evidence,
+            "update": self._record_update
+        }
         
-        logging.warning(f"Tentative de mise à jour d'une preuve inexistante: {evidence_id}")
-        return False
+        with self._lock:
+            for action, args, kwargs in events:
+                handlers[action](*args, **kwargs)
+            
+            if events:
+                self._flush_journals()
     
-    def verify_evidence(self, evidence_id, file_path):
+    def verify_evidence(self, evidence_id, file_path, algorithm=None):
         """
         Vérifie l'intégrité d'une preuve par rapport à son hash enregistré
         
         Args:
             evidence_id (str): Identifiant de la preuve à vérifier
             file_path (str): Chemin vers le fichier de preuve à vérifier
+            algorithm (str, optional): Algorithme à utiliser ("sha256" pour une vérification
+                                       opposable, "blake3" pour un contrôle rapide).
+                                       Si None, BLAKE3 lorsqu'il est enregistré et disponible.
             
         Returns:
             bool: True si la preuve est intègre, False sinon
         """
-        for evidence in self.case_data["evidence_items"]:
-            if evidence["evidence_id"] == evidence_id and "hash" in evidence:
-                stored_hash = evidence["hash"]
-                calculated_hash = self._calculate_file_hash(file_path)
-                
-                is_valid = stored_hash == calculated_hash
-                
-                self.case_data["audit_log"].append(
-                    self._create_audit_entry(
-                        f"Evidence verification: {evidence_id}, {'SUCCESS' if is_valid else 'FAILED'}"
-                    )
-                )
-                
-                self._save_custody_file()
-                
-                if is_valid:
-                    logging.info(f"Vérification de la preuve {evidence_id} réussie")
-                else:
-                    logging.warning(f"Vérification de la preuve {evidence_id} échouée. Possible altération!")
-                
-                return is_valid
+        with self._lock:
+            evidence = self._evidence_index.get(evidence_id)
+            if evidence is None or "hash" not in evidence:
+                logging.warning(f"Preuve {evidence_id} non trouvée ou sans hash dans la chaîne de preuve")
+                return False
+            
+            # Les preuves enregistrées avec un seul hash ne contiennent que le SHA-256
+            stored_hashes = evidence["hash"]
+            stored_hashes = dict(stored_hashes) if isinstance(stored_hashes, dict) else {"sha256": stored_hashes}
+        
+        if algorithm is None:
+            algorithm = "blake3" if BLAKE3_AVAILABLE and "blake3" in stored_hashes else "sha256"
+        
+        stored_hash = stored_hashes.get(algorithm)
+        if stored_hash is None:
+            logging.warning(f"Aucun hash {algorithm} enregistré pour la preuve {evidence_id}")
+            return False
+        
+        # Le hachage du fichier, potentiellement long, se fait hors du verrou
+        calculated_hash = self._calculate_file_hash(file_path, algorithm)
+        
+        is_valid = stored_hash == calculated_hash
+        
+        with self._lock:
+            self._append_audit_entry(
+                f"Evidence verification: {evidence_id}, {'SUCCESS' if is_valid else 'FAILED'}"
+            )
+            
+            self._flush_journals()
+        
+        if is_valid:
+            logging.info(f"Vérification de la preuve {evidence_id} réussie")
+        else:
+            logging.warning(f"Vérification de la preuve {evidence_id} échouée. Possible altération!")
+        
+        return is_valid
+    
+    def verify_audit_chain(self):
+        """
+        Vérifie que le journal d'audit enregistré sur disque n'a pas été altéré
+        
+        Le hash de chaque entrée est recalculé et comparé au "prev_hash" de la
+        suivante : toute modification, suppression ou insertion rompt la chaîne.
+        
+        Returns:
+            bool: True si la chaîne est intègre, False sinon
+        """
+        # Aucune entrée ne doit être ajoutée au journal pendant sa relecture
+        with self._lock:
+            self._flush_journals()
+            
+            prev_hash = AUDIT_CHAIN_GENESIS
+            try:
+                with open(self.audit_journal, "rb") as f:
+                    for index, line in enumerate(f):
+                        entry = serialization.loads(line)
+                        if entry.get("prev_hash") != prev_hash or entry.get("hash") != _audit_entry_hash(entry):
+                            logging.warning(f"Chaîne d'audit rompue à l'entrée {index} du cas {self.case_id}")
+                            return False
+                        prev_hash = entry["hash"]
+            except (OSError, ValueError) as e:
+                logging.error(f"Erreur lors de la vérification du journal d'audit: {str(e)}")
+                return False
         
-        logging.warning(f"Preuve {evidence_id} non trouvée ou sans hash dans la chaîne de preuve")
-        return False
+        logging.info(f"Chaîne d'audit du cas {self.case_id} intègre")
+        return True
     
     def finalize_case(self):
         """
         Finalise le cas en ajoutant une entrée de fin dans l'audit log
         """
-        self.end_time = datetime.datetime.now()
-        self.case_data["end_time"] = self.end_time.isoformat()
-        self.case_data["audit_log"].append(self._create_audit_entry("Case finalized"))
-        self._save_custody_file()
+        with self._lock:
+            self.end_time = datetime.datetime.now()
+            self.case_data["end_time"] = self.end_time.isoformat()
+            self._append_audit_entry("Case finalized")
+            self._flush_journals()
+            self._save_custody_file()
         logging.info(f"Cas {self.case_id} finalisé")
     
+    def _record_evidence(self, evidence_id, evidence_type, source, description, metadata=None):
+        """
+        Enregistre une preuve en mémoire sans sauvegarder le fichier de chaîne de preuve
+        
+        Args:
+            evidence_id (str): Identifiant unique de la preuve
+            evidence_type (str): Type de preuve (memory, disk, etc.)
+            source (str): Source de la preuve (chemin, identifiant de processus, etc.)
+            description (str): Description de la preuve
+            metadata (dict, optional): Métadonnées supplémentaires sur la preuve
+        """
+        if metadata is None:
+            metadata = {}
+        
+        timestamp = datetime.datetime.now()
+        
+        evidence_item = {
+            "evidence_id": evidence_id,
+            "type": evidence_type,
+            "source": source,
+            "description": description,
+            "metadata": metadata,
+            "timestamp": timestamp.isoformat(),
+            "added_by": self.operator,
+        }
+        
+        self.case_data["evidence_items"].append(evidence_item)
+        # En cas d'identifiant dupliqué, la première preuve enregistrée reste la référence
+        self._evidence_index.setdefault(evidence_id, evidence_item)
+        self._pending_evidence[evidence_id] = evidence_item
+        self._append_audit_entry(f"Evidence added: {evidence_id} ({evidence_type})")
+        
+        logging.info(f"Preuve {evidence_id} ajoutée à la chaîne de preuve")
+    
+    def _record_update(self, evidence_id, status, hash_value=None, location=None, metadata=None):
+        """
+        Met à jour une preuve en mémoire sans sauvegarder le fichier de chaîne de preuve
+        
+        Args:
+            evidence_id (str): Identifiant de la preuve à mettre à jour
+            status (str): Nouveau statut de la preuve
+            hash_value (str|dict, optional): Hash SHA-256 de la preuve, ou dictionnaire
+                                             {algorithme: hash}
+            location (str, optional): Emplacement de stockage de la preuve
+            metadata (dict, optional): Métadonnées supplémentaires
+        
+        Returns:
+            bool: True si la preuve a été mise à jour, False si elle est inconnue
+        """
+        evidence = self._evidence_index.get(evidence_id)
+        if evidence is None:
+            logging.warning(f"Tentative de mise à jour d'une preuve inexistante: {evidence_id}")
+            return False
+        
+        evidence["status"] = status
+        
+        if hash_value:
+            evidence["hash"] = hash_value
+        
+        if location:
+            evidence["location"] = location
+        
+        if metadata:
+            if "metadata" not in evidence:
+                evidence["metadata"] = {}
+            evidence["metadata"].update(metadata)
+        
+        evidence["last_updated"] = datetime.datetime.now().isoformat()
+        
+        self._pending_evidence[evidence_id] = evidence
+        self._append_audit_entry(f"Evidence updated: {evidence_id} ({status})")
+        
+        logging.info(f"Preuve {evidence_id} mise à jour dans la chaîne de preuve")
+        return True
+    
     def _create_audit_entry(self, action):
         """
         Crée une entrée dans le journal d'audit
@@ -209,40 +375,120 @@ class ChainOfCustody:
         Returns:
             dict: Entrée d'audit
         """
-        return {
+        entry = {
             "timestamp": datetime.datetime.now().isoformat(),
             "action": action,
-            "user": self.operator,
-            "hostname": self.system_info["hostname"]
+            **self._audit_template,
+            "prev_hash": self._last_audit_hash
         }
+        entry["hash"] = self._last_audit_hash = _audit_entry_hash(entry)
+        
+        return entry
     
-    def _calculate_file_hash(self, file_path):
+    def _append_audit_entry(self, action):
         """
-        Calcule le hash SHA-256 d'un fichier
+        Ajoute une entrée au journal d'audit du cas et la met en attente d'écriture
+        
+        Args:
+            action (str): Action réalisée
+        """
+        entry = self._create_audit_entry(action)
+        self.case_data["audit_log"].append(entry)
+        self._pending_audit.append(entry)
+    
+    def _calculate_file_hash(self, file_path, algorithm="sha256"):
+        """
+        Calcule le hash SHA-256 (ou BLAKE3) d'un fichier
+        
+        Le résultat est réutilisé tant que le fichier n'a pas changé : la clé du
+        cache inclut le ctime, que l'utilisateur ne peut pas restaurer (contrairement
+        au mtime), de sorte qu'une modification du fichier invalide toujours l'entrée.
         
         Args:
             file_path (str): Chemin vers le fichier
+            algorithm (str, optional): "sha256" ou "blake3"
             
         Returns:
-            str: Hash SHA-256 du fichier
+            str: Hash du fichier, ou None en cas d'erreur
         """
-        sha256_hash = hashlib.sha256()
+        if algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            logging.error("Le module blake3 n'est pas disponible")
+            return None
         
         try:
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        except Exception as e:
+                st = os.fstat(f.fileno())
+                key = (algorithm, os.path.abspath(file_path), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+                if key in self._hash_cache:
+                    return self._hash_cache[key]
+                
+                if algorithm == "blake3":
+                    # Arbre de Merkle BLAKE3 réparti sur tous les cœurs, lecture par projection mémoire
+                    # (lecture par blocs avec les versions de blake3 qui ne la proposent pas)
+                    blake3_hash = blake3(max_threads=blake3.AUTO) if hasattr(blake3, "AUTO") else blake3()
+                    if hasattr(blake3_hash, "update_mmap"):
+                        blake3_hash.update_mmap(file_path)
+                    else:
+                        for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                            blake3_hash.update(byte_block)
+                    digest = blake3_hash.hexdigest()
+                elif hasattr(hashlib, "file_digest"):
+                    # Python 3.11+ : boucle de lecture et de hachage entièrement en C
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+                else:
+                    sha256_hash = hashlib.sha256()
+                    for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                        sha256_hash.update(byte_block)
+                    digest = sha256_hash.hexdigest()
+            
+            self._hash_cache[key] = digest
+            return digest
+        except OSError as e:
             logging.error(f"Erreur lors du calcul du hash pour {file_path}: {str(e)}")
             return None
     
+    def _flush_journals(self):
+        """
+        Ajoute aux journaux JSON Lines les preuves modifiées et les entrées d'audit en attente
+        
+        Chaque ligne du journal des preuves contient l'état complet d'une preuve :
+        la ligne la plus récente d'un identifiant remplace les précédentes.
+        """
+        evidence_items, self._pending_evidence = list(self._pending_evidence.values()), {}
+        audit_entries, self._pending_audit = self._pending_audit, []
+        
+        try:
+            for journal, records in ((self.evidence_journal, evidence_items), (self.audit_journal, audit_entries)):
+                if records:
+                    with open(journal, "ab") as f:
+                        f.write(b"".join(serialization.dumps(record) + b"\n" for record in records))
+        except Exception as e:
+            logging.error(f"Erreur lors de l'écriture des journaux de chaîne de preuve: {str(e)}")
+    
     def _save_custody_file(self):
         """
         Sauvegarde le fichier de chaîne de preuve au format JSON
         """
         try:
-            with open(self.custody_file, "w") as f:
-                json.dump(self.case_data, f, indent=2)
+            with open(self.custody_file, "wb") as f:
+                f.write(serialization.dumps(self.case_data, indent=True))
         except Exception as e:
             logging.error(f"Erreur lors de l'enregistrement du fichier de chaîne de preuve: {str(e)}")
+
+
+def _audit_entry_hash(entry):
+    """
+    Calcule le hash chaîné d'une entrée d'audit
+    
+    La forme canonique (clés triées, séparateurs compacts) est produite par le module
+    json de la bibliothèque standard, indépendamment du sérialiseur des journaux.
+    
+    Args:
+        entry (dict): Entrée d'audit, "prev_hash" compris ("hash" est ignoré)
+        
+    Returns:
+        str: Hash SHA-256 hexadécimal de l'entrée
+    """
+    content = {key: value for key, value in entry.items() if key != "hash"}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
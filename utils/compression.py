@@ -8,7 +8,9 @@ Ce module fournit des fonctions pour compresser, décompresser,
 chiffrer et déchiffrer les données collectées.
 """
 
+import io
 import os
+import hashlib
 import time
 import logging
 import zipfile
@@ -16,6 +18,7 @@ import tarfile
 import gzip
 import shutil
 import tempfile
+import subprocess
 import getpass
 import json
 from pathlib import Path
@@ -25,6 +28,8 @@ try:
     from cryptography.fernet import Fernet
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.backends import default_backend
     import base64
     CRYPTO_AVAILABLE = True
@@ -32,19 +37,104 @@ except ImportError:
     CRYPTO_AVAILABLE = False
     logging.warning("Le module cryptography n'est pas disponible. Le chiffrement ne sera pas disponible.")
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# Niveau de compression par défaut des archives : les preuves (images mémoire, données
+# chiffrées) se compressent peu, un niveau élevé ne ferait que ralentir l'archivage
+DEFAULT_COMPRESSION_LEVEL = 1
+
+# Signature des trames zstd
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Algorithme du hash des archives, calculé pendant leur écriture et enregistré
+# à côté de l'archive (fichier <archive>.sha256, format sha256sum)
+ARCHIVE_HASH_ALGORITHM = 'sha256'
+
+# Signatures des formats d'archive reconnus à l'extraction, en tête de fichier
+ARCHIVE_MAGICS = (
+    (ZSTD_MAGIC, 'tar.zst'),
+    (b'PK\x03\x04', 'zip'),
+    (b'PK\x05\x06', 'zip'),  # archive ZIP vide
+    (b'\x1f\x8b', 'tar.gz'),
+    (b'BZh', 'tar.bz2'),
+    (b'\xfd7zXZ\x00', 'tar.xz'),
+)
+
+# Signature POSIX des archives TAR non compressées, à l'offset 257 de l'entête
+TAR_USTAR_MAGIC = b'ustar'
+TAR_USTAR_OFFSET = 257
+
+# Filtre d'extraction tarfile refusant les membres hors du répertoire de sortie
+# (chemins absolus, '..', liens sortants), lorsque la version de Python le fournit
+_TAR_EXTRACT_OPTIONS = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+# Taille au-delà de laquelle les archives sont extraites par les outils natifs (tar, unzip)
+NATIVE_EXTRACT_THRESHOLD = 256 * 1024 * 1024  # 256 Mo
+
+# Options de tar : ni propriétaires ni permissions de l'archive (setuid/setgid compris)
+# restaurés, même en root, et permissions des répertoires existants conservées
+_NATIVE_TAR_OPTIONS = ['--no-same-owner', '--no-same-permissions', '--no-overwrite-dir']
+
+# Modes d'ouverture tarfile par format d'archive détecté
+_TAR_READ_MODES = {
+    'tar': 'r:',
+    'tar.gz': 'r:gz',
+    'tar.bz2': 'r:bz2',
+    'tar.xz': 'r:xz',
+}
+
+
+# Entête des fichiers chiffrés par blocs AES-GCM : signature, fonction de dérivation de clé (1 octet),
+# sel (16 octets), préfixe de nonce (7 octets)
+ENCRYPTION_MAGIC = b'AFGCM\x00\x00\x01'
+ENCRYPTION_SALT_SIZE = 16
+ENCRYPTION_NONCE_PREFIX_SIZE = 7
+
+# Fonctions de dérivation de la clé à partir du mot de passe, et leur identifiant dans l'entête
+KDF_PBKDF2 = 'pbkdf2'
+KDF_SCRYPT = 'scrypt'
+_KDF_IDS = {KDF_PBKDF2: 1, KDF_SCRYPT: 2}
+_KDF_NAMES = {kdf_id: kdf for kdf, kdf_id in _KDF_IDS.items()}
+
+# Fonction de dérivation utilisée par défaut pour le chiffrement
+DEFAULT_KDF = KDF_PBKDF2
+
+# Paramètres de dérivation (PBKDF2-HMAC-SHA256 : recommandation OWASP ; scrypt : 128 Mo par dérivation)
+PBKDF2_ITERATIONS = 600000
+LEGACY_PBKDF2_ITERATIONS = 100000
+SCRYPT_N = 2 ** 17
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Taille des blocs de données chiffrés indépendamment (mémoire constante quelle que soit la taille du fichier)
+ENCRYPTION_CHUNK_SIZE = 1024 * 1024  # 1 Mo
+
+# Taille de l'étiquette d'authentification ajoutée à chaque bloc
+GCM_TAG_SIZE = 16
+
+# Taille de l'entête des anciens fichiers chiffrés avec Fernet ('autoforensic_salt_' + 16 octets de sel)
+LEGACY_SALT_SIZE = len(b'autoforensic_salt_') + 16  # 34 octets
+
 
-def compress_evidence(evidence_dir, archive_format='zip', encryption_password=None, metadata=None):
+def compress_evidence(evidence_dir, archive_format='zip', encryption_password=None, metadata=None,
+                      compression_level=DEFAULT_COMPRESSION_LEVEL):
     """
     Compresse un répertoire de preuves dans une archive, avec chiffrement optionnel
     
     Args:
         evidence_dir (str): Chemin vers le répertoire de preuves à compresser
-        archive_format (str, optional): Format d'archive ('zip', 'tar', 'tar.gz', 'tar.bz2')
+        archive_format (str, optional): Format d'archive ('zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.zst')
         encryption_password (str, optional): Mot de passe pour le chiffrement
         metadata (dict, optional): Métadonnées à inclure dans l'archive
+        compression_level (int, optional): Niveau de compression (1 = le plus rapide)
         
     Returns:
-        str: Chemin vers l'archive créée
+        str: Chemin vers l'archive créée (son hash est écrit dans <archive>.sha256)
     """
     evidence_path = Path(evidence_dir)
     
@@ -66,6 +156,11 @@ def compress_evidence(evidence_dir, archive_format='zip', encryption_password=No
         archive_path = f"{archive_name}.tar.gz"
     elif archive_format == 'tar.bz2':
         archive_path = f"{archive_name}.tar.bz2"
+    elif archive_format == 'tar.zst':
+        if not ZSTD_AVAILABLE:
+            logging.error("Le format tar.zst n'est pas disponible (module zstandard manquant)")
+            return None
+        archive_path = f"{archive_name}.tar.zst"
     else:
         logging.error(f"Format d'archive non pris en charge: {archive_format}")
         return None
@@ -82,7 +177,8 @@ def compress_evidence(evidence_dir, archive_format='zip', encryption_password=No
         "compressed_by": getpass.getuser(),
         "source_directory": str(evidence_path),
         "encrypted": bool(encryption_password),
-        "format": archive_format
+        "format": archive_format,
+        "compression_level": compression_level
     })
     
     # Créer un fichier temporaire pour les métadonnées
@@ -90,58 +186,37 @@ def compress_evidence(evidence_dir, archive_format='zip', encryption_password=No
     json.dump(metadata, metadata_file, indent=2)
     metadata_file.close()
     
+    # L'archive est chiffrée à la volée pendant son écriture (aucune copie en clair sur le disque)
+    encrypt = bool(encryption_password and CRYPTO_AVAILABLE)
+    if encrypt:
+        archive_full_path = f"{archive_full_path}.enc"
+    
+    # Le hash de l'archive est calculé sur les octets écrits, sans relecture du fichier
+    digest_path = f"{archive_full_path}.{ARCHIVE_HASH_ALGORITHM}"
+    
     try:
-        # Créer l'archive selon le format demandé
-        if archive_format == 'zip':
-            # ZIP avec ou sans chiffrement
-            if encryption_password and CRYPTO_AVAILABLE:
-                # Si chiffrement demandé, nous créons d'abord une archive non chiffrée
-                # puis nous la chiffrons
-                temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-                temp_zip.close()
-                
-                with zipfile.ZipFile(temp_zip.name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    _add_directory_to_zip(zipf, evidence_path, evidence_path)
-                    zipf.write(metadata_file.name, "metadata.json")
-                
-                # Chiffrer l'archive temporaire
-                encrypt_file(temp_zip.name, archive_full_path, encryption_password)
-                os.unlink(temp_zip.name)
-            else:
-                # ZIP standard sans chiffrement
-                with zipfile.ZipFile(archive_full_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    _add_directory_to_zip(zipf, evidence_path, evidence_path)
-                    zipf.write(metadata_file.name, "metadata.json")
+        with open(archive_full_path, 'wb') as raw:
+            hashing_writer = HashingWriter(raw, ARCHIVE_HASH_ALGORITHM)
+            sink = _EncryptingWriter(hashing_writer, encryption_password) if encrypt else hashing_writer
+            try:
+                _write_archive(sink, archive_format, evidence_path, metadata_file.name, compression_level)
+            finally:
+                if encrypt:
+                    sink.close()
         
-        elif archive_format.startswith('tar'):
-            # Déterminer le mode d'ouverture et la compression pour TAR
-            if archive_format == 'tar':
-                mode = 'w'
-            elif archive_format == 'tar.gz':
-                mode = 'w:gz'
-            elif archive_format == 'tar.bz2':
-                mode = 'w:bz2'
-            
-            # Créer l'archive TAR
-            with tarfile.open(archive_full_path, mode) as tarf:
-                tarf.add(evidence_path, arcname=evidence_path.name)
-                tarf.add(metadata_file.name, arcname="metadata.json")
-            
-            # Si chiffrement demandé, chiffrer l'archive TAR
-            if encryption_password and CRYPTO_AVAILABLE:
-                encrypted_path = f"{archive_full_path}.enc"
-                encrypt_file(archive_full_path, encrypted_path, encryption_password)
-                os.unlink(archive_full_path)
-                archive_full_path = encrypted_path
+        archive_hash = hashing_writer.hexdigest()
+        with open(digest_path, 'w') as f:
+            f.write(f"{archive_hash}  {os.path.basename(archive_full_path)}\n")
         
-        logging.info(f"Archive créée avec succès: {archive_full_path}")
+        logging.info(f"Archive créée avec succès: {archive_full_path} ({ARCHIVE_HASH_ALGORITHM}: {archive_hash})")
         return archive_full_path
     
     except Exception as e:
         logging.error(f"Erreur lors de la création de l'archive: {str(e)}")
         # Nettoyage en cas d'erreur
-        if os.path.exists(archive_full_path):
-            os.unlink(archive_full_path)
+        for path in (archive_full_path, digest_path):
+            if os.path.exists(path):
+                os.unlink(path)
         return None
     
     finally:
@@ -150,23 +225,215 @@ def compress_evidence(evidence_dir, archive_format='zip', encryption_password=No
             os.unlink(metadata_file.name)
 
 
+class HashingWriter(io.RawIOBase):
+    """
+    Flux d'écriture qui transmet les données à un fichier et les hache au passage
+    """
+    
+    def __init__(self, dst, algorithm='sha256'):
+        """
+        Initialise le flux
+        
+        Args:
+            dst (file): Fichier de sortie ouvert en écriture binaire (non fermé par ce flux)
+            algorithm (str, optional): Algorithme de hachage (nom hashlib)
+        """
+        super().__init__()
+        self._dst = dst
+        self._hash = hashlib.new(algorithm)
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        self._dst.write(data)
+        self._hash.update(data)
+        return len(data)
+    
+    def hexdigest(self):
+        """
+        Returns:
+            str: Hash hexadécimal des données écrites jusqu'ici
+        """
+        return self._hash.hexdigest()
+
+
+def _write_archive(fileobj, archive_format, evidence_path, metadata_path, compression_level):
+    """
+    Écrit l'archive dans un flux de sortie, sans retour en arrière dans le flux
+    
+    Args:
+        fileobj (file): Flux binaire de sortie (HashingWriter ou _EncryptingWriter)
+        archive_format (str): Format d'archive ('zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.zst')
+        evidence_path (Path): Répertoire de preuves à archiver
+        metadata_path (str): Fichier de métadonnées à inclure
+        compression_level (int): Niveau de compression
+    """
+    if archive_format == 'zip':
+        # Sur un flux non positionnable, zipfile écrit des descripteurs de données après chaque membre
+        with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zipf:
+            _add_directory_to_zip(zipf, evidence_path, evidence_path)
+            zipf.write(metadata_path, "metadata.json")
+        return
+    
+    if archive_format == 'tar.zst':
+        # Flux TAR compressé par zstd, réparti sur tous les cœurs (threads=-1)
+        compressor = zstandard.ZstdCompressor(level=compression_level, threads=-1)
+        with compressor.stream_writer(fileobj, closefd=False) as zstd_writer:
+            with tarfile.open(fileobj=zstd_writer, mode='w|') as tarf:
+                tarf.add(evidence_path, arcname=evidence_path.name)
+                tarf.add(metadata_path, arcname="metadata.json")
+        return
+    
+    # Déterminer le mode d'ouverture et la compression pour TAR
+    options = {}
+    if archive_format == 'tar':
+        mode = 'w|'
+    elif archive_format == 'tar.gz':
+        mode = 'w:gz'
+        options['compresslevel'] = compression_level
+    elif archive_format == 'tar.bz2':
+        mode = 'w:bz2'
+        options['compresslevel'] = compression_level
+    
+    with tarfile.open(fileobj=fileobj, mode=mode, **options) as tarf:
+        tarf.add(evidence_path, arcname=evidence_path.name)
+        tarf.add(metadata_path, arcname="metadata.json")
+
+
 def _add_directory_to_zip(zipf, directory, base_dir):
     """
     Ajoute récursivement un répertoire à une archive ZIP
     
+    Le parcours est itératif (pile de répertoires) et s'appuie sur os.scandir,
+    dont les entrées fournissent leur type sans appel supplémentaire à stat.
+    
     Args:
         zipf (ZipFile): Objet ZipFile ouvert
         directory (Path): Répertoire à ajouter
         base_dir (Path): Répertoire de base pour les chemins relatifs
     """
-    for item in directory.iterdir():
-        if item.is_file():
-            zipf.write(item, item.relative_to(base_dir.parent))
-        elif item.is_dir():
-            _add_directory_to_zip(zipf, item, base_dir)
+    root = str(base_dir.parent)
+    pending = [str(directory)]
+    
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    zipf.write(entry.path, os.path.relpath(entry.path, root))
+                elif entry.is_dir(follow_symlinks=False):
+                    # Les liens vers des répertoires ne sont pas suivis (pas de boucle possible)
+                    pending.append(entry.path)
+
+
+def _derive_key(password, salt, kdf=DEFAULT_KDF, iterations=PBKDF2_ITERATIONS):
+    """
+    Dérive une clé AES-256 à partir d'un mot de passe (une seule fois par fichier)
+    
+    Args:
+        password (str): Mot de passe
+        salt (bytes): Sel propre au fichier
+        kdf (str, optional): Fonction de dérivation (KDF_PBKDF2 ou KDF_SCRYPT)
+        iterations (int, optional): Nombre d'itérations PBKDF2
+        
+    Returns:
+        bytes: Clé de 32 octets
+        
+    Raises:
+        ValueError: Si la fonction de dérivation est inconnue
+    """
+    if kdf == KDF_SCRYPT:
+        derivation = Scrypt(salt=salt, length=32, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, backend=default_backend())
+    elif kdf == KDF_PBKDF2:
+        derivation = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=iterations,
+            backend=default_backend()
+        )
+    else:
+        raise ValueError(f"Fonction de dérivation de clé inconnue: {kdf}")
+    
+    return derivation.derive(password.encode())
 
 
-def encrypt_file(input_file, output_file, password):
+def _chunk_nonce(nonce_prefix, counter, last):
+    """
+    Construit le nonce AES-GCM d'un bloc (construction STREAM)
+    
+    Le compteur de bloc et l'indicateur de dernier bloc font partie du nonce :
+    un bloc déplacé, supprimé ou une archive tronquée échouent à l'authentification.
+    
+    Args:
+        nonce_prefix (bytes): Préfixe aléatoire propre au fichier (7 octets)
+        counter (int): Numéro du bloc
+        last (bool): True pour le dernier bloc du fichier
+        
+    Returns:
+        bytes: Nonce de 12 octets
+    """
+    if counter >= 1 << 32:
+        raise ValueError("Fichier trop volumineux pour le chiffrement par blocs")
+    return nonce_prefix + counter.to_bytes(4, 'big') + (b'\x01' if last else b'\x00')
+
+
+class _EncryptingWriter(io.RawIOBase):
+    """
+    Flux d'écriture chiffrant les données par blocs AES-GCM au fil de l'eau
+    
+    Le résultat est identique à celui de encrypt_file et se déchiffre avec decrypt_file.
+    Le dernier bloc n'est chiffré qu'à la fermeture du flux, seul moment où il est connu.
+    """
+    
+    def __init__(self, dst, password, kdf=None):
+        """
+        Initialise le flux et écrit l'entête
+        
+        Args:
+            dst (file): Fichier de sortie ouvert en écriture binaire (non fermé par ce flux)
+            password (str): Mot de passe pour le chiffrement
+            kdf (str, optional): Fonction de dérivation de clé (KDF_PBKDF2 ou KDF_SCRYPT)
+        """
+        super().__init__()
+        if kdf is None:
+            kdf = DEFAULT_KDF
+        
+        salt = os.urandom(ENCRYPTION_SALT_SIZE)  # Sel unique
+        self._nonce_prefix = os.urandom(ENCRYPTION_NONCE_PREFIX_SIZE)
+        self._header = ENCRYPTION_MAGIC + bytes([_KDF_IDS[kdf]]) + salt + self._nonce_prefix
+        self._cipher = AESGCM(_derive_key(password, salt, kdf))
+        self._dst = dst
+        self._buffer = bytearray()
+        self._counter = 0
+        
+        dst.write(self._header)
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        self._buffer += data
+        # Conserver au moins un bloc en mémoire : il pourrait être le dernier
+        while len(self._buffer) > ENCRYPTION_CHUNK_SIZE:
+            self._write_chunk(bytes(self._buffer[:ENCRYPTION_CHUNK_SIZE]), last=False)
+            del self._buffer[:ENCRYPTION_CHUNK_SIZE]
+        return len(data)
+    
+    def close(self):
+        if not self.closed:
+            self._write_chunk(bytes(self._buffer), last=True)
+            self._buffer = bytearray()
+        super().close()
+    
+    def _write_chunk(self, chunk, last):
+        # L'entête est authentifié avec chaque bloc
+        nonce = _chunk_nonce(self._nonce_prefix, self._counter, last)
+        self._dst.write(self._cipher.encrypt(nonce, chunk, self._header))
+        self._counter += 1
+
+
+def encrypt_file(input_file, output_file, password, kdf=None):
     """
     Chiffre un fichier avec un mot de passe
     
@@ -174,6 +441,8 @@ def encrypt_file(input_file, output_file, password):
         input_file (str): Chemin vers le fichier à chiffrer
         output_file (str): Chemin vers le fichier chiffré
         password (str): Mot de passe pour le chiffrement
+        kdf (str, optional): Fonction de dérivation de clé (KDF_PBKDF2 ou KDF_SCRYPT)
+                             Valeur par défaut: DEFAULT_KDF
         
     Returns:
         bool: True si le chiffrement a réussi, False sinon
@@ -183,32 +452,9 @@ def encrypt_file(input_file, output_file, password):
         return False
     
     try:
-        # Générer une clé à partir du mot de passe
-        password_bytes = password.encode()
-        salt = b'autoforensic_salt_' + os.urandom(16)  # Sel unique
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
-        cipher = Fernet(key)
-        
-        # Lire le fichier d'entrée
-        with open(input_file, 'rb') as f:
-            data = f.read()
-        
-        # Chiffrer les données
-        encrypted_data = cipher.encrypt(data)
-        
-        # Enregistrer les données chiffrées avec le sel en entête
-        with open(output_file, 'wb') as f:
-            f.write(salt)  # Écrire le sel au début du fichier
-            f.write(encrypted_data)
+        with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+            with _EncryptingWriter(dst, password, kdf) as writer:
+                shutil.copyfileobj(src, writer, ENCRYPTION_CHUNK_SIZE)
         
         logging.info(f"Fichier {input_file} chiffré avec succès vers {output_file}")
         return True
@@ -235,43 +481,71 @@ def decrypt_file(input_file, output_file, password):
         return False
     
     try:
-        # Lire le fichier chiffré
-        with open(input_file, 'rb') as f:
-            # Lire le sel (24 premiers octets: 'autoforensic_salt_' + 16 octets de sel)
-            salt = f.read(24)
+        with open(input_file, 'rb') as src:
+            header = src.read(len(ENCRYPTION_MAGIC) + 1 + ENCRYPTION_SALT_SIZE + ENCRYPTION_NONCE_PREFIX_SIZE)
             
-            # Lire les données chiffrées
-            encrypted_data = f.read()
-        
-        # Générer la clé à partir du mot de passe et du sel
-        password_bytes = password.encode()
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
-        cipher = Fernet(key)
-        
-        # Déchiffrer les données
-        decrypted_data = cipher.decrypt(encrypted_data)
-        
-        # Enregistrer les données déchiffrées
-        with open(output_file, 'wb') as f:
-            f.write(decrypted_data)
+            if not header.startswith(ENCRYPTION_MAGIC):
+                # Ancien format : jeton Fernet unique précédé du sel
+                src.seek(0)
+                _decrypt_legacy_file(src, output_file, password)
+            else:
+                offset = len(ENCRYPTION_MAGIC)
+                kdf = _KDF_NAMES.get(header[offset])
+                salt = header[offset + 1:offset + 1 + ENCRYPTION_SALT_SIZE]
+                nonce_prefix = header[offset + 1 + ENCRYPTION_SALT_SIZE:]
+                
+                # Générer la clé à partir du mot de passe et du sel
+                cipher = AESGCM(_derive_key(password, salt, kdf))
+                
+                # Déchiffrer et authentifier le fichier bloc par bloc
+                with open(output_file, 'wb') as dst:
+                    block_size = ENCRYPTION_CHUNK_SIZE + GCM_TAG_SIZE
+                    counter = 0
+                    chunk = src.read(block_size)
+                    while True:
+                        next_chunk = src.read(block_size)
+                        last = not next_chunk
+                        dst.write(cipher.decrypt(_chunk_nonce(nonce_prefix, counter, last), chunk, header))
+                        if last:
+                            break
+                        chunk = next_chunk
+                        counter += 1
         
         logging.info(f"Fichier {input_file} déchiffré avec succès vers {output_file}")
         return True
     
     except Exception as e:
-        logging.error(f"Erreur lors du déchiffrement du fichier: {str(e)}")
+        logging.error(f"Erreur lors du déchiffrement du fichier: {str(e) or type(e).__name__}")
+        # Ne pas laisser de données partiellement déchiffrées (non authentifiées)
+        if os.path.exists(output_file):
+            os.unlink(output_file)
         return False
 
 
+def _decrypt_legacy_file(src, output_file, password):
+    """
+    Déchiffre un fichier produit par l'ancien format (jeton Fernet unique)
+    
+    Args:
+        src (file): Fichier chiffré ouvert en lecture binaire, positionné au début
+        output_file (str): Chemin vers le fichier déchiffré
+        password (str): Mot de passe pour le déchiffrement
+    """
+    # Lire le sel (34 premiers octets: 'autoforensic_salt_' + 16 octets de sel)
+    salt = src.read(LEGACY_SALT_SIZE)
+    
+    # Lire les données chiffrées
+    encrypted_data = src.read()
+    
+    # Générer la clé à partir du mot de passe et du sel
+    key = base64.urlsafe_b64encode(_derive_key(password, salt, KDF_PBKDF2, LEGACY_PBKDF2_ITERATIONS))
+    cipher = Fernet(key)
+    
+    # Déchiffrer et enregistrer les données
+    with open(output_file, 'wb') as f:
+        f.write(cipher.decrypt(encrypted_data))
+
+
 def extract_archive(archive_path, output_dir, password=None):
     """
     Extrait une archive (potentiellement chiffrée)
@@ -312,13 +586,35 @@ def extract_archive(archive_path, output_dir, password=None):
             extract_path = str(archive_path)
         
         # Déterminer le type d'archive et l'extraire
-        if zipfile.is_zipfile(extract_path):
+        archive_format = _detect_archive_format(extract_path)
+        
+        # Gros volumes : extraction par tar/unzip (code natif) lorsqu'ils sont disponibles
+        extracted = None
+        if archive_format is not None and os.path.getsize(extract_path) > NATIVE_EXTRACT_THRESHOLD:
+            extracted = _extract_with_native_tool(archive_format, extract_path, output_dir)
+        
+        if extracted is not None:
+            # Un refus de l'outil natif (membre hors du répertoire, archive corrompue) n'est pas
+            # contourné par l'extraction Python
+            if not extracted:
+                return False
+        
+        elif archive_format == 'tar.zst':
+            if not ZSTD_AVAILABLE:
+                logging.error("Extraction impossible: module zstandard manquant pour une archive tar.zst")
+                return False
+            
+            with open(extract_path, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as zstd_reader:
+                with tarfile.open(fileobj=zstd_reader, mode='r|') as tarf:
+                    tarf.extractall(path=str(output_dir), **_TAR_EXTRACT_OPTIONS)
+        
+        elif archive_format == 'zip':
             with zipfile.ZipFile(extract_path, 'r') as zipf:
                 zipf.extractall(path=str(output_dir))
         
-        elif tarfile.is_tarfile(extract_path):
-            with tarfile.open(extract_path, 'r:*') as tarf:
-                tarf.extractall(path=str(output_dir))
+        elif archive_format in _TAR_READ_MODES:
+            with tarfile.open(extract_path, _TAR_READ_MODES[archive_format]) as tarf:
+                tarf.extractall(path=str(output_dir), **_TAR_EXTRACT_OPTIONS)
         
         else:
             logging.error(f"Format d'archive non reconnu: {archive_path}")
@@ -338,3 +634,85 @@ def extract_archive(archive_path, output_dir, password=None):
                 os.unlink(temp_archive.name)
             except:
                 pass
+
+
+def _detect_archive_format(archive_path):
+    """
+    Identifie le format d'une archive d'après sa signature (lecture de l'entête uniquement)
+    
+    Args:
+        archive_path (str): Chemin vers l'archive
+        
+    Returns:
+        str: Format détecté ('zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.xz', 'tar.zst'), ou None
+    """
+    with open(archive_path, 'rb') as f:
+        header = f.read(TAR_USTAR_OFFSET + len(TAR_USTAR_MAGIC))
+    
+    for magic, archive_format in ARCHIVE_MAGICS:
+        if header.startswith(magic):
+            return archive_format
+    
+    if header[TAR_USTAR_OFFSET:] == TAR_USTAR_MAGIC:
+        return 'tar'
+    
+    # Dernier recours pour les archives sans signature en tête (ZIP préfixé, ancien format TAR v7)
+    if zipfile.is_zipfile(archive_path):
+        return 'zip'
+    if tarfile.is_tarfile(archive_path):
+        return 'tar'
+    
+    return None
+
+
+def _extract_with_native_tool(archive_format, extract_path, output_dir):
+    """
+    Extrait une archive avec tar ou unzip
+    
+    Les chemins sont passés sous forme absolue (aucun ne peut être pris pour une option).
+    tar et unzip retirent les '/' initiaux et refusent les composants '..' des membres,
+    et tar ne restaure ni propriétaires ni bits setuid/setgid (_NATIVE_TAR_OPTIONS).
+    
+    tar ne sait en revanche pas refuser les fichiers spéciaux (périphériques, tubes)
+    que le filtre 'data' de tarfile rejette : en root, lorsque ce filtre est disponible,
+    les archives tar ne sont pas confiées à l'outil natif (retour None) et restent
+    extraites par tarfile.
+    
+    Args:
+        archive_format (str): Format détecté par _detect_archive_format
+        extract_path (str): Chemin vers l'archive (déchiffrée)
+        output_dir (Path): Répertoire de sortie, existant
+        
+    Returns:
+        bool: True si l'extraction a réussi, False si elle a échoué, None si l'outil est indisponible
+    """
+    archive = os.path.abspath(extract_path)
+    destination = str(Path(output_dir).resolve())
+    
+    if archive_format == 'zip':
+        tool = shutil.which('unzip')
+        command = [tool, '-q', '-o', archive, '-d', destination]
+    else:
+        # En root, tar recréerait les périphériques de l'archive : extraction par tarfile filtrée
+        if _TAR_EXTRACT_OPTIONS and hasattr(os, 'geteuid') and os.geteuid() == 0:
+            return None
+        
+        tool = shutil.which('tar')
+        # tar délègue la décompression zstd au programme zstd
+        if archive_format == 'tar.zst' and not shutil.which('zstd'):
+            return None
+        command = [tool, '-xf', archive, '-C', destination] + _NATIVE_TAR_OPTIONS
+    
+    if tool is None:
+        return None
+    
+    result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        logging.error(
+            f"Échec de l'extraction par {os.path.basename(tool)} (code {result.returncode}): "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+        return False
+    
+    return True
@@ -9,58 +9,294 @@ de fichiers et de données, y compris avec différents algorithmes.
 """
 
 import os
+import re
+import hmac
+import mmap
 import hashlib
 import logging
-import json
 import datetime
+import threading
+import multiprocessing
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
+from utils import serialization
 
-def calculate_file_hash(file_path, algorithms=None):
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Algorithmes calculés par défaut pour chaque fichier de preuve
+DEFAULT_ALGORITHMS = ['md5', 'sha1', 'sha256', 'sha512'] + (['blake3'] if BLAKE3_AVAILABLE else [])
+
+# Algorithme utilisé par défaut pour les contrôles d'intégrité
+DEFAULT_INTEGRITY_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'sha256'
+
+# Taille du tampon de lecture réutilisé pour le hachage multi-algorithmes
+HASH_BUFFER_SIZE = 1024 * 1024  # 1 Mo
+
+# Taille du tampon d'écriture des rapports de hachage
+HASH_REPORT_BUFFER_SIZE = 1024 * 1024  # 1 Mo
+
+# Taille au-delà de laquelle les fichiers sont projetés en mémoire pour le hachage
+MMAP_THRESHOLD = 64 * 1024 * 1024  # 64 Mo
+
+# Au-delà de cette taille, une projection est hachée par fenêtres successives
+MMAP_WINDOW_THRESHOLD = 2 * 1024 * 1024 * 1024  # 2 Go
+
+# Taille des fenêtres de hachage d'une projection volumineuse
+MMAP_WINDOW_SIZE = 256 * 1024 * 1024  # 256 Mo
+
+# Taille du tampon de copie avec hachage (multiple de la taille des huge pages, 2 Mo)
+COPY_BUFFER_SIZE = 4 * HASH_BUFFER_SIZE  # 4 Mo
+
+# Fichiers plus petits que ce seuil regroupés par lots pour le hachage d'un répertoire
+BATCH_SMALL_FILE_SIZE = 1024 * 1024  # 1 Mo
+
+# Nombre de petits fichiers traités par tâche (amortit le coût des échanges entre processus)
+BATCH_SMALL_FILE_COUNT = 64
+
+# Tampons de copie réutilisés, un par thread
+_copy_buffers = threading.local()
+
+
+def get_process_pool_context():
     """
-    Calcule les hachages d'un fichier selon plusieurs algorithmes
+    Contexte multiprocessing des pools de hachage
+    
+    Les processus de travail ne sont jamais créés par fork : l'appelant a d'autres
+    threads actifs (écriture de la chaîne de preuve, collecteurs) dont les verrous
+    seraient copiés dans un état incohérent.
+    
+    Returns:
+        multiprocessing.context.BaseContext: Contexte "forkserver" si disponible, sinon "spawn"
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(start_method)
+
+
+def _new_hash(algorithm):
+    """
+    Crée un objet de hachage adossé à OpenSSL
+    
+    Le paramètre usedforsecurity=False permet d'utiliser les implémentations
+    accélérées (SHA-NI, ARMv8 Crypto) y compris sur les systèmes en mode FIPS,
+    le hachage servant ici uniquement au contrôle d'intégrité.
+    
+    Args:
+        algorithm (str): Nom de l'algorithme de hachage
+    
+    Returns:
+        Objet de hachage ou None si l'algorithme n'est pas disponible
+    """
+    if algorithm == 'blake3':
+        # BLAKE3 : SIMD et hachage en arbre multi-thread
+        return blake3(max_threads=blake3.AUTO) if BLAKE3_AVAILABLE else None
+    
+    try:
+        try:
+            return hashlib.new(algorithm, usedforsecurity=False)
+        except TypeError:
+            # Python < 3.9 : paramètre usedforsecurity non supporté
+            return hashlib.new(algorithm)
+    except ValueError:
+        return None
+
+
+def _init_hash_objects(algorithms=None):
+    """
+    Initialise les objets de hachage pour les algorithmes demandés
     
     Args:
-        file_path (str): Chemin vers le fichier à hacher
         algorithms (list, optional): Liste des algorithmes à utiliser
-                                     Valeur par défaut: ['md5', 'sha1', 'sha256', 'sha512']
+                                     Valeur par défaut: DEFAULT_ALGORITHMS
     
     Returns:
-        dict: Dictionnaire des hachages calculés par algorithme
+        dict: Objets de hachage par algorithme (les algorithmes indisponibles sont ignorés)
     """
     if algorithms is None:
-        algorithms = ['md5', 'sha1', 'sha256', 'sha512']
+        algorithms = DEFAULT_ALGORITHMS
     
-    # Initialisation des objets de hachage
     hash_objects = {}
     for algorithm in algorithms:
-        if hasattr(hashlib, algorithm):
-            hash_objects[algorithm] = getattr(hashlib, algorithm)()
+        hash_obj = _new_hash(algorithm)
+        if hash_obj is not None:
+            hash_objects[algorithm] = hash_obj
         else:
             logging.warning(f"L'algorithme de hachage {algorithm} n'est pas disponible")
     
+    return hash_objects
+
+
+def _advise_sequential(mapped):
+    """
+    Indique au noyau qu'une projection mémoire sera lue séquentiellement
+    
+    Args:
+        mapped (mmap.mmap): Projection mémoire du fichier
+    """
+    for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+        if hasattr(mmap, advice) and hasattr(mapped, 'madvise'):
+            try:
+                mapped.madvise(getattr(mmap, advice))
+            except OSError:
+                pass
+
+
+def _map_file(f, file_size):
+    """
+    Projette un fichier en mémoire en lecture seule
+    
+    Args:
+        f (file): Fichier ouvert en lecture binaire
+        file_size (int): Taille du fichier
+    
+    Returns:
+        mmap.mmap: Projection du fichier, ou None si elle est impossible
+                   (espace d'adressage insuffisant, système de fichiers non compatible)
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError) as e:
+        logging.debug(f"Projection mémoire impossible ({file_size} octets): {str(e)}")
+        return None
+
+
+def _update_from_mapping(hash_obj, mapped):
+    """
+    Alimente un objet de hachage avec une projection mémoire
+    
+    Les projections volumineuses sont transmises par fenêtres de MMAP_WINDOW_SIZE,
+    chacune traitée en un seul appel à la bibliothèque de hachage.
+    
+    Args:
+        hash_obj: Objet de hachage
+        mapped (mmap.mmap): Projection mémoire du fichier
+    """
+    if len(mapped) <= MMAP_WINDOW_THRESHOLD:
+        hash_obj.update(mapped)
+        return
+    
+    view = memoryview(mapped)
+    try:
+        for offset in range(0, len(view), MMAP_WINDOW_SIZE):
+            hash_obj.update(view[offset:offset + MMAP_WINDOW_SIZE])
+    finally:
+        view.release()
+
+
+def _update_from_mapping_parallel(hash_objects, mapped):
+    """
+    Alimente plusieurs objets de hachage en parallèle avec une projection mémoire
+    
+    hashlib libère le GIL pendant update() : chaque algorithme s'exécute dans son
+    propre thread sur la même projection. Les projections volumineuses sont
+    parcourues par fenêtres, hachées par tous les algorithmes puis retirées de
+    l'empreinte mémoire du processus (MADV_DONTNEED), ce qui borne la mémoire
+    résidente du collecteur quelle que soit la taille de la preuve.
+    
+    Args:
+        hash_objects (dict): Objets de hachage par algorithme
+        mapped (mmap.mmap): Projection mémoire du fichier
+    """
+    with ThreadPoolExecutor(max_workers=len(hash_objects)) as executor:
+        if len(mapped) <= MMAP_WINDOW_THRESHOLD:
+            list(executor.map(lambda hash_obj: hash_obj.update(mapped), hash_objects.values()))
+            return
+        
+        view = memoryview(mapped)
+        try:
+            for offset in range(0, len(view), MMAP_WINDOW_SIZE):
+                window = view[offset:offset + MMAP_WINDOW_SIZE]
+                list(executor.map(lambda hash_obj: hash_obj.update(window), hash_objects.values()))
+                
+                if hasattr(mmap, 'MADV_DONTNEED') and hasattr(mapped, 'madvise'):
+                    try:
+                        mapped.madvise(mmap.MADV_DONTNEED, offset, len(window))
+                    except OSError:
+                        pass
+                window.release()
+        finally:
+            view.release()
+
+
+def _update_from_stream(f, hash_objects):
+    """
+    Alimente des objets de hachage par une lecture unique du fichier dans un
+    tampon réutilisé, partagé par tous les algorithmes
+    
+    Args:
+        f (file): Fichier ouvert en lecture binaire
+        hash_objects (dict): Objets de hachage par algorithme
+    """
+    buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        
+        chunk = buffer[:size]
+        for hash_obj in hash_objects.values():
+            hash_obj.update(chunk)
+
+
+def calculate_file_hash(file_path, algorithms=None):
+    """
+    Calcule les hachages d'un fichier selon plusieurs algorithmes
+    
+    Le fichier n'est lu qu'une seule fois, quel que soit le nombre d'algorithmes.
+    
+    Args:
+        file_path (str): Chemin vers le fichier à hacher
+        algorithms (list, optional): Liste des algorithmes à utiliser
+                                     Valeur par défaut: DEFAULT_ALGORITHMS
+    
+    Returns:
+        dict: Dictionnaire des hachages calculés par algorithme
+    """
+    hash_objects = _init_hash_objects(algorithms)
+    
     # Vérification que le fichier existe
     if not os.path.isfile(file_path):
         logging.error(f"Impossible de calculer le hash: le fichier {file_path} n'existe pas")
         return {}
     
-    # Lecture et hachage du fichier par blocs pour économiser la mémoire
     try:
-        with open(file_path, 'rb') as f:
-            while True:
-                data = f.read(65536)  # Lire par blocs de 64k
-                if not data:
-                    break
-                
-                for hash_obj in hash_objects.values():
-                    hash_obj.update(data)
+        with open(file_path, 'rb', buffering=0) as f:
+            file_size = os.fstat(f.fileno()).st_size
+            
+            # BLAKE3 seul sur un gros fichier : projection et hachage multi-thread dans blake3
+            blake3_obj = hash_objects.get('blake3') if len(hash_objects) == 1 else None
+            if blake3_obj is not None and file_size > MMAP_THRESHOLD and hasattr(blake3_obj, 'update_mmap'):
+                blake3_obj.update_mmap(file_path)
+                return {'blake3': blake3_obj.hexdigest(), 'file_size': file_size}
+            
+            # Gros fichiers : projection en mémoire, le noyau anticipe les lectures
+            mapped = _map_file(f, file_size) if file_size > MMAP_THRESHOLD else None
+            
+            if mapped is not None:
+                with mapped:
+                    _advise_sequential(mapped)
+                    if len(hash_objects) > 1:
+                        _update_from_mapping_parallel(hash_objects, mapped)
+                    else:
+                        for hash_obj in hash_objects.values():
+                            _update_from_mapping(hash_obj, mapped)
+            elif len(hash_objects) == 1 and hasattr(hashlib, 'file_digest'):
+                # Python 3.11+ : boucle de lecture native sur un tampon interne
+                algorithm, hash_obj = next(iter(hash_objects.items()))
+                hash_objects[algorithm] = hashlib.file_digest(f, lambda: hash_obj)
+            else:
+                _update_from_stream(f, hash_objects)
         
         # Générer le dictionnaire de résultats
         result = {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objects.items()}
         
         # Ajouter la taille du fichier pour référence
-        result['file_size'] = os.path.getsize(file_path)
+        result['file_size'] = file_size
         
         return result
     
@@ -69,6 +305,69 @@ def calculate_file_hash(file_path, algorithms=None):
         return {}
 
 
+def _get_copy_buffer():
+    """
+    Obtient le tampon de copie du thread courant, alloué une seule fois
+    
+    Le tampon est une projection anonyme (alignée sur une page) marquée
+    MADV_HUGEPAGE lorsque c'est possible, réutilisée pour toutes les copies.
+    
+    Returns:
+        memoryview: Vue sur le tampon de copie
+    """
+    buffer = getattr(_copy_buffers, 'buffer', None)
+    if buffer is None:
+        mapping = mmap.mmap(-1, COPY_BUFFER_SIZE)
+        if hasattr(mapping, 'madvise') and hasattr(mmap, 'MADV_HUGEPAGE'):
+            try:
+                mapping.madvise(mmap.MADV_HUGEPAGE)
+            except OSError:
+                pass
+        buffer = _copy_buffers.buffer = memoryview(mapping)
+    return buffer
+
+
+def copy_file_with_hash(src_path, dest_path, algorithms=None):
+    """
+    Copie un fichier et calcule ses hachages en une seule passe de lecture
+    
+    Args:
+        src_path (str): Chemin du fichier source
+        dest_path (str): Chemin du fichier de destination
+        algorithms (list, optional): Liste des algorithmes à utiliser
+                                     Valeur par défaut: DEFAULT_ALGORITHMS
+    
+    Returns:
+        dict: Dictionnaire des hachages calculés par algorithme
+    
+    Raises:
+        OSError: Si la lecture de la source ou l'écriture de la destination échoue
+    """
+    hash_objects = _init_hash_objects(algorithms)
+    file_size = 0
+    
+    with open(src_path, 'rb', buffering=0) as src, open(dest_path, 'wb', buffering=0) as dst:
+        buffer = _get_copy_buffer()
+        while True:
+            size = src.readinto(buffer)
+            if not size:
+                break
+            
+            chunk = buffer[:size]
+            written = 0
+            while written < size:
+                written += dst.write(chunk[written:])
+            
+            for hash_obj in hash_objects.values():
+                hash_obj.update(chunk)
+            file_size += size
+    
+    result = {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objects.items()}
+    result['file_size'] = file_size
+    
+    return result
+
+
 def calculate_data_hash(data, algorithms=None):
     """
     Calcule les hachages d'une donnée binaire selon plusieurs algorithmes
@@ -86,13 +385,10 @@ def calculate_data_hash(data, algorithms=None):
     
     result = {}
     
-    for algorithm in algorithms:
-        if hasattr(hashlib, algorithm):
-            hash_obj = getattr(hashlib, algorithm)()
-            hash_obj.update(data)
-            result[algorithm] = hash_obj.hexdigest()
-        else:
-            logging.warning(f"L'algorithme de hachage {algorithm} n'est pas disponible")
+    # Objets de hachage adossés à OpenSSL (SHA-NI, ARMv8 Crypto)
+    for algorithm, hash_obj in _init_hash_objects(algorithms).items():
+        hash_obj.update(data)
+        result[algorithm] = hash_obj.hexdigest()
     
     # Ajouter la taille des données pour référence
     result['data_size'] = len(data)
@@ -100,6 +396,103 @@ def calculate_data_hash(data, algorithms=None):
     return result
 
 
+def _translate_glob_segment(segment):
+    """
+    Traduit un composant de motif glob en expression régulière
+    
+    Contrairement à fnmatch.translate, "*", "?" et "[...]" ne correspondent
+    jamais à "/" : un motif ne déborde pas sur les répertoires voisins.
+    
+    Args:
+        segment (str): Composant de motif, sans "/"
+    
+    Returns:
+        str: Expression régulière du composant
+    """
+    parts = []
+    i, n = 0, len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                # Crochet non fermé : caractère littéral, comme fnmatch
+                parts.append(re.escape(char))
+                continue
+            
+            body, i = segment[i:j], j + 1
+            negate = body.startswith("!")
+            if negate:
+                body = body[1:]
+            body = body.replace("\\", "\\\\").replace("[", "\\[")
+            if negate:
+                parts.append(f"[^/{body}]")
+            else:
+                if body.startswith("^"):
+                    body = "\\" + body
+                # Un intervalle (ex: "+-0") peut contenir "/"
+                parts.append(f"(?!/)[{body}]")
+        else:
+            parts.append(re.escape(char))
+    
+    return "".join(parts)
+
+
+def _compile_exclude_patterns(exclude_patterns):
+    """
+    Compile des motifs d'exclusion en une seule expression régulière
+    
+    Comme PurePath.match, un motif relatif est comparé composant par composant
+    à la fin du chemin (ex: "*.log" ou "cache/*.tmp") et un motif absolu au
+    chemin complet ; les jokers ne franchissent pas les séparateurs "/".
+    
+    Args:
+        exclude_patterns (list): Motifs de fichiers à exclure (syntaxe glob)
+    
+    Returns:
+        re.Pattern: Expression compilée, ou None si aucun motif n'est fourni
+    """
+    if not exclude_patterns:
+        return None
+    
+    alternatives = []
+    for pattern in exclude_patterns:
+        pattern = os.path.normcase(Path(pattern).as_posix())
+        if pattern.startswith("/"):
+            prefix, pattern = "/", pattern.lstrip("/")
+        else:
+            prefix = "(?:.*/)?"
+        body = "/".join(_translate_glob_segment(segment) for segment in pattern.split("/"))
+        alternatives.append(f"(?s:{prefix}{body})\\Z")
+    
+    return re.compile("|".join(alternatives))
+
+
+def _hash_file_batch(file_paths, algorithms):
+    """
+    Calcule les hachages d'un lot de fichiers (tâche exécutée dans un processus de travail)
+    
+    Args:
+        file_paths (list): Chemins des fichiers à hacher
+        algorithms (list): Liste des algorithmes à utiliser
+    
+    Returns:
+        list: Tuples (chemin, dictionnaire des hachages)
+    """
+    return [(file_path, calculate_file_hash(file_path, algorithms)) for file_path in file_paths]
+
+
 def batch_calculate_hashes(directory, recursive=True, algorithms=None, exclude_patterns=None):
     """
     Calcule les hachages pour tous les fichiers d'un répertoire
@@ -108,13 +501,15 @@ def batch_calculate_hashes(directory, recursive=True, algorithms=None, exclude_p
         directory (str): Chemin vers le répertoire
         recursive (bool, optional): Rechercher récursivement dans les sous-répertoires
         algorithms (list, optional): Liste des algorithmes à utiliser
+                                     Valeur par défaut: MD5 et SHA-256, plus BLAKE3
+                                     (détection rapide des doublons) s'il est disponible
         exclude_patterns (list, optional): Liste de motifs de fichiers à exclure
     
     Returns:
         dict: Dictionnaire des hachages pour chaque fichier
     """
     if algorithms is None:
-        algorithms = ['md5', 'sha256']
+        algorithms = ['md5', 'sha256'] + (['blake3'] if BLAKE3_AVAILABLE else [])
     
     if exclude_patterns is None:
         exclude_patterns = []
@@ -134,34 +529,53 @@ def batch_calculate_hashes(directory, recursive=True, algorithms=None, exclude_p
     else:
         walker = directory_path.glob('*')
     
+    exclude_re = _compile_exclude_patterns(exclude_patterns)
+    
     for file_path in walker:
         if file_path.is_file():
             # Vérifier si le fichier correspond à un motif d'exclusion
-            if not any(file_path.match(pattern) for pattern in exclude_patterns):
+            if exclude_re is None or not exclude_re.match(os.path.normcase(file_path.as_posix())):
                 files_to_process.append(file_path)
     
-    # Utiliser ThreadPoolExecutor pour calculer les hashes en parallèle
-    with ThreadPoolExecutor() as executor:
-        def process_file(file_path):
-            relative_path = file_path.relative_to(directory_path)
-            hash_results = calculate_file_hash(str(file_path), algorithms)
-            return str(relative_path), hash_results
+    # Une tâche par gros fichier, des lots pour les petits fichiers
+    tasks = []
+    small_files = []
+    for file_path in files_to_process:
+        try:
+            is_small = file_path.stat().st_size < BATCH_SMALL_FILE_SIZE
+        except OSError:
+            is_small = True
         
-        # Exécuter le traitement en parallèle
-        futures = [executor.submit(process_file, file_path) for file_path in files_to_process]
+        if is_small:
+            small_files.append(str(file_path))
+        else:
+            tasks.append([str(file_path)])
+    
+    for start in range(0, len(small_files), BATCH_SMALL_FILE_COUNT):
+        tasks.append(small_files[start:start + BATCH_SMALL_FILE_COUNT])
+    
+    if not tasks:
+        return result
+    
+    # Répartir le hachage des fichiers sur tous les cœurs disponibles (sans fork, voir get_process_pool_context)
+    with ProcessPoolExecutor(
+        max_workers=min(len(tasks), os.cpu_count() or 1), mp_context=get_process_pool_context()
+    ) as executor:
+        futures = [executor.submit(_hash_file_batch, task, algorithms) for task in tasks]
         
-        # Récupérer les résultats
-        for future in futures:
+        # Récupérer les résultats dans l'ordre de fin des tâches
+        for future in as_completed(futures):
             try:
-                relative_path, hash_results = future.result()
-                result[relative_path] = hash_results
+                for file_path, hash_results in future.result():
+                    relative_path = Path(file_path).relative_to(directory_path)
+                    result[str(relative_path)] = hash_results
             except Exception as e:
                 logging.error(f"Erreur lors du calcul de hash: {str(e)}")
     
     return result
 
 
-def verify_file_hash(file_path, expected_hash, algorithm='sha256'):
+def verify_file_hash(file_path, expected_hash, algorithm='sha256', calculated_hash=None):
     """
     Vérifie si le hachage d'un fichier correspond à une valeur attendue
     
@@ -169,19 +583,35 @@ def verify_file_hash(file_path, expected_hash, algorithm='sha256'):
         file_path (str): Chemin vers le fichier à vérifier
         expected_hash (str): Valeur de hachage attendue
         algorithm (str, optional): Algorithme de hachage à utiliser. Défaut: 'sha256'
+        calculated_hash (str, optional): Hash déjà calculé (par exemple dans un processus
+                                         de travail) ; le fichier n'est alors pas relu
     
     Returns:
         bool: True si le hachage correspond, False sinon
     """
     try:
-        calculated_hashes = calculate_file_hash(file_path, [algorithm])
-        
-        if algorithm not in calculated_hashes:
+        hash_obj = _new_hash(algorithm)
+        if hash_obj is None:
             logging.error(f"L'algorithme {algorithm} n'a pas pu être utilisé pour le hachage")
             return False
         
-        calculated_hash = calculated_hashes[algorithm]
-        matches = calculated_hash.lower() == expected_hash.lower()
+        # Un hash de longueur incorrecte ne peut pas correspondre : inutile de lire le fichier
+        expected_hash = expected_hash.lower()
+        digest_size = getattr(hash_obj, 'digest_size', 0)
+        if digest_size and len(expected_hash) != 2 * digest_size:
+            logging.warning(
+                f"Vérification du hash {algorithm} échouée pour {file_path}: "
+                f"longueur du hash attendu incorrecte ({len(expected_hash)} au lieu de {2 * digest_size})"
+            )
+            return False
+        
+        if calculated_hash is None:
+            calculated_hash = calculate_file_hash(file_path, [algorithm]).get(algorithm)
+        if calculated_hash is None:
+            return False
+        
+        # Comparaison en temps constant
+        matches = hmac.compare_digest(calculated_hash.encode(), expected_hash.encode())
         
         if matches:
             logging.info(f"Vérification du hash {algorithm} réussie pour {file_path}")
@@ -202,6 +632,9 @@ def generate_hash_report(hash_results, output_file):
     """
     Génère un rapport de hachage au format JSON
     
+    Le rapport est écrit au fil de l'eau, une ligne par fichier : la mémoire
+    utilisée ne dépend pas du nombre de fichiers.
+    
     Args:
         hash_results (dict): Résultats des hachages
         output_file (str): Chemin du fichier de sortie
@@ -214,16 +647,18 @@ def generate_hash_report(hash_results, output_file):
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Ajouter des métadonnées au rapport
-        report = {
-            'generated_at': datetime.datetime.now().isoformat(),
-            'file_count': len(hash_results),
-            'hashes': hash_results
-        }
-        
-        # Écrire le rapport JSON
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Écrire les métadonnées puis les hachages de chaque fichier
+        with open(output_file, 'wb', buffering=HASH_REPORT_BUFFER_SIZE) as f:
+            f.write(b'{\n  "generated_at": ' + serialization.dumps(datetime.datetime.now().isoformat()))
+            f.write(b',\n  "file_count": ' + serialization.dumps(len(hash_results)))
+            f.write(b',\n  "hashes": {')
+            
+            separator = b'\n    '
+            for file_path, hashes in hash_results.items():
+                f.write(separator + serialization.dumps(str(file_path)) + b': ' + serialization.dumps(hashes))
+                separator = b',\n    '
+            
+            f.write(b'\n  }\n}\n' if hash_results else b'}\n}\n')
         
         logging.info(f"Rapport de hachage généré avec succès: {output_file}")
         return True
@@ -6,71 +6,217 @@ Configuration et gestion de la journalisation pour AutoForensic
 """
 
 import os
+import atexit
 import logging
+import logging.config
 import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 
+from utils import serialization
 
-def setup_logging(log_level=logging.INFO, log_file=None):
+
+# Nombre d'enregistrements accumulés avant une écriture groupée dans le fichier de log
+DEFAULT_LOG_BUFFER_CAPACITY = 1024
+
+# Marge sous la taille maximale du fichier de log en deçà de laquelle aucun
+# enregistrement n'est formaté pour décider d'une rotation
+ROLLOVER_CHECK_MARGIN = 64 * 1024  # 64 Ko
+
+# Logger dédié aux actions sur les preuves, écrites au format JSON Lines
+EVIDENCE_LOGGER_NAME = "autoforensic.evidence"
+
+# Nombre d'enregistrements de preuves accumulés avant une écriture groupée
+DEFAULT_EVIDENCE_BUFFER_CAPACITY = 512
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler sans appel stat() ni formatage supplémentaire par enregistrement
+    
+    Le type du fichier (fichier régulier ou non) est déterminé à l'ouverture, et
+    l'enregistrement n'est formaté pour mesurer sa longueur qu'à l'approche de la
+    taille maximale. Un enregistrement de plus de ROLLOVER_CHECK_MARGIN octets
+    peut donc dépasser cette taille avant la rotation suivante.
+    """
+    
+    def _open(self):
+        stream = super()._open()
+        # Ne jamais faire tourner autre chose qu'un fichier régulier (/dev/null, tube nommé...)
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        if self.stream is None:  # ouverture différée (delay=True)
+            self.stream = self._open()
+        
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return False
+        
+        self.stream.seek(0, 2)  # Windows : position non garantie en fin de fichier en mode ajout
+        position = self.stream.tell()
+        if position + ROLLOVER_CHECK_MARGIN < self.maxBytes:
+            return False
+        
+        return position + len(f"{self.format(record)}\n") >= self.maxBytes
+
+
+class _JsonlFormatter(logging.Formatter):
+    """
+    Formate un enregistrement de preuve en une ligne JSON (NDJSON)
+    
+    Seuls les champs structurés sont conservés : le message texte est ignoré,
+    ce qui évite toute analyse par expression régulière lors de la relecture.
+    """
+    
+    def format(self, record):
+        return serialization.dumps({
+            "t": record.created,
+            "case": getattr(record, "case_id", None),
+            "op": getattr(record, "operator", None),
+            "source": getattr(record, "source", None),
+            "id": getattr(record, "evidence_id", None),
+            "action": getattr(record, "action", None),
+            "status": getattr(record, "status", None)
+        }).decode("utf-8")
+
+
+def setup_logging(log_level=logging.INFO, log_file=None, buffer_capacity=DEFAULT_LOG_BUFFER_CAPACITY):
     """
     Configure la journalisation pour l'application
     
     Args:
         log_level (int): Niveau de journalisation (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file (str, optional): Chemin vers le fichier de log. Si None, ne journalise que dans la console.
+        buffer_capacity (int, optional): Nombre d'enregistrements mis en tampon avant écriture dans le
+                                         fichier de log (les messages ERROR et plus vident le tampon)
+    
+    Le fichier de log horodate les messages en secondes depuis l'epoch (UTC, à la
+    milliseconde) : aucune conversion en heure locale ni strftime par message.
+    La console conserve une date lisible.
+    
+    Les actions sur les preuves (ForensicLogger.evidence) sont en outre écrites au
+    format JSON Lines dans un fichier voisin du fichier de log (suffixe _evidence.jsonl).
     """
-    # Formateur pour les logs
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
-    # Configuration de la journalisation racine
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    
-    # Supprime les gestionnaires existants pour éviter les doublons
-    for handler in root_logger.handlers[:]: 
-        root_logger.removeHandler(handler)
-    
-    # Ajoute un gestionnaire pour la console
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(log_level)
-    root_logger.addHandler(console_handler)
+    config = {
+        "version": 1,
+        "incremental": False,
+        # Conserver les loggers déjà créés par les modules importés
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "format": "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+                "datefmt": "%Y-%m-%d %H:%M:%S"
+            },
+            "file": {
+                "format": "%(created).3f [%(levelname)s] %(name)s - %(message)s"
+            },
+            "evidence_jsonl": {
+                "()": _JsonlFormatter
+            }
+        },
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "formatter": "default",
+                "level": log_level
+            }
+        },
+        "root": {
+            "level": log_level,
+            "handlers": ["console"]
+        },
+        # Niveau plus élevé pour certains modules externes trop verbeux qui pourraient inonder les logs
+        "loggers": {
+            name: {"level": logging.WARNING}
+            for name in ("urllib3", "requests", "matplotlib")
+        }
+    }
+    
+    # Les actions sur les preuves sont toujours enregistrées, quel que soit le niveau global
+    config["loggers"][EVIDENCE_LOGGER_NAME] = {"level": logging.INFO, "handlers": []}
     
     # Ajoute un gestionnaire pour le fichier si spécifié
     if log_file:
-        try:
+        config["handlers"].update({
+            # Rotation pour éviter des fichiers trop volumineux
+            "file": {
+                "()": _FastRotatingFileHandler,
+                "formatter": "file",
+                "level": log_level,
+                "filename": log_file,
+                "maxBytes": 10485760,  # 10 Mo maximum
+                "backupCount": 5,      # Conserver 5 sauvegardes
+                "encoding": "utf-8"
+            },
+            # Écritures groupées : les enregistrements sont accumulés puis écrits en une fois
+            "buffered_file": {
+                "class": "logging.handlers.MemoryHandler",
+                "level": log_level,
+                "capacity": buffer_capacity,
+                "flushLevel": logging.ERROR,
+                "target": "file",
+                "flushOnClose": True
+            }
+        })
+        config["root"]["handlers"].append("buffered_file")
+        
+        # Fichier JSON Lines dédié aux preuves, lui aussi écrit par lots
+        config["handlers"].update({
+            "evidence_file": {
+                "()": _FastRotatingFileHandler,
+                "formatter": "evidence_jsonl",
+                "filename": f"{os.path.splitext(log_file)[0]}_evidence.jsonl",
+                "maxBytes": 10485760,  # 10 Mo maximum
+                "backupCount": 5,
+                "encoding": "utf-8"
+            },
+            "buffered_evidence": {
+                "class": "logging.handlers.MemoryHandler",
+                "capacity": DEFAULT_EVIDENCE_BUFFER_CAPACITY,
+                "flushLevel": logging.ERROR,
+                "target": "evidence_file",
+                "flushOnClose": True
+            }
+        })
+        config["loggers"][EVIDENCE_LOGGER_NAME]["handlers"].append("buffered_evidence")
+    
+    # Une seule configuration remplace intégralement la précédente (pas de doublons)
+    file_error = None
+    try:
+        if log_file:
             # Crée le répertoire du fichier de log si nécessaire
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            
-            # Utilisation d'un RotatingFileHandler pour éviter des fichiers trop volumineux
-            file_handler = RotatingFileHandler(
-                log_file, 
-                maxBytes=10485760,  # 10 Mo maximum
-                backupCount=5,      # Conserver 5 sauvegardes
-                encoding="utf-8"
-            )
-            file_handler.setFormatter(formatter)
-            file_handler.setLevel(log_level)
-            root_logger.addHandler(file_handler)
-            
-            logging.info(f"Journalisation configurée dans le fichier: {log_file}")
-        except Exception as e:
-            logging.error(f"Impossible de configurer la journalisation dans le fichier {log_file}: {str(e)}")
+        logging.config.dictConfig(config)
+    except (OSError, ValueError) as e:
+        if not log_file:
+            raise
+        # Repli sur la seule console
+        file_error = e
+        for name in ("file", "buffered_file", "evidence_file", "buffered_evidence"):
+            del config["handlers"][name]
+        config["root"]["handlers"] = ["console"]
+        config["loggers"][EVIDENCE_LOGGER_NAME]["handlers"] = []
+        logging.config.dictConfig(config)
     
-    # Définit un niveau plus élevé pour certains modules externes
-    # trop verbeux qui pourraient inonder les logs
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
+    if file_error is not None:
+        logging.error(f"Impossible de configurer la journalisation dans le fichier {log_file}: {str(file_error)}")
+    elif log_file:
+        # Vider le tampon à la fin du programme
+        for handler in logging.getLogger().handlers + logging.getLogger(EVIDENCE_LOGGER_NAME).handlers:
+            if isinstance(handler, MemoryHandler):
+                atexit.register(handler.close)
+        
+        logging.info(f"Journalisation configurée dans le fichier: {log_file}")
 
 
-class ForensicLogger:
+class ForensicLogger(logging.LoggerAdapter):
     """
     Classe utilitaire pour faciliter la journalisation forensique
     avec des marquages temporels et d'audit
+    
+    Les messages acceptent des arguments de style % (formatés seulement si le
+    niveau est actif), et chaque enregistrement porte les attributs case_id et
+    operator.
     """
     
     def __init__(self, module_name, operator=None, case_id=None):
@@ -82,84 +228,64 @@ class ForensicLogger:
             operator (str, optional): Nom de l'opérateur
             case_id (str, optional): Identifiant du cas forensique
         """
-        self.logger = logging.getLogger(module_name)
+        super().__init__(logging.getLogger(module_name), {"case_id": case_id, "operator": operator})
         self.operator = operator
         self.case_id = case_id
+        
+        # Préfixe d'audit construit une seule fois plutôt qu'à chaque message ; les '%'
+        # sont doublés lorsque le message est formaté avec des arguments
+        self._prefix = "".join(part for part in (
+            f"[Case: {case_id}] " if case_id else None,
+            f"[Op: {operator}] " if operator else None,
+        ) if part)
+        self._escaped_prefix = self._prefix.replace("%", "%%")
+        self._evidence_logger = logging.getLogger(EVIDENCE_LOGGER_NAME)
     
-    def _format_message(self, message):
+    def process(self, msg, kwargs):
         """
-        Formate un message avec les informations d'audit
+        Ajoute les informations d'audit aux attributs de l'enregistrement
         
         Args:
-            message (str): Message à formater
+            msg (str): Message à journaliser
+            kwargs (dict): Arguments nommés de l'appel de journalisation
             
         Returns:
-            str: Message formaté
-        """
-        prefix = ""
-        
-        if self.case_id:
-            prefix += f"[Case: {self.case_id}] "
-        
-        if self.operator:
-            prefix += f"[Op: {self.operator}] "
-        
-        return f"{prefix}{message}"
-    
-    def debug(self, message):
-        """
-        Journalise un message de niveau DEBUG
-        
-        Args:
-            message (str): Message à journaliser
-        """
-        self.logger.debug(self._format_message(message))
-    
-    def info(self, message):
+            tuple: Message et arguments nommés
         """
-        Journalise un message de niveau INFO
-        
-        Args:
-            message (str): Message à journaliser
-        """
-        self.logger.info(self._format_message(message))
-    
-    def warning(self, message):
-        """
-        Journalise un message de niveau WARNING
-        
-        Args:
-            message (str): Message à journaliser
-        """
-        self.logger.warning(self._format_message(message))
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
     
-    def error(self, message):
+    def log(self, level, msg, *args, **kwargs):
         """
-        Journalise un message de niveau ERROR
+        Journalise un message préfixé par les informations d'audit
         
         Args:
-            message (str): Message à journaliser
+            level (int): Niveau de journalisation
+            msg (str): Message, éventuellement avec des champs de style %
+            *args: Arguments du message, formatés uniquement si le niveau est actif
         """
-        self.logger.error(self._format_message(message))
-    
-    def critical(self, message):
-        """
-        Journalise un message de niveau CRITICAL
-        
-        Args:
-            message (str): Message à journaliser
-        """
-        self.logger.critical(self._format_message(message))
+        if self.isEnabledFor(level):
+            msg, kwargs = self.process(msg, kwargs)
+            if self._prefix:
+                # f-string : msg peut être une exception ou tout autre objet, comme avec logging
+                msg = f"{self._escaped_prefix if args else self._prefix}{msg}"
+            self.logger.log(level, msg, *args, **kwargs)
     
     def evidence(self, evidence_id, action, status):
         """
         Journalise une action sur une preuve
         
+        L'enregistrement passe par le logger dédié aux preuves : il porte les champs
+        structurés evidence_id, action et status, écrits au format JSON Lines.
+        
         Args:
             evidence_id (str): Identifiant de la preuve
             action (str): Action effectuée (collect, hash, verify, etc.)
             status (str): Statut de l'action (success, failure, etc.)
         """
-        self.logger.info(
-            self._format_message(f"EVIDENCE - ID: {evidence_id}, Action: {action}, Status: {status}")
+        self._evidence_logger.info(
+            "%sEVIDENCE - ID: %s, Action: %s, Status: %s", self._prefix, evidence_id, action, status,
+            extra={**self.extra, "source": self.logger.name,
+                   "evidence_id": evidence_id, "action": action, "status": status}
         )
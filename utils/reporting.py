@@ -9,13 +9,17 @@ sur les preuves collectées lors d'une investigation.
 """
 
 import os
-import json
 import logging
+import functools
 import datetime
 import shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import jinja2
 
+from utils import serialization
+
 try:
     import markdown
     MARKDOWN_AVAILABLE = True
@@ -31,6 +35,206 @@ except ImportError:
     logging.warning("Le module xhtml2pdf n'est pas disponible. La génération de PDF n'est pas possible.")
 
 
+def _mtime_ns(path):
+    """
+    Retourne le mtime d'un chemin en nanosecondes
+    
+    Args:
+        path (str): Chemin à interroger
+        
+    Returns:
+        int: mtime en nanosecondes, ou None si le chemin n'existe plus
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _new_scan_result():
+    """
+    Crée le résultat (vide) du parcours d'une arborescence
+    
+    Returns:
+        dict: Statistiques par répertoire, mtime des répertoires, nombre de fichiers
+              et taille cumulée par extension
+    """
+    return {
+        "directories": {},
+        "dir_mtimes": {},
+        "ext_counts": Counter(),
+        "ext_sizes": defaultdict(int)
+    }
+
+
+def _scan_directory(directory, rel_path, result):
+    """
+    Ajoute au résultat les statistiques des fichiers d'un répertoire (sans récursion)
+    
+    Le type des entrées est fourni par os.scandir sans stat() supplémentaire, et
+    chaque fichier n'est interrogé qu'une fois pour sa taille (lstat : un lien
+    symbolique compte pour sa propre taille, sans résolution de sa cible ; les
+    liens sont en outre décomptés à part dans symlink_count).
+    
+    Args:
+        directory (str): Répertoire à analyser
+        rel_path (str): Nom du répertoire dans les statistiques
+        result (dict): Résultat à compléter (voir _new_scan_result)
+        
+    Returns:
+        list: Sous-répertoires à parcourir, en tuples (chemin, nom dans les statistiques)
+    """
+    try:
+        # mtime relevé avant la lecture : une modification concurrente invalide le cache
+        result["dir_mtimes"][directory] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        # Comme os.walk : les répertoires illisibles sont ignorés
+        return []
+    
+    ext_sizes = result["ext_sizes"]
+    dir_file_count = 0
+    dir_symlink_count = 0
+    dir_size = 0
+    dir_exts = []
+    subdirs = []
+    
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                # Les liens vers des répertoires ne sont pas parcourus
+                if not entry.is_symlink():
+                    child = entry.name if rel_path == "root" else os.path.join(rel_path, entry.name)
+                    subdirs.append((entry.path, child))
+                continue
+        except OSError:
+            pass
+        
+        dir_file_count += 1
+        try:
+            if entry.is_symlink():
+                dir_symlink_count += 1
+            file_size = entry.stat(follow_symlinks=False).st_size
+        except Exception as e:
+            logging.warning(f"Erreur lors de l'analyse du fichier {entry.path}: {str(e)}")
+            continue
+        
+        # Calculer les statistiques par extension
+        ext = os.path.splitext(entry.name)[1].lower() or "no_extension"
+        dir_exts.append(ext)
+        ext_sizes[ext] += file_size
+        dir_size += file_size
+    
+    # Comptage des extensions du répertoire en une seule passe (boucle C de Counter)
+    result["ext_counts"].update(dir_exts)
+    
+    result["directories"][rel_path] = {
+        "file_count": dir_file_count,
+        "symlink_count": dir_symlink_count,
+        "total_size": dir_size
+    }
+    
+    return subdirs
+
+
+def _walk_subtree(directory, rel_path):
+    """
+    Parcourt itérativement une arborescence et calcule ses statistiques de fichiers
+    
+    Args:
+        directory (str): Racine de l'arborescence
+        rel_path (str): Nom de la racine dans les statistiques
+        
+    Returns:
+        dict: Résultat du parcours (voir _new_scan_result)
+    """
+    result = _new_scan_result()
+    pending = [(directory, rel_path)]
+    
+    while pending:
+        # Ordre de parcours identique à os.walk (descendant, dans l'ordre du répertoire)
+        pending.extend(reversed(_scan_directory(*pending.pop(), result)))
+    
+    return result
+
+
+def _copy_resource(resource, destination):
+    """
+    Copie une ressource du rapport si la destination n'est pas déjà à jour
+    
+    shutil.copyfile utilise la copie noyau (sendfile, copy_file_range) lorsqu'elle
+    est disponible, sans passer les données par l'espace utilisateur.
+    
+    Args:
+        resource (os.DirEntry): Ressource à copier
+        destination (Path): Chemin de destination
+    """
+    source_stat = resource.stat()
+    try:
+        destination_stat = destination.stat()
+        # Même taille et copie au moins aussi récente que la source : rien à faire
+        if (destination_stat.st_size == source_stat.st_size
+                and destination_stat.st_mtime >= source_stat.st_mtime):
+            return
+    except FileNotFoundError:
+        pass
+    
+    shutil.copyfile(resource.path, destination)
+
+
+# Unités d'affichage des tailles de fichiers (puissances de 1024)
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Nombre de fragments de template regroupés par écriture lors du rendu HTML en flux
+HTML_STREAM_BUFFER_SIZE = 32
+
+# Nombre maximal de threads parcourant l'arborescence des preuves pour les statistiques
+FILE_STATS_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Templates fournis par l'utilisateur, et templates générés à défaut
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent / "templates_default"
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_default_templates(template_dir):
+    """
+    Crée les templates par défaut s'ils sont absents, une seule fois par processus
+    
+    Args:
+        template_dir (str): Répertoire des templates par défaut
+    
+    Returns:
+        str: Répertoire des templates par défaut
+    """
+    path = Path(template_dir)
+    if not (path / "report_template.html").exists():
+        path.mkdir(exist_ok=True)
+        ReportGenerator._create_default_templates(path)
+    return template_dir
+
+
+@functools.lru_cache(maxsize=None)
+def _get_jinja_environment(template_dir):
+    """
+    Environnement Jinja2 partagé par tous les générateurs utilisant le même répertoire
+    
+    L'environnement est thread-safe et conserve les templates compilés, ce qui
+    évite de les recompiler pour chaque rapport.
+    
+    Args:
+        template_dir (str): Répertoire des templates
+    
+    Returns:
+        jinja2.Environment: Environnement de rendu
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        autoescape=jinja2.select_autoescape(['html', 'xml'])
+    )
+
+
 class ReportGenerator:
     """
     Classe pour la génération de rapports forensiques
@@ -49,20 +253,28 @@ class ReportGenerator:
         self.report_dir = self.evidence_dir / "reports"
         self.report_dir.mkdir(exist_ok=True)
         
+        # Dernières statistiques de fichiers et mtime des répertoires parcourus pour les obtenir
+        self._fs_stats_cache = None
+        
         # Configuration de Jinja2 pour les templates
-        template_dir = Path(__file__).parent.parent / "templates"
-        if not template_dir.exists():
-            template_dir = Path(__file__).parent.parent / "templates_default"
-            if not template_dir.exists():
-                template_dir.mkdir(exist_ok=True)
-                self._create_default_templates(template_dir)
-        
-        self.jinja_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(template_dir)),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
-        )
-    
-    def generate_report(self, format_type, evidence_manager=None, system_info=None):
+        if TEMPLATE_DIR.exists():
+            template_dir = str(TEMPLATE_DIR)
+        else:
+            template_dir = _ensure_default_templates(str(DEFAULT_TEMPLATE_DIR))
+        
+        self.jinja_env = _get_jinja_environment(template_dir)
+    
+    @functools.cached_property
+    def _html_template(self):
+        """
+        Template HTML compilé, chargé une seule fois par générateur
+        
+        Returns:
+            jinja2.Template: Template du rapport
+        """
+        return self.jinja_env.get_template("report_template.html")
+    
+    def generate_report(self, format_type, evidence_manager=None, system_info=None, collect_fs_stats=True):
         """
         Génère un rapport selon le format spécifié
         
@@ -70,6 +282,8 @@ class ReportGenerator:
             format_type (str): Type de rapport ('html', 'pdf', 'json')
             evidence_manager (EvidenceManager, optional): Gestionnaire de preuves
             system_info (dict, optional): Informations système
+            collect_fs_stats (bool, optional): Inclure les statistiques de fichiers du répertoire
+                                               de preuves (parcours complet de l'arborescence)
             
         Returns:
             str: Chemin vers le rapport généré
@@ -78,7 +292,7 @@ class ReportGenerator:
         report_filename = f"forensic_report_{timestamp}"
         
         # Collecter les données pour le rapport
-        report_data = self._collect_report_data(evidence_manager, system_info)
+        report_data = self._collect_report_data(evidence_manager, system_info, collect_fs_stats)
         
         try:
             if format_type == 'html':
@@ -108,13 +322,14 @@ class ReportGenerator:
             logging.error(f"Erreur lors de la génération du rapport: {str(e)}")
             return None
     
-    def _collect_report_data(self, evidence_manager=None, system_info=None):
+    def _collect_report_data(self, evidence_manager=None, system_info=None, collect_fs_stats=True):
         """
         Collecte les données pour le rapport
         
         Args:
             evidence_manager (EvidenceManager, optional): Gestionnaire de preuves
             system_info (dict, optional): Informations système
+            collect_fs_stats (bool, optional): Inclure les statistiques de fichiers
             
         Returns:
             dict: Données collectées pour le rapport
@@ -144,18 +359,14 @@ class ReportGenerator:
             report_data["evidence_items"] = evidence_items
             
             # Résumé par type de module
-            module_counts = {}
-            for item in evidence_items:
-                module_type = item.get("type", "unknown")
-                if module_type not in module_counts:
-                    module_counts[module_type] = 0
-                module_counts[module_type] += 1
-            
-            report_data["modules_summary"] = module_counts
+            if hasattr(evidence_manager, "get_module_counts"):
+                report_data["modules_summary"] = evidence_manager.get_module_counts()
+            else:
+                report_data["modules_summary"] = dict(Counter(item.get("type", "unknown") for item in evidence_items))
         
         # Collecter des statistiques sur les types de fichiers
-        file_stats = self._collect_file_statistics()
-        report_data["file_statistics"] = file_stats
+        if collect_fs_stats:
+            report_data["file_statistics"] = self._collect_file_statistics()
         
         return report_data
     
@@ -163,6 +374,33 @@ class ReportGenerator:
         """
         Collecte des statistiques sur les types de fichiers
         
+        Les statistiques du parcours précédent sont réutilisées tant qu'aucun des
+        répertoires parcourus n'a changé de mtime (aucun fichier ni sous-répertoire
+        ajouté, supprimé ou renommé), par exemple pour générer plusieurs formats
+        de rapport à la suite. Le répertoire des rapports n'est pas surveillé : les
+        rapports écrits par ce générateur n'invalident pas les statistiques.
+        
+        Returns:
+            dict: Statistiques sur les types de fichiers
+        """
+        if self._fs_stats_cache is not None:
+            dir_mtimes, stats = self._fs_stats_cache
+            if all(_mtime_ns(directory) == mtime for directory, mtime in dir_mtimes.items()):
+                return stats
+        
+        dir_mtimes = {}
+        stats = self._scan_file_statistics(dir_mtimes)
+        dir_mtimes.pop(str(self.report_dir), None)
+        self._fs_stats_cache = (dir_mtimes, stats)
+        return stats
+    
+    def _scan_file_statistics(self, dir_mtimes):
+        """
+        Parcourt le répertoire des preuves et calcule les statistiques de fichiers
+        
+        Args:
+            dir_mtimes (dict): Complété avec le mtime (ns) de chaque répertoire parcouru
+            
         Returns:
             dict: Statistiques sur les types de fichiers
         """
@@ -173,48 +411,39 @@ class ReportGenerator:
             "directories": {}
         }
         
+        partials = [_new_scan_result()]
+        
         try:
-            # Parcourir le répertoire des preuves
-            for root, dirs, files in os.walk(self.evidence_dir):
-                rel_path = os.path.relpath(root, self.evidence_dir)
-                if rel_path == '.':
-                    rel_path = 'root'
-                
-                dir_stats = {
-                    "file_count": len(files),
-                    "total_size": 0
-                }
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        stats["total_size"] += file_size
-                        dir_stats["total_size"] += file_size
-                        stats["file_count"] += 1
-                        
-                        # Calculer les statistiques par extension
-                        ext = os.path.splitext(file)[1].lower()
-                        if not ext:
-                            ext = "no_extension"
-                        
-                        if ext not in stats["extensions"]:
-                            stats["extensions"][ext] = {
-                                "count": 0,
-                                "total_size": 0
-                            }
-                        
-                        stats["extensions"][ext]["count"] += 1
-                        stats["extensions"][ext]["total_size"] += file_size
-                    
-                    except Exception as e:
-                        logging.warning(f"Erreur lors de l'analyse du fichier {file_path}: {str(e)}")
-                
-                stats["directories"][rel_path] = dir_stats
+            subdirs = _scan_directory(str(self.evidence_dir), "root", partials[0])
+            
+            # Sous-arborescences de premier niveau parcourues en parallèle : le GIL est
+            # relâché pendant les appels système scandir/stat
+            if len(subdirs) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(subdirs), FILE_STATS_MAX_WORKERS)) as executor:
+                    partials.extend(executor.map(lambda subdir: _walk_subtree(*subdir), subdirs))
+            else:
+                partials.extend(_walk_subtree(*subdir) for subdir in subdirs)
         
         except Exception as e:
             logging.error(f"Erreur lors de la collecte des statistiques de fichiers: {str(e)}")
         
+        # Fusion dans l'ordre de parcours d'os.walk (racine, puis chaque sous-arborescence)
+        ext_counts = Counter()
+        ext_sizes = defaultdict(int)
+        for partial in partials:
+            stats["directories"].update(partial["directories"])
+            dir_mtimes.update(partial["dir_mtimes"])
+            ext_counts.update(partial["ext_counts"])
+            for ext, total_size in partial["ext_sizes"].items():
+                ext_sizes[ext] += total_size
+        
+        stats["total_size"] = sum(ext_sizes.values())
+        stats["file_count"] = sum(ext_counts.values())
+        stats["extensions"] = {
+            ext: {"count": ext_counts[ext], "total_size": total_size}
+            for ext, total_size in ext_sizes.items()
+        }
+        
         return stats
     
     def _generate_html_report(self, report_data, output_path):
@@ -229,17 +458,12 @@ class ReportGenerator:
             bool: True si la génération a réussi, False sinon
         """
         try:
-            template = self.jinja_env.get_template("report_template.html")
-            
-            # Formater les données pour le template
-            formatted_data = self._format_report_data(report_data)
-            
-            # Générer le HTML
-            html_content = template.render(**formatted_data)
-            
-            # Écrire le fichier HTML
+            # Générer le HTML et l'écrire au fil du rendu, par groupes de fragments,
+            # sans construire le document complet en mémoire
+            html_stream = self._html_template.stream(**self._format_report_data(report_data))
+            html_stream.enable_buffering(HTML_STREAM_BUFFER_SIZE)
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                html_stream.dump(f)
             
             # Copier les ressources CSS/JS si elles existent
             resources_dir = Path(__file__).parent.parent / "templates" / "resources"
@@ -247,8 +471,10 @@ class ReportGenerator:
                 output_resources = output_path.parent / "resources"
                 output_resources.mkdir(exist_ok=True)
                 
-                for resource in resources_dir.iterdir():
-                    shutil.copy(resource, output_resources)
+                with os.scandir(resources_dir) as entries:
+                    for resource in entries:
+                        if resource.is_file():
+                            _copy_resource(resource, output_resources / resource.name)
             
             return True
         
@@ -256,6 +482,21 @@ class ReportGenerator:
             logging.error(f"Erreur lors de la génération du rapport HTML: {str(e)}")
             return False
     
+    def _render_html(self, report_data):
+        """
+        Produit le HTML du rapport sous forme de chaîne (conversion PDF)
+        
+        Args:
+            report_data (dict): Données du rapport
+            
+        Returns:
+            str: Document HTML
+        """
+        # Formater les données pour le template
+        formatted_data = self._format_report_data(report_data)
+        
+        return self._html_template.render(**formatted_data)
+    
     def _generate_pdf_report(self, report_data, output_path):
         """
         Génère un rapport PDF
@@ -268,17 +509,10 @@ class ReportGenerator:
             bool: True si la génération a réussi, False sinon
         """
         try:
-            # Générer d'abord le HTML
-            temp_html = self.report_dir / "temp_report.html"
-            self._generate_html_report(report_data, temp_html)
-            
-            # Convertir le HTML en PDF
-            with open(temp_html, 'r', encoding='utf-8') as html_file:
-                with open(output_path, 'wb') as pdf_file:
-                    pisa.CreatePDF(html_file.read(), pdf_file)
-            
-            # Supprimer le fichier HTML temporaire
-            os.unlink(temp_html)
+            # Convertir directement le HTML rendu en PDF, sans fichier HTML intermédiaire
+            html_content = self._render_html(report_data)
+            with open(output_path, 'wb') as pdf_file:
+                pisa.CreatePDF(src=html_content, dest=pdf_file)
             
             return True
         
@@ -298,8 +532,8 @@ class ReportGenerator:
             bool: True si la génération a réussi, False sinon
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(serialization.dumps(report_data, indent=True))
             return True
         
         except Exception as e:
@@ -327,16 +561,19 @@ class ReportGenerator:
             except:
                 formatted["generated_at_human"] = formatted["generated_at"]
         
-        # Formater les tailles de fichiers pour être lisibles
+        # Formater les tailles de fichiers pour être lisibles, dans des copies : les
+        # statistiques brutes (mises en cache, rapport JSON) ne sont pas modifiées
         if "file_statistics" in formatted:
-            stats = formatted["file_statistics"]
+            stats = dict(formatted["file_statistics"])
             stats["total_size_human"] = self._format_file_size(stats["total_size"])
             
-            for ext, ext_stats in stats["extensions"].items():
-                ext_stats["total_size_human"] = self._format_file_size(ext_stats["total_size"])
+            for key in ("extensions", "directories"):
+                stats[key] = {
+                    name: {**entry_stats, "total_size_human": self._format_file_size(entry_stats["total_size"])}
+                    for name, entry_stats in stats[key].items()
+                }
             
-            for dir_name, dir_stats in stats["directories"].items():
-                dir_stats["total_size_human"] = self._format_file_size(dir_stats["total_size"])
+            formatted["file_statistics"] = stats
         
         return formatted
     
@@ -350,12 +587,15 @@ class ReportGenerator:
         Returns:
             str: Taille formatée (ex: "2.5 MB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024 or unit == 'TB':
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
+        if size_bytes <= 0:
+            return f"{0:.2f} {SIZE_UNITS[0]}"
+        
+        # Unité déduite du nombre de bits (log2 entier) : une division au lieu d'une boucle
+        unit_index = min(len(SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+        return f"{size_bytes / (1 << (10 * unit_index)):.2f} {SIZE_UNITS[unit_index]}"
     
-    def _create_default_templates(self, template_dir):
+    @staticmethod
+    def _create_default_templates(template_dir):
         """
         Crée les templates par défaut si aucun n'existe
         
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sérialisation JSON pour les données forensiques
+
+Ce module utilise orjson lorsqu'il est disponible et se replie
+sur le module json de la bibliothèque standard dans le cas contraire.
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj, indent=False):
+    """
+    Sérialise un objet en JSON
+    
+    Args:
+        obj: Objet à sérialiser
+        indent (bool, optional): Indenter le document sur deux espaces
+    
+    Returns:
+        bytes: Document JSON encodé en UTF-8
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    """
+    Désérialise un document JSON
+    
+    Args:
+        data (bytes or str): Document JSON
+    
+    Returns:
+        Objet Python correspondant au document
+    
+    Raises:
+        ValueError: Si le document n'est pas un JSON valide
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)